@@ -0,0 +1,211 @@
+// [PERF] 컬럼형 카탈로그(shards/catalog.json) 필터/정렬 + 카드 렌더링
+// 카드 DOM을 훑지 않고 배열에서 상품 번호를 고른 뒤, 화면에 보이는 페이지의 카드만 만듭니다.
+// 카드 마크업은 build_site.py의 create_product_card_html과 같게 유지해야 합니다.
+(function (root) {
+    // 이미지 없는 카드의 기본값 (catalog.json에 static_images.py가 만든 자리 이미지가 있으면 그쪽을 씀)
+    const PLACEHOLDER_IMAGE = 'assets/logo_placeholder.png';
+    const FALLBACK_IMAGE = 'https://raw.githubusercontent.com/juicepick/juicepick.github.io/master/assets/logo_placeholder.png';
+
+    function formatPrice(price) {
+        return String(price).replace(/\B(?=(\d{3})+(?!\d))/g, ',');
+    }
+
+    // 인라인 onclick 문자열 안에 넣는 값 (build_site.py safe_name/safe_link와 같은 처리)
+    function escapeAttr(value) {
+        return value.replace(/"/g, '&quot;').replace(/'/g, "\\'");
+    }
+
+    // build_site.py가 쓰는 thumbnails.thumb_srcset과 같은 값 ('thumbs/<id>-200.webp, thumbs/<id>-400.webp 2x')
+    function thumbSrcset(d, thumb, ext) {
+        const base = d.thumbSizes[0];
+        return d.thumbSizes.map(size => `${d.thumbDir}/${thumb}-${size}.${ext}` + (size === base ? '' : ` ${size / base}x`)).join(', ');
+    }
+
+    // build_site.py가 쓰는 thumbnails.placeholder_css와 같은 값 (색 격자 한 줄 = 가로 그라데이션 한 겹)
+    function placeholderCss(d, placeholder) {
+        const grid = d.placeholderGrid;
+        const colors = placeholder.match(/.{3}/g).map(color => '#' + color);
+        const rows = [];
+        for (let row = 0; row < grid; row++) {
+            const position = Math.floor(row * 100 / (grid - 1)) + '%';
+            rows.push(`linear-gradient(90deg,${colors.slice(row * grid, (row + 1) * grid).join(',')}) 0 ${position}/100% ${Math.floor(100 / grid) + 1}% no-repeat`);
+        }
+        return rows.join(',');
+    }
+
+    class CatalogData {
+        constructor(json) {
+            this.json = json;
+            this.size = json.key.length;
+            this.category = Uint8Array.from(json.category);
+            this.price = Int32Array.from(json.price);
+            this.views = Int32Array.from(json.views);
+            this.offerStart = Int32Array.from(json.offerStart);
+            this.keyIndex = new Map(json.key.map((key, i) => [key, i]));
+            this.searchNames = null; // 검색용 이름 (소문자, 공백 제거) - 첫 검색 때 만듦
+            // 빌드 때 계산한 정렬 모드별 순서 (price-asc는 행 순서 그대로)
+            this.order = {};
+            for (const sortType in json.order || {}) this.order[sortType] = Int32Array.from(json.order[sortType]);
+            this.viewsChanged = false; // 실시간 조회수가 바뀌면 조회수순은 직접 정렬
+        }
+
+        siteCount(i) {
+            return this.offerStart[i + 1] - this.offerStart[i];
+        }
+
+        // Firebase 스냅샷({key: {views}})의 조회수 반영
+        applyViews(snapshot) {
+            for (const key in snapshot) {
+                const i = this.keyIndex.get(key);
+                if (i !== undefined && snapshot[key] && snapshot[key].views !== undefined && this.views[i] !== snapshot[key].views) {
+                    this.views[i] = snapshot[key].views;
+                    this.viewsChanged = true;
+                }
+            }
+        }
+
+        // 조건에 맞는 상품 번호 (저장 순서 = 가격 낮은순 유지)
+        // 검색 색인(assets/search.js)을 주면 검색어는 색인으로 찾고, 없으면 상품명을 전부 확인
+        filter(category, query, favoriteKeys, searchIndex) {
+            const result = [];
+            if (favoriteKeys) {
+                // 즐겨찾기 보기는 카테고리/검색어와 무관
+                const wanted = new Set(favoriteKeys);
+                for (let i = 0; i < this.size; i++) {
+                    if (wanted.has(this.json.key[i])) result.push(i);
+                }
+                return result;
+            }
+            const cat = category === 'all' ? -1 : this.json.categories.indexOf(category);
+            if (category !== 'all' && cat < 0) return result;
+            if (query && searchIndex) {
+                for (const i of searchIndex.search(query)) {
+                    if (cat < 0 || this.category[i] === cat) result.push(i);
+                }
+                return result;
+            }
+            if (query && !this.searchNames) {
+                this.searchNames = this.json.name.map(name => name.toLowerCase().replace(/\s+/g, ''));
+            }
+            for (let i = 0; i < this.size; i++) {
+                if (cat >= 0 && this.category[i] !== cat) continue;
+                if (query && !this.searchNames[i].includes(query)) continue;
+                result.push(i);
+            }
+            return result;
+        }
+
+        // 기존 카드 정렬과 같은 기준. 같은 값이면 가격 낮은순 그대로 (안정 정렬)
+        // 빌드 때 만든 순서가 있으면 정렬 없이, 그 순서에서 걸러진 상품만 골라냄 (번호 교집합)
+        sort(indices, sortType) {
+            if (sortType === 'price-asc') return indices;
+            const order = this.order[sortType];
+            if (!order || (sortType === 'views' && this.viewsChanged)) return this.sortByValues(indices, sortType);
+            if (indices.length === this.size) return Array.from(order);
+            const picked = new Uint8Array(this.size);
+            for (const i of indices) picked[i] = 1;
+            const result = [];
+            for (let k = 0; k < order.length; k++) {
+                if (picked[order[k]]) result.push(order[k]);
+            }
+            return result;
+        }
+
+        sortByValues(indices, sortType) {
+            if (sortType === 'price-asc') {
+                const price = this.price;
+                return indices.sort((a, b) => price[a] - price[b]);
+            }
+            if (sortType === 'views') {
+                const views = this.views;
+                return indices.sort((a, b) => views[b] - views[a]);
+            }
+            if (sortType === 'name') {
+                const names = this.json.name;
+                const collator = new Intl.Collator('ko');
+                return indices.sort((a, b) => collator.compare(names[a], names[b]));
+            }
+            const start = this.offerStart;
+            return indices.sort((a, b) => (start[b + 1] - start[b]) - (start[a + 1] - start[a]));
+        }
+
+        // 판매처 링크가 없으면 사이트 검색 URL로 대신함
+        offerLink(offer, name) {
+            const link = this.json.offerLink[offer];
+            if (link) return link;
+            const base = this.json.searchUrls[this.json.offerSite[offer]];
+            return base ? base + encodeURIComponent(name) : '';
+        }
+
+        cardHtml(i) {
+            const d = this.json;
+            const key = d.key[i];
+            const name = d.name[i];
+            const category = d.categories[this.category[i]];
+            const start = this.offerStart[i];
+            const end = this.offerStart[i + 1];
+            const views = this.views[i];
+
+            let shops = '';
+            for (let offer = start; offer < end; offer++) {
+                shops += `
+            <div class='shop-row'>
+                <span>${d.siteNames[d.offerSite[offer]]}</span>
+                <a href='${this.offerLink(offer, name)}' target='_blank' class='price-link' onclick="updateViews('${key}')">${formatPrice(d.offerPrice[offer])}원</a>
+            </div>
+        `;
+            }
+            const singleLink = end - start === 1 ? escapeAttr(this.offerLink(start, name)) : '';
+            // 썸네일이 있으면 WebP(<source>) / JPEG(<img>) 1x, 2x, 이미지가 없으면 자리 이미지 AVIF/WebP
+            const thumb = d.thumb ? d.thumb[i] : '';
+            const placeholderSources = d.placeholderSources || [];
+            const hasImage = d.image[i] && d.image[i] !== PLACEHOLDER_IMAGE;
+            let imgSrc = hasImage ? d.image[i] : (d.placeholderImage || PLACEHOLDER_IMAGE);
+            let imgSrcset = '', pictureStart = '', pictureEnd = '';
+            if (thumb) {
+                imgSrc = `${d.thumbDir}/${thumb}-${d.thumbSizes[0]}.jpg`;
+                imgSrcset = ` srcset="${thumbSrcset(d, thumb, 'jpg')}"`;
+                pictureStart = `<picture><source type="image/webp" srcset="${thumbSrcset(d, thumb, 'webp')}">`;
+                pictureEnd = '</picture>';
+            } else if (!hasImage && placeholderSources.length) {
+                pictureStart = '<picture>' + placeholderSources.map(([type, url]) => `<source type="${type}" srcset="${url}">`).join('');
+                pictureEnd = '</picture>';
+            }
+            // 이미지가 오기 전에 보이는 흐린 색 격자 (main.css .card-image::before)
+            const placeholder = d.placeholder ? d.placeholder[i] : '';
+            const imageStyle = placeholder ? ` style="--lqip: ${placeholderCss(d, placeholder)}"` : '';
+
+            return `
+    <div class="product-card" data-category="${category}" data-price="${this.price[i]}" data-views="${views}" data-sitecount="${end - start}" data-key="${key}" style="position: relative;">
+
+        <div class="card-image"${imageStyle}>
+            ${pictureStart}<img src="${imgSrc}"${imgSrcset} loading="lazy" alt="${name}"
+                 onload="this.classList.add('loaded')"
+                 onerror="this.onerror=null; this.src='${d.fallbackImage || FALLBACK_IMAGE}'; this.classList.add('loaded');">${pictureEnd}
+            <span class="category-tag ${category}">${category}</span>
+            <button class="fav-btn" onclick="toggleFavorite('${key}', this)" aria-label="즐겨찾기">
+                <i class="far fa-heart"></i>
+            </button>
+        </div>
+        <div class="card-info">
+            <h3 class="product-title">${name}</h3>
+            <div class="price-section">
+                <span class="label">최저가</span>
+                <span class="price-val">${formatPrice(this.price[i])}원</span>
+            </div>
+            <button class="buy-btn" onclick="toggleShopList(this, '${key}', '${singleLink}')">최저가 확인하기</button>
+            <div class="shop-list">
+                ${shops}
+            </div>
+            <div class="views-count">
+                <i class="fas fa-eye"></i> 조회 수: <span class="v-val">${views}</span>회
+            </div>
+        </div>
+    </div>
+    `;
+        }
+    }
+
+    root.CatalogData = CatalogData;
+    if (typeof module !== 'undefined' && module.exports) module.exports = { CatalogData };
+})(typeof window !== 'undefined' ? window : globalThis);
@@ -1,100 +1,157 @@
-// 검색 기능 분리 (로딩 안정성 확보 및 전역 변수 접근 수정)
-console.log("🚀 Search module loaded.");
-
-window.initSearch = function () {
-    const btn = document.querySelector(".search-btn");
-    const input = document.getElementById("mainSearch");
+// [PERF] 빌드 때 만든 검색 색인(shards/search.json)으로 검색
+// 상품명/별칭의 2글자 조각(bigram) 목록을 교집합해 후보를 좁힌 뒤, 실제 문자열로 한 번 더 확인합니다.
+// - 일반 검색: 소문자 + 공백 제거한 상품명/별칭(영문 브랜드, 예전 상품명)에 검색어가 들어 있는 상품
+// - 초성 검색: 검색어에 ㄱ~ㅎ가 있으면 초성 문자열에서 찾음 (예: ㄴㅅㅌ -> 네스티)
+// - 오타 허용: 결과가 없고 검색어가 3글자 이상이면 한 글자만 다른 상품 (예: 네스트 -> 네스티)
+// 결과는 catalog.json 행 번호(오름차순)입니다.
+(function (root) {
+    const CHOSUNG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ';
+    const ALIAS_SEPARATOR = '\x01';
+    const CHOSUNG_QUERY_RE = /[ㄱ-ㅎ]/;
+
+    function normalizeQuery(text) {
+        return text.toLowerCase().replace(/\s+/g, '');
+    }
 
-    console.log("🔍 Initializing search...", { btn, input });
+    function toChosung(text) {
+        let out = '';
+        for (let k = 0; k < text.length; k++) {
+            const code = text.charCodeAt(k);
+            out += (code >= 0xAC00 && code <= 0xD7A3) ? CHOSUNG[Math.floor((code - 0xAC00) / 588)] : text[k];
+        }
+        return out;
+    }
 
-    if (btn) {
-        btn.onclick = function (e) {
-            e.preventDefault();
-            console.log("🖱️ Search button clicked");
-            window.applyFilters();
-        };
+    function bigrams(text) {
+        const chars = Array.from(text);
+        const grams = new Set();
+        for (let k = 0; k + 1 < chars.length; k++) grams.add(chars[k] + chars[k + 1]);
+        return Array.from(grams);
     }
 
-    if (input) {
-        input.onkeyup = function (e) {
-            if (e.key === 'Enter') {
-                console.log("⌨️ Enter key pressed");
-                window.applyFilters();
+    // 정렬된 두 번호 배열의 교집합
+    function intersect(a, b) {
+        const out = [];
+        let i = 0, j = 0;
+        while (i < a.length && j < b.length) {
+            if (a[i] === b[j]) {
+                out.push(a[i]);
+                i++;
+                j++;
+            } else if (a[i] < b[j]) {
+                i++;
+            } else {
+                j++;
             }
-        };
+        }
+        return out;
     }
-};
-
-window.applyFilters = function () {
-    console.log("🔎 applyFilters called");
 
-    // 데이터 로딩 체크 (window.allCards 사용)
-    if (!window.allCards || window.allCards.length === 0) {
-        // 혹시 모르니 다시 한번 가져와 본다
-        const grid = document.getElementById('productGrid');
-        if (grid && grid.children.length > 0) {
-            window.allCards = Array.from(grid.children);
-            window.filteredCards = [...window.allCards];
-            console.log("♻️ allCards recovered from DOM");
-        } else {
-            alert('데이터 시스템 로딩 중입니다. 1~2초 후 다시 시도해주세요.');
-            return;
+    // text 안에 query와 길이가 같고 한 글자까지만 다른 부분이 있는지
+    function hasNearMatch(text, query) {
+        const n = query.length;
+        for (let start = 0; start + n <= text.length; start++) {
+            let diff = 0;
+            for (let k = 0; k < n && diff <= 1; k++) {
+                if (text.charCodeAt(start + k) !== query.charCodeAt(k)) diff++;
+            }
+            if (diff <= 1) return true;
         }
+        return false;
     }
 
-    try {
-        const input = document.getElementById('mainSearch');
-        if (!input) return;
-
-        const rawQuery = input.value;
-        const query = rawQuery.toLowerCase().replace(/\s+/g, '');
-
-        const spinner = document.getElementById('loading-spinner');
-        if (spinner) spinner.style.display = 'flex';
-
-        setTimeout(() => {
-            // window.allCards 및 window.currentCategory 사용
-            window.filteredCards = window.allCards.filter(card => {
-                const currentCat = (typeof window.currentCategory !== 'undefined') ? window.currentCategory : 'all';
-                const catMatch = (currentCat === 'all') || (card.dataset.category === currentCat);
-
-                const titleEl = card.querySelector('.product-title');
-                if (!titleEl) return false;
+    class SearchIndex {
+        // json: search.json, names: catalog.json의 name 배열 (같은 행 순서)
+        constructor(json, names) {
+            this.json = json;
+            this.names = names;
+            this.size = names.length;
+            this.postings = new Map(); // 'g:조각' / 'c:조각' -> Int32Array (처음 쓸 때 풀어둠)
+            this.texts = null;
+            this.chosungTexts = null;
+        }
 
-                const title = titleEl.innerText.toLowerCase().split(' ').join('');
-                const searchMatch = title.includes(query);
+        getTexts() {
+            if (!this.texts) {
+                const aliases = this.json.alias;
+                this.texts = this.names.map((name, i) => {
+                    const text = normalizeQuery(name);
+                    return aliases[i] ? text + ALIAS_SEPARATOR + aliases[i] : text;
+                });
+            }
+            return this.texts;
+        }
 
-                return catMatch && searchMatch;
-            });
+        getChosungTexts() {
+            if (!this.chosungTexts) this.chosungTexts = this.getTexts().map(toChosung);
+            return this.chosungTexts;
+        }
 
-            // window.sortData 호출 (전역 함수)
-            if (typeof window.sortData === 'function') {
-                window.sortData(false);
-            } else {
-                console.error("❌ sortData function not found!");
+        // 조각 하나의 행 번호 목록 (저장된 간격을 누적해서 복원)
+        rows(table, gram) {
+            const cacheKey = table + ':' + gram;
+            let rows = this.postings.get(cacheKey);
+            if (!rows) {
+                const deltas = (table === 'c' ? this.json.chosung : this.json.gram)[gram] || [];
+                rows = new Int32Array(deltas.length);
+                let row = 0;
+                for (let k = 0; k < deltas.length; k++) {
+                    row += deltas[k];
+                    rows[k] = row;
+                }
+                this.postings.set(cacheKey, rows);
             }
+            return rows;
+        }
 
-            if (spinner) spinner.style.display = 'none';
-
-            // 결과 알림
-            if (query.length > 0) {
-                alert(`검색 완료: ${window.filteredCards.length}개의 상품을 찾았습니다.`);
+        // 검색어 -> 행 번호 배열 (검색어가 비어 있으면 null = 전체)
+        search(rawQuery) {
+            const query = normalizeQuery(rawQuery);
+            if (!query) return null;
+            if (CHOSUNG_QUERY_RE.test(query)) {
+                return this.match('c', this.getChosungTexts(), toChosung(query));
             }
+            const rows = this.match('g', this.getTexts(), query);
+            if (rows.length || Array.from(query).length < 3) return rows;
+            return this.fuzzy(query);
+        }
 
-        }, 50);
+        match(table, texts, query) {
+            const grams = bigrams(query);
+            const result = [];
+            if (!grams.length) {
+                // 한 글자 검색어는 색인 없이 전체를 확인 (충분히 빠름)
+                for (let i = 0; i < this.size; i++) {
+                    if (texts[i].includes(query)) result.push(i);
+                }
+                return result;
+            }
+            const lists = grams.map(gram => this.rows(table, gram)).sort((a, b) => a.length - b.length);
+            let candidates = Array.from(lists[0]);
+            for (let k = 1; k < lists.length && candidates.length; k++) candidates = intersect(candidates, lists[k]);
+            for (const i of candidates) {
+                if (texts[i].includes(query)) result.push(i);
+            }
+            return result;
+        }
 
-    } catch (e) {
-        console.error("Search error:", e);
-        alert("검색 중 오류: " + e.message);
+        // 한 글자 틀린 검색어: 글자 하나가 바뀌면 조각은 최대 2개까지만 깨지므로 나머지 조각이 맞는 상품만 확인
+        fuzzy(query) {
+            const grams = bigrams(query);
+            const need = Math.max(1, grams.length - 2);
+            const hits = new Uint8Array(this.size);
+            const touched = [];
+            for (const gram of grams) {
+                for (const i of this.rows('g', gram)) {
+                    if (hits[i]++ === 0) touched.push(i);
+                }
+            }
+            const texts = this.getTexts();
+            const result = touched.filter(i => hits[i] >= need && hasNearMatch(texts[i], query));
+            return result.sort((a, b) => a - b);
+        }
     }
-};
-
-// DOMContentLoaded 시점에 초기화
-document.addEventListener("DOMContentLoaded", function () {
-    window.initSearch();
-});
 
-// dataReady 이벤트 수신 (build_site.py에서 발송)
-window.addEventListener('dataReady', function () {
-    console.log("✅ Data Ready Event Received! Products:", window.allCards ? window.allCards.length : 0);
-});
+    root.SearchIndex = SearchIndex;
+    if (typeof module !== 'undefined' && module.exports) module.exports = { SearchIndex };
+})(typeof window !== 'undefined' ? window : globalThis);
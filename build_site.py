@@ -7,6 +7,15 @@ import os
 import time
 import traceback
 import sys
+import hashlib
+import sqlite3
+import shutil
+import unicodedata
+from collections import OrderedDict, defaultdict
+from catalog import Catalog, SITE_KEYS
+import precompress
+import static_images
+import thumbnails
 
 # .env 파일 로드 함수 (외부 라이브러리 없이 구현)
 def load_env():
@@ -71,28 +80,140 @@ SITE_NAME_MAP = {
 # 브랜드 예외 처리 (분류 시 해당 단어 무시)
 BRAND_EXCEPTIONS = ["세븐코리아", "세븐데이즈", "세븐리퀴드", "세븐 포카리"]
 
+# [PERF] 정규화 엔진: 패턴은 모듈 로드 시 한 번만 컴파일해서 재사용
+_IMAGE_SUFFIX_RE = re.compile(r' - .*? 이미지$')
+# (패턴, 필수 문자열) - 필수 문자열이 없으면 sub 호출 자체를 건너뜀
+_JUNK_TEXT_RES = [
+    (re.compile(r'리뷰\s*\d+'), '리뷰'),
+    (re.compile(r'평점\s*\d+(\.\d+)?'), '평점'),
+    (re.compile(r'\(\d+\)'), '('),
+    (re.compile(r'하이민트|high\s*mint', re.IGNORECASE), None),
+    (re.compile(r'\d+(\.\d+)?\s*mg', re.IGNORECASE), None),
+    (re.compile(r'\d+(\.\d+)?\s*%', re.IGNORECASE), '%'),
+    (re.compile(r'(^|\s)\d+(\.\d+)?(\s|$)'), None),
+]
+_FLEX_RE = re.compile(r'flex\s*x', re.IGNORECASE)
+_FLEX_KO_RE = re.compile(r'플렉스\s*x', re.IGNORECASE)
+_VOLUME_RE = re.compile(r'(\d+)\s*ml', re.IGNORECASE)
+_VOLUME_SUB_RE = re.compile(r'\d+\s*ml', re.IGNORECASE)
+_BRACKET_RE = re.compile(r'[\[\(](.*?)[\]\)]')
+# 토큰 단위 re.sub 대신 문자열 전체에서 한 번에 제거 (공백은 남겨서 토큰 경계 유지)
+_NON_TOKEN_RE = re.compile(r'[^a-z0-9가-힣\s]')
+
+class KeywordMatcher:
+    """
+    여러 키워드를 하나의 정규식 오토마톤으로 묶어 문자열을 한 번만 훑습니다.
+    lookahead 방식이라 겹치는 위치의 키워드도 빠짐없이 찾습니다.
+    """
+    def __init__(self, words):
+        self.words = list(dict.fromkeys(w for w in words if w))
+        self.rank = {w: i for i, w in enumerate(self.words)}
+        # 같은 위치에서는 가장 긴 키워드만 잡히므로, 그 접두어인 키워드를 미리 계산해둠
+        self._prefixes = {w: [p for p in self.words if p != w and w.startswith(p)] for w in self.words}
+        # 첫 글자 문자 집합으로 먼저 걸러서, 키워드가 시작될 수 없는 위치는 건너뜀
+        first_chars = "".join(sorted({re.escape(w[0]) for w in self.words}))
+        self._pattern = re.compile(f"(?=[{first_chars}])(?=({self._trie_regex(self.words)}))") if self.words else None
+
+    @staticmethod
+    def _trie_regex(words):
+        """
+        키워드를 글자 트리로 묶은 정규식. 위치마다 키워드 수만큼 alternation을 시도하지 않고
+        글자를 따라 한 갈래만 내려가므로 키워드 목록이 커져도 속도가 거의 그대로입니다.
+        (자식 갈래를 먼저 시도하므로 같은 위치에서는 가장 긴 키워드가 잡힘)
+        """
+        trie = {}
+        for word in words:
+            node = trie
+            for ch in word: node = node.setdefault(ch, {})
+            node[''] = True
+
+        def build(node):
+            branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+            if not branches: return ''
+            body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+            return f"(?:{body})?" if '' in node else body
+
+        return build(trie)
+
+    def find_all(self, text):
+        """text에 등장하는 키워드 집합"""
+        found = set()
+        if self._pattern is None: return found
+        for m in self._pattern.finditer(text):
+            word = m.group(1)
+            if word not in found:
+                found.add(word)
+                found.update(self._prefixes[word])
+        return found
+
+    def in_order(self, found):
+        """원래 리스트 순서대로 정렬 (기존 순차 처리와 동일한 결과 보장)"""
+        return sorted(found, key=self.rank.__getitem__)
+
+    def first(self, text):
+        """리스트 순서상 가장 앞선 키워드 (없으면 None)"""
+        found = self.find_all(text)
+        return min(found, key=self.rank.__getitem__) if found else None
+
+class CategoryClassifier:
+    """
+    카테고리 키워드와 브랜드 예외를 하나의 매처로 묶어 상품명을 한 번만 훑습니다.
+    CATEGORIES 순서가 우선순위이고, 같은 카테고리 안에서는 리스트 앞쪽 키워드가 '발동' 키워드입니다.
+    """
+    def __init__(self, categories, exceptions, default="과일/멘솔"):
+        self.default = default
+        self.exceptions = list(exceptions)
+        self.exception_set = frozenset(self.exceptions)
+        # 키워드 -> (카테고리 순번, 리스트 순번, 카테고리). 예외 브랜드는 맨 뒤 순위에 카테고리 None
+        self.keyword_rank = {}
+        for cat_idx, (category, keywords) in enumerate(categories.items()):
+            for idx, keyword in enumerate(keywords):
+                self.keyword_rank.setdefault(keyword, (cat_idx, idx, category))
+        for idx, brand in enumerate(self.exceptions):
+            self.keyword_rank.setdefault(brand, (len(categories), idx, None))
+        self.matcher = KeywordMatcher(self.keyword_rank)
+
+    def _decide(self, text, found):
+        if not found: return self.default, None
+        # [FIX] 브랜드명으로 인한 오분류 방지 (예: 세븐코리아 -> 연초 오분류 방지)
+        # 예외 브랜드가 걸린 드문 경우만 기존과 같은 순서로 지우고 다시 검사 (지운 자리에 새 조합이 생길 수 있음)
+        if not self.exception_set.isdisjoint(found):
+            for brand in self.exceptions:
+                text = text.replace(brand, "")
+            found = self.matcher.find_all(text)
+            if not found: return self.default, None
+        keyword = min(found, key=self.keyword_rank.__getitem__)
+        category = self.keyword_rank[keyword][2]
+        if category is None: return self.default, None
+        return category, keyword
+
+    def explain(self, name):
+        """(카테고리, 발동한 키워드 또는 None)"""
+        text = name.lower()
+        return self._decide(text, self.matcher.find_all(text))
+
+    def classify(self, name):
+        return self.explain(name)[0]
+
+    def classify_all(self, names):
+        """여러 이름을 한 번에 분류 -> [(카테고리, 발동 키워드), ...]"""
+        explain = self.explain
+        return [explain(name) for name in names]
+
+    def classify_catalog(self, catalog):
+        """카탈로그 전체를 분류 -> {match_key: (카테고리, 발동 키워드)}"""
+        keys = list(catalog)
+        return dict(zip(keys, self.classify_all([catalog[k].display_name for k in keys])))
+
+CATEGORY_CLASSIFIER = CategoryClassifier(CATEGORIES, BRAND_EXCEPTIONS)
+
 def classify_category(name):
-    name_lower = name.lower()
-    
-    # [FIX] 브랜드명으로 인한 오분류 방지 (예: 세븐코리아 -> 연초 오분류 방지)
-    temp_name_for_check = name_lower
-    for brand in BRAND_EXCEPTIONS:
-        temp_name_for_check = temp_name_for_check.replace(brand, "")
-        
-    for k in CATEGORIES["연초"]:
-        if k in temp_name_for_check: return "연초"
-    for k in CATEGORIES["디저트"]:
-        if k in temp_name_for_check: return "디저트"
-    return "과일/멘솔"
+    return CATEGORY_CLASSIFIER.classify(name)
 
 def clean_junk_text(text):
-    text = re.sub(r'리뷰\s*\d+', ' ', text)
-    text = re.sub(r'평점\s*\d+(\.\d+)?', ' ', text)
-    text = re.sub(r'\(\d+\)', ' ', text)
-    text = re.sub(r'하이민트|high\s*mint', ' ', text, flags=re.IGNORECASE)
-    text = re.sub(r'\d+(\.\d+)?\s*mg', ' ', text, flags=re.IGNORECASE)
-    text = re.sub(r'\d+(\.\d+)?\s*%', ' ', text, flags=re.IGNORECASE)
-    text = re.sub(r'(^|\s)\d+(\.\d+)?(\s|$)', ' ', text)
+    for pattern, required in _JUNK_TEXT_RES:
+        if required is None or required in text:
+            text = pattern.sub(' ', text)
     return text.strip()
 
 CUSTOM_ALIASES = {}
@@ -103,83 +224,91 @@ try:
 except FileNotFoundError:
     pass
 
+# 4. 주요 브랜드명 맨 앞으로 이동 (사용자 요청)
+# 추가하고 싶은 브랜드가 있으면 이 리스트에 넣으세요. (앞에 있을수록 우선)
+PRIORITY_BRANDS = [
+    "펠릭스", "이그니스", "네스티", "세븐코리아", "타이타닉", "동경", "슈퍼쿨", "잽쥬스", "알케마스터",
+    "테일러", "플렉스", "브이갓", "노보", "베라쥬스", "오르카", "오지구", "타노스", "와이키키"
+]
+
+JUNK_SET = frozenset(JUNK_WORDS)
+JUNK_MATCHER = KeywordMatcher(JUNK_WORDS)
+BRAND_MATCHER = KeywordMatcher(PRIORITY_BRANDS)
+
+def remove_junk_words(text, repl=' '):
+    """JUNK_WORDS 순차 replace와 같은 결과를, 실제로 등장한 단어만 골라 처리"""
+    found = JUNK_MATCHER.find_all(text)
+    if not found: return text
+    if repl:
+        # 공백으로 치환하면 새 조합이 생기지 않으므로 등장한 단어만 순서대로 지우면 충분
+        for junk in JUNK_MATCHER.in_order(found):
+            text = text.replace(junk, repl)
+        return text
+    # 빈 문자열 치환은 앞뒤가 붙어 새 불용어가 생길 수 있어 기존 방식 그대로 처리
+    for junk in JUNK_WORDS:
+        text = text.replace(junk, repl)
+    return text
+
+def resolve_alias(raw_name):
+    raw_name = _IMAGE_SUFFIX_RE.sub('', raw_name)
+    return CUSTOM_ALIASES.get(raw_name, raw_name)
+
 def normalize_product(raw_name):
-    raw_name = re.sub(r' - .*? 이미지$', '', raw_name)
-    if raw_name in CUSTOM_ALIASES:
-        raw_name = CUSTOM_ALIASES[raw_name]
+    raw_name = resolve_alias(raw_name)
     temp_name = raw_name.lower()
     
     event_suffix = ""
     if "1+1" in temp_name: event_suffix = " (1+1)"
     elif "2+1" in temp_name: event_suffix = " (2+1)"
     elif "3+1" in temp_name: event_suffix = " (3+1)"
-    temp_name = temp_name.replace("1+1", "").replace("2+1", "").replace("3+1", "")
+    if event_suffix:
+        temp_name = temp_name.replace("1+1", "").replace("2+1", "").replace("3+1", "")
     temp_name = clean_junk_text(temp_name)
     
-    temp_name = re.sub(r'flex\s*x', 'flex', temp_name, flags=re.IGNORECASE)
-    temp_name = re.sub(r'플렉스\s*x', '플렉스', temp_name, flags=re.IGNORECASE)
-    temp_name = temp_name.replace("더블 슬로우 블로우", "더블슬로우블로우").replace("더블 블로우 슬로우", "더블슬로우블로우")
-    temp_name = temp_name.replace("슬로우 블로우", "슬로우블로우").replace("블로우 슬로우", "슬로우블로우")
+    temp_name = _FLEX_RE.sub('flex', temp_name)
+    temp_name = _FLEX_KO_RE.sub('플렉스', temp_name)
+    if "슬로우" in temp_name:
+        temp_name = temp_name.replace("더블 슬로우 블로우", "더블슬로우블로우").replace("더블 블로우 슬로우", "더블슬로우블로우")
+        temp_name = temp_name.replace("슬로우 블로우", "슬로우블로우").replace("블로우 슬로우", "슬로우블로우")
 
     volume = "30ml"
-    vol_match = re.search(r'(\d+)\s*ml', temp_name, re.IGNORECASE)
+    vol_match = _VOLUME_RE.search(temp_name)
     if vol_match:
         volume = vol_match.group(1) + "ml"
-        temp_name = re.sub(r'\d+\s*ml', ' ', temp_name, flags=re.IGNORECASE)
+        temp_name = _VOLUME_SUB_RE.sub(' ', temp_name)
     
     extracted_brand = ""
-    bracket_match = re.search(r'[\[\(](.*?)[\]\)]', temp_name)
+    bracket_match = _BRACKET_RE.search(temp_name)
     if bracket_match:
         extracted_brand = bracket_match.group(1).strip()
-        temp_name = re.sub(r'[\[\(].*?[\]\)]', ' ', temp_name)
+        temp_name = _BRACKET_RE.sub(' ', temp_name)
         
-    for junk in JUNK_WORDS:
-        temp_name = temp_name.replace(junk, ' ')
-    
-    tokens = temp_name.split()
+    temp_name = remove_junk_words(temp_name)
+    tokens = _NON_TOKEN_RE.sub('', temp_name).split()
     if extracted_brand:
-        for junk in JUNK_WORDS: extracted_brand = extracted_brand.replace(junk, '')
-        tokens = extracted_brand.split() + tokens
+        extracted_brand = remove_junk_words(extracted_brand, '')
+        tokens = _NON_TOKEN_RE.sub('', extracted_brand).split() + tokens
 
     final_tokens = []
     seen = set()
     for t in tokens:
-        t_clean = re.sub(r'[^a-z0-9가-힣]', '', t)
-        if not t_clean: continue
-        t_mapped = WORD_MAP.get(t_clean, t_clean)
+        t_mapped = WORD_MAP.get(t, t)
         for sub_t in t_mapped.split():
-            if sub_t in JUNK_WORDS or sub_t == '0': continue
+            if sub_t in JUNK_SET or sub_t == '0': continue
             if sub_t not in seen:
                 seen.add(sub_t)
                 final_tokens.append(sub_t)
 
     final_tokens.sort()
     clean_name = " ".join(final_tokens)
-    clean_name = clean_name.replace("더블슬로우블로우", "더블 슬로우 블로우").replace("슬로우블로우", "슬로우 블로우")
+    if "슬로우블로우" in clean_name:
+        clean_name = clean_name.replace("더블슬로우블로우", "더블 슬로우 블로우").replace("슬로우블로우", "슬로우 블로우")
     category = classify_category(clean_name)
-    match_key = "".join(final_tokens) + volume + event_suffix.strip()
-    
-    if len(clean_name) < 2: display_name = raw_name
-    else: display_name = f"{clean_name} {volume}{event_suffix}"
-
-    # 4. 주요 브랜드명 맨 앞으로 이동 (사용자 요청)
-    # 추가하고 싶은 브랜드가 있으면 이 리스트에 넣으세요.
-    priority_brands = [
-        "펠릭스", "이그니스", "네스티", "세븐코리아", "타이타닉", "동경", "슈퍼쿨", "잽쥬스", "알케마스터",
-        "테일러", "플렉스", "브이갓", "노보", "베라쥬스", "오르카", "오지구", "타노스", "와이키키"
-    ]
-    
-    for brand in priority_brands:
-        if brand in clean_name:
-            # 브랜드가 이름 중간에 있으면 제거하고 맨 앞에 붙임
-            # 단, 이미 맨 앞에 있으면 무시 (startswith 체크)
-            if not clean_name.startswith(brand):
-                # 기존 브랜드명 제거 (공백 정리 포함)
-                temp_name = clean_name.replace(brand, "").strip()
-                # 맨 앞에 브랜드명 부착
-                clean_name = f"{brand} {temp_name}"
-            # 한 번 브랜드를 찾아서 처리했으면 루프 종료 (중복 브랜드 처리 방지)
-            break
+
+    # 브랜드가 이름 중간에 있으면 제거하고 맨 앞에 붙임 (리스트 순서상 첫 브랜드 하나만)
+    brand = BRAND_MATCHER.first(clean_name)
+    if brand and not clean_name.startswith(brand):
+        clean_name = f"{brand} {clean_name.replace(brand, '').strip()}"
             
     # 정규화된 이름 생성
     display_name = f"{clean_name} {volume}{event_suffix}"
@@ -191,103 +320,557 @@ def normalize_product(raw_name):
         "display_name": display_name
     }
 
-def process_data():
-    print("[INFO] Fetching Firebase Data...")
+# [PERF] 정규화 결과 캐시 (메모리 LRU + SQLite 디스크)
+# 규칙 테이블이나 정규화 코드가 바뀌면 버전 해시가 달라져 디스크 캐시가 자동으로 비워집니다.
+NORMALIZE_ENGINE_VERSION = 1  # normalize_product 로직을 고치면 올려주세요
+NORMALIZE_CACHE_PATH = os.environ.get("NORMALIZE_CACHE_PATH", ".cache/normalize_cache.sqlite")
+NORMALIZE_CACHE_SIZE = int(os.environ.get("NORMALIZE_CACHE_SIZE", "20000"))
+
+def normalize_rules_version():
+    rules = {
+        "engine": NORMALIZE_ENGINE_VERSION, "aliases": CUSTOM_ALIASES, "word_map": WORD_MAP,
+        "junk": JUNK_WORDS, "categories": CATEGORIES, "brands": PRIORITY_BRANDS,
+        "brand_exceptions": BRAND_EXCEPTIONS
+    }
+    payload = json.dumps(rules, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+class NormalizeCache:
+    """
+    raw_name -> normalize_product 결과 캐시.
+    반환되는 dict는 여러 호출이 공유하므로 읽기 전용으로 사용하세요.
+    """
+    def __init__(self, path=NORMALIZE_CACHE_PATH, maxsize=NORMALIZE_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.memory = OrderedDict()
+        self.pending = {}
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.version = normalize_rules_version()
+        self.conn = None
+        if path:
+            try:
+                self.conn = self._open(path)
+            except sqlite3.Error as e:
+                print(f"[WARN] Normalize cache disabled: {e}")
+                self.conn = None
+
+    def _open(self, path):
+        folder = os.path.dirname(path)
+        if folder: os.makedirs(folder, exist_ok=True)
+        conn = sqlite3.connect(path)
+        conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        conn.execute("CREATE TABLE IF NOT EXISTS normalized (raw_name TEXT PRIMARY KEY, result TEXT)")
+        row = conn.execute("SELECT value FROM meta WHERE key = 'rules_version'").fetchone()
+        if not row or row[0] != self.version:
+            # 규칙이 바뀌었으므로 이전 결과는 모두 무효
+            conn.execute("DELETE FROM normalized")
+            conn.execute("INSERT OR REPLACE INTO meta VALUES ('rules_version', ?)", (self.version,))
+            conn.commit()
+        return conn
+
+    def _remember(self, raw_name, result):
+        self.memory[raw_name] = result
+        if len(self.memory) > self.maxsize:
+            self.memory.popitem(last=False)
+
+    def lookup(self, raw_name):
+        """캐시에 있으면 결과, 없으면 None (정규화는 하지 않음)"""
+        result = self.memory.get(raw_name)
+        if result is not None:
+            self.memory.move_to_end(raw_name)
+            self.memory_hits += 1
+            return result
+
+        # LRU에서 밀려났지만 아직 디스크에 쓰지 않은 결과
+        result = self.pending.get(raw_name)
+        if result is not None:
+            self.memory_hits += 1
+            self._remember(raw_name, result)
+            return result
+
+        if self.conn is not None:
+            row = self.conn.execute("SELECT result FROM normalized WHERE raw_name = ?", (raw_name,)).fetchone()
+            if row:
+                result = json.loads(row[0])
+                self.disk_hits += 1
+                self._remember(raw_name, result)
+                return result
+        return None
+
+    def store(self, raw_name, result):
+        self.misses += 1
+        self.pending[raw_name] = result
+        self._remember(raw_name, result)
+
+    def normalize(self, raw_name):
+        result = self.lookup(raw_name)
+        if result is None:
+            result = normalize_product(raw_name)
+            self.store(raw_name, result)
+        return result
+
+    def normalize_many(self, raw_names, workers=None, chunk_size=None):
+        """
+        여러 이름을 한 번에 정규화해 {raw_name: 결과} 로 돌려줍니다.
+        캐시에 없는 이름만 normalize_batch 로 넘기므로, 양이 많으면 여러 코어를 씁니다.
+        """
+        results = {}
+        missing = []
+        for raw_name in raw_names:
+            if raw_name in results: continue
+            result = self.lookup(raw_name)
+            if result is None:
+                results[raw_name] = None
+                missing.append(raw_name)
+            else:
+                results[raw_name] = result
+        for raw_name, result in zip(missing, normalize_batch(missing, workers, chunk_size)):
+            self.store(raw_name, result)
+            results[raw_name] = result
+        return results
+
+    def flush(self):
+        if self.conn is None or not self.pending: return
+        rows = [(k, json.dumps(v, ensure_ascii=False)) for k, v in self.pending.items()]
+        self.conn.executemany("INSERT OR REPLACE INTO normalized VALUES (?, ?)", rows)
+        self.conn.commit()
+        self.pending.clear()
+
+    def close(self):
+        self.flush()
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+    def report(self):
+        total = self.memory_hits + self.disk_hits + self.misses
+        rate = (self.memory_hits + self.disk_hits) / total * 100 if total else 0
+        print(f"[CACHE] Normalize: {total} lookups | memory hit {self.memory_hits} | disk hit {self.disk_hits} | miss {self.misses} ({rate:.1f}% hit)")
+
+# [PERF] 멀티코어 정규화 설정 (워커 0 = CPU 수만큼, 1 = 직렬)
+NORMALIZE_WORKERS = int(os.environ.get("NORMALIZE_WORKERS", "0"))
+NORMALIZE_CHUNK_SIZE = int(os.environ.get("NORMALIZE_CHUNK_SIZE", "1000"))
+# 이보다 적으면 프로세스 풀 기동 비용이 더 커서 직렬로 처리
+NORMALIZE_PARALLEL_MIN = int(os.environ.get("NORMALIZE_PARALLEL_MIN", "5000"))
+
+def _normalize_chunk(raw_names):
+    """워커 프로세스용: 부모로 보낼 값만 튜플로 압축"""
+    results = []
+    for raw_name in raw_names:
+        norm = normalize_product(raw_name)
+        results.append((norm['match_key'], norm['display_name'], norm['category'], norm['volume']))
+    return results
+
+def normalize_batch(raw_names, workers=None, chunk_size=None):
+    """
+    raw_names 순서 그대로 normalize_product 결과 목록을 돌려줍니다.
+    청크 단위로 프로세스 풀에 나눠 처리하며, 결과 순서는 워커 스케줄링과 무관합니다.
+    """
+    workers = NORMALIZE_WORKERS if workers is None else workers
+    chunk_size = chunk_size or NORMALIZE_CHUNK_SIZE
+    if workers <= 0: workers = os.cpu_count() or 1
+    if workers <= 1 or len(raw_names) < NORMALIZE_PARALLEL_MIN:
+        return [normalize_product(raw_name) for raw_name in raw_names]
+
+    from concurrent.futures import ProcessPoolExecutor
+    chunks = [raw_names[i:i + chunk_size] for i in range(0, len(raw_names), chunk_size)]
+    print(f"[INFO] Normalizing {len(raw_names)} names with {workers} workers ({len(chunks)} chunks)")
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # map은 제출 순서대로 결과를 돌려주므로 출력이 항상 같음
+        for chunk, packed in zip(chunks, pool.map(_normalize_chunk, chunks)):
+            for raw_name, (match_key, display_name, category, volume) in zip(chunk, packed):
+                results.append({
+                    "original": resolve_alias(raw_name), "category": category,
+                    "volume": volume, "match_key": match_key,
+                    "display_name": display_name
+                })
+    return results
+
+NORMALIZE_CACHE = None
+
+def get_normalize_cache():
+    global NORMALIZE_CACHE
+    if NORMALIZE_CACHE is None:
+        NORMALIZE_CACHE = NormalizeCache()
+    return NORMALIZE_CACHE
+
+SITES = list(SITE_KEYS)
+
+# [수정] 모든 상품명에서 불필요한 문구 제거
+REMOVED_WORDS = ['전자담배', '액상', '제품', '이미지']
+_ML_TAIL_RE = re.compile(r'(\d+\s*[mM][lL]).*$')
+_SPACES_RE = re.compile(r'\s+')
+_NON_DIGIT_RE = re.compile(r'[^\d]')
+MAX_PRICE = 10_000_000  # 이 이상은 잘못 파싱된 가격으로 봄
+
+# [PERF] 증분 병합 상태 (이전 병합 결과 + 사이트별 상품 지문)
+MERGE_STATE_PATH = os.environ.get("MERGE_STATE_PATH", ".cache/merge_state.json")
+MERGE_STATE_VERSION = 2  # 병합 로직을 고치면 올려주세요 (2: MAX_PRICE 이상 가격 제외)
+
+def clean_display_name(name):
+    for word in REMOVED_WORDS:
+        name = name.replace(word, '')
+    # ml 뒤의 모든 문자도 제거
+    name = _ML_TAIL_RE.sub(r'\1', name)
+    # 중복 공백 정리
+    return _SPACES_RE.sub(' ', name).strip()
+
+def parse_price(raw_price):
+    # [FIX] 가격 데이터 정제: 문자열일 경우 쉼표 제거 후 정수로 변환
+    # 가격 여러 개가 붙은 문자열("12,000원 → 9,900원")은 숫자가 이어져 터무니없이 커지므로 MAX_PRICE 이상은 0 (판매처 제외)
     try:
-        ref = db.reference('products')
-        all_data = ref.get()
-    except Exception as e:
-        return {}, []
-    
-    if not all_data: return {}, []
+        if isinstance(raw_price, str):
+            price = int(_NON_DIGIT_RE.sub('', raw_price))
+        else:
+            price = int(raw_price)
+    except (ValueError, TypeError, OverflowError):
+        return 0
+    return price if price < MAX_PRICE else 0
+
+def listing_fields(item_val):
+    name = item_val.get('name', '')
+    img = item_val.get('img') or item_val.get('image') or item_val.get('thumb') or ""
+    link = item_val.get('link') or item_val.get('url') or ''
+    return name, item_val.get('price', 0), img, link
+
+def listing_fingerprint(item_val):
+    """병합에 쓰이는 필드만으로 만든 지문 (last_update 등은 제외)"""
+    payload = json.dumps(listing_fields(item_val), ensure_ascii=False)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=8).hexdigest()
+
+def prepare_listing(item_val):
+    """병합 대상이면 (raw_name, price, link, image), 아니면 None"""
+    raw_name, raw_price, img, link = listing_fields(item_val)
+    price = parse_price(raw_price)
+    if not raw_name or price <= 0: return None
+    if img:
+        if img.startswith("//"): img = "https:" + img
+        # [FILTER] 아이콘/버튼 이미지 제외
+        if "icon" in img.lower() or "btn" in img.lower():
+            img = ""
+    return raw_name, price, link, img
+
+def make_record(listing, norm):
+    """병합용 레코드: [match_key, display_name, category, volume, price, link, image]"""
+    _, price, link, img = listing
+    return [norm['match_key'], norm['display_name'], norm['category'], norm['volume'], price, link, img]
+
+def build_merged_entry(records):
+    """
+    같은 match_key로 묶인 (site, record) 목록(사이트/상품 순서 유지)으로 병합 항목을 만듭니다.
+    이름/카테고리는 첫 상품 기준, 사이트별 최저가, 이미지는 처음 나온 유효 이미지.
+    """
+    _, display_name, category, volume, _, _, _ = records[0][1]
+    entry = {
+        "display_name": clean_display_name(display_name), "category": category,
+        "volume": volume, "image": "", "prices": {}, "views": 0
+    }
+    prices = entry["prices"]
+    for site, record in records:
+        price, link, img = record[4], record[5], record[6]
+        current_site_price = prices.get(site, {}).get("price", 999999)
+        if price < current_site_price:
+            prices[site] = { "price": price, "link": link }
+        if not entry["image"] and img:
+            entry["image"] = img
+    return entry
+
+def load_merge_state(path=MERGE_STATE_PATH):
+    if not path or not os.path.exists(path): return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            state = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"[WARN] Merge state ignored: {e}")
+        return None
+    if state.get("version") != merge_state_version():
+        print("[INFO] Merge rules changed (normalize/price). Full rebuild.")
+        return None
+    return state
+
+def save_merge_state(state, path=MERGE_STATE_PATH):
+    if not path: return
+    folder = os.path.dirname(path)
+    if folder: os.makedirs(folder, exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp_path, path)
+
+def merge_state_version():
+    # 가격 규칙(MAX_PRICE)도 넣음: 상품 지문은 원본 가격 문자열만 보므로 규칙이 바뀌어도 옛 병합 결과가 재사용됨
+    return f"{MERGE_STATE_VERSION}:{normalize_rules_version()}:max_price={MAX_PRICE}"
+
+def iter_tree_pages(all_data, sites=SITES):
+    """이미 메모리에 있는 products 트리를 (site, page) 스트림으로 변환"""
+    for site in sites:
+        yield site, all_data.get(site) or {}
 
-    sites = ['modu', 'juice24', 'tjf', 'siasiu', 'vapemonster', 'juice99', 'juicebox', 'vape9', 'juice23']
-    merged_data = {}
-    merged_data = {}
-    print("[INFO] Normalizing & Merging Data...")
-    
+def views_from_tree(all_data, sites=SITES):
+    views = {}
+    for key, node in all_data.items():
+        if key not in sites and isinstance(node, dict):
+            views[key] = node.get('views', 0)
+    return views
+
+def merge_products(pages, views, sites=SITES, state=None, norm_cache=None):
+    """
+    (site, page) 스트림을 match_key 단위로 병합합니다.
+    pages는 사이트별 상품 dict 조각을 순서대로 내보내는 iterable이며, 처리된 조각은 바로 버려집니다.
+    views는 match_key -> 조회수 dict로, pages를 모두 소비한 뒤에 읽습니다.
+    state(이전 빌드의 병합 상태)가 있으면 추가/변경/삭제된 상품만 다시 정규화하고,
+    영향받은 match_key만 다시 계산합니다. state가 없으면 전체 재빌드.
+    반환: (merged_data, new_state)
+    """
+    if norm_cache is None: norm_cache = get_normalize_cache()
+    prev_listings = state["listings"] if state else {}
+    prev_merged = state["merged"] if state else {}
+
+    # 1) 상품 지문 비교 -> 바뀐 상품만 모아뒀다가 한 번에 정규화
+    listings = {site: {} for site in sites}
+    pending = []
+    affected = set()
+    added = changed = removed = unchanged = 0
+    for site, page in pages:
+        if site not in listings: continue
+        prev_site = prev_listings.get(site, {})
+        site_listings = listings[site]
+        for item_key, item_val in page.items():
+            if not isinstance(item_val, dict): continue
+            fp = listing_fingerprint(item_val)
+            prev = prev_site.get(item_key)
+            if prev is not None and prev[0] == fp:
+                site_listings[item_key] = prev
+                unchanged += 1
+                continue
+            # 자리만 잡아두고(상품 순서 유지) 레코드는 아래에서 채움
+            slot = site_listings[item_key] = [fp, None]
+            pending.append((slot, prepare_listing(item_val)))
+            if prev is None:
+                added += 1
+            else:
+                changed += 1
+                if prev[1]: affected.add(prev[1][0])
     for site in sites:
-        site_data = all_data.get(site, {})
-        if site == 'vape9':
-            print(f"[DEBUG] vape9 데이터 개수: {len(site_data)}")
-            vape9_added = 0
-        if site == 'juice23':
-            print(f"[DEBUG] juice23 데이터 개수: {len(site_data)}")
-            juice23_added = 0
-        for item_key, item_val in site_data.items():
-            raw_name = item_val.get('name', '')
-            raw_name = item_val.get('name', '')
-            
-            # [FIX] 가격 데이터 정제: 문자열일 경우 쉼표 제거 후 정수로 변환
-            raw_price = item_val.get('price', 0)
-            try:
-                if isinstance(raw_price, str):
-                    price = int(re.sub(r'[^\d]', '', raw_price))
-                else:
-                    price = int(raw_price)
-            except (ValueError, TypeError):
-                price = 0
-
-            img = item_val.get('img') or item_val.get('image') or item_val.get('thumb') or ""
-            link = item_val.get('link') or item_val.get('url') or ''
-
-            if not raw_name or price <= 0: continue
-            if img:
-                if img.startswith("//"): img = "https:" + img
-                # [FILTER] 아이콘/버튼 이미지 제외
-                if "icon" in img.lower() or "btn" in img.lower():
-                    img = ""
-
-            norm = normalize_product(raw_name)
-            m_key = norm['match_key']
-
-            if m_key not in merged_data:
-                # [수정] Firebase의 제품별 views 노드에서 조회수를 가져옴
-                global_item = all_data.get(m_key, {})
-                views = global_item.get('views', 0) if isinstance(global_item, dict) else 0
-                
-                merged_data[m_key] = {
-                    "display_name": norm['display_name'], "category": norm['category'],
-                    "volume": norm['volume'], "image": img, "prices": {}, "views": views 
-                }
-            
-            # [수정] 모든 상품명에서 불필요한 문구 제거
-            REMOVED_WORDS = ['전자담배', '액상', '제품', '이미지']
-            import re as regex
-            cleaned_display = merged_data[m_key]["display_name"]
-            for word in REMOVED_WORDS:
-                cleaned_display = cleaned_display.replace(word, '')
-            # ml 뒤의 모든 문자도 제거
-            cleaned_display = regex.sub(r'(\d+\s*[mM][lL]).*$', r'\1', cleaned_display)
-            # 중복 공백 정리
-            cleaned_display = regex.sub(r'\s+', ' ', cleaned_display).strip()
-            merged_data[m_key]["display_name"] = cleaned_display
-            
-            current_site_price = merged_data[m_key]["prices"].get(site, {}).get("price", 999999)
-            if price < current_site_price:
-                merged_data[m_key]["prices"][site] = { "price": price, "link": link }
-                if site == 'vape9':
-                    vape9_added += 1
-                if site == 'juice23':
-                    juice23_added += 1
-            
-            if not merged_data[m_key]["image"] and img:
-                merged_data[m_key]["image"] = img
-        
-        if site == 'vape9':
-            print(f"[DEBUG] vape9 상품 추가 완료: {vape9_added}개 상품이 prices에 추가됨")
-        if site == 'juice23':
-            print(f"[DEBUG] juice23 상품 추가 완료: {juice23_added}개 상품이 prices에 추가됨")
-    
+        site_listings = listings[site]
+        for item_key, prev in prev_listings.get(site, {}).items():
+            if item_key not in site_listings:
+                removed += 1
+                if prev[1]: affected.add(prev[1][0])
+        print(f"[INFO] {site}: {len(site_listings)} listings")
+
+    norms = norm_cache.normalize_many([listing[0] for _, listing in pending if listing])
+    for slot, listing in pending:
+        if not listing: continue
+        slot[1] = make_record(listing, norms[listing[0]])
+        affected.add(slot[1][0])
+    norm_cache.flush()
+
+    # 2) 상품 순서대로 match_key 순서를 정하고, 다시 계산할 key의 레코드만 모음
+    key_order = {}
+    key_records = {}
+    for site in sites:
+        for fp, record in listings[site].values():
+            if not record: continue
+            m_key = record[0]
+            if m_key not in key_order:
+                key_order[m_key] = None
+                if m_key in affected or m_key not in prev_merged:
+                    key_records[m_key] = []
+            if m_key in key_records:
+                key_records[m_key].append((site, record))
+
+    # 3) 영향받은 key만 재계산, 나머지는 이전 결과 재사용
+    base_merged = {}
+    for m_key in key_order:
+        if m_key in key_records:
+            base_merged[m_key] = build_merged_entry(key_records[m_key])
+        else:
+            base_merged[m_key] = prev_merged[m_key]
+
+    if state:
+        print(f"[INFO] Incremental merge: +{added} ~{changed} -{removed} ={unchanged} | {len(key_records)}/{len(base_merged)} keys recomputed")
+    else:
+        print(f"[INFO] Full merge: {added} listings -> {len(base_merged)} keys")
+
+    # 조회수는 매 빌드 Firebase의 제품별 views 노드에서 새로 가져옴
+    merged_data = {}
+    for m_key, base in base_merged.items():
+        entry = dict(base)
+        entry["views"] = views.get(m_key, 0)
+        merged_data[m_key] = entry
+
+    new_state = {"version": merge_state_version(), "listings": listings, "merged": base_merged}
+    return merged_data, new_state
+
+def apply_thumbnails(catalog, out_dir=".", fetcher=None, store=None):
+    """상품 이미지를 받아 썸네일을 만들고 (thumbnails.py) 카드가 쓰도록 product.thumb / placeholder 를 채움"""
+    if thumbnails.Image is None:
+        print("[INFO] Pillow not installed: cards keep original image URLs (pip install pillow)")
+        return
+    store = store or thumbnails.ThumbnailStore()
+    thumb_ids = store.update((product.image for product in catalog.values()), fetcher=fetcher)
+    for product in catalog.values():
+        product.thumb = thumb_ids.get(product.image, "")
+        product.placeholder = store.placeholders.get(product.thumb, "") if product.thumb else ""
+    store.publish(thumb_ids.values(), out_dir)
+    store.report()
+
+# 정적 이미지 (static_images.py)가 만든 파일의 URL. apply_static_images가 카드 캐시/리포트 생성 전에 채움 (비어 있으면 원본 경로)
+STATIC_IMAGE_URLS = {}
+SITE_URL = "https://juicepick.github.io"
+CARD_PLACEHOLDER_IMAGE = "assets/logo_placeholder.png"
+CARD_FALLBACK_IMAGE = "https://raw.githubusercontent.com/juicepick/juicepick.github.io/master/assets/logo_placeholder.png"
+
+def apply_static_images(root="."):
+    """favicon/카드 자리 이미지/OG 이미지를 쓰는 크기로 만들고 (static_images.py) 페이지와 카드가 그 URL을 쓰게 함"""
+    if static_images.Image is None:
+        print("[INFO] Pillow not installed: static images are served as-is (pip install pillow)")
+        return
+    urls, results = static_images.optimize_static_images(root)
+    STATIC_IMAGE_URLS.clear()
+    STATIC_IMAGE_URLS.update(urls)
+    static_images.report(results)
+
+def card_placeholder_images():
+    """이미지 없는 카드: (img src, <picture> 후보 [(type, URL)], 이미지를 못 받았을 때 onerror가 쓸 URL)"""
+    src = STATIC_IMAGE_URLS.get("logo_placeholder-card.png")
+    if src is None: return CARD_PLACEHOLDER_IMAGE, [], CARD_FALLBACK_IMAGE
+    sources = [(f"image/{ext}", STATIC_IMAGE_URLS[f"logo_placeholder-card.{ext}"]) for ext in ("avif", "webp")
+               if f"logo_placeholder-card.{ext}" in STATIC_IMAGE_URLS]
+    return src, sources, src
+
+def apply_additional_images(catalog):
     try:
         with open("additional_images.json", "r", encoding="utf-8") as f:
             additional_images = json.load(f)
             for m_key, img_url in additional_images.items():
-                if m_key in merged_data:
-                     merged_data[m_key]['image'] = img_url
+                if m_key in catalog:
+                     catalog[m_key].image = img_url
     except FileNotFoundError: pass
 
-    return merged_data, sites
+# [PERF] products 트리를 한 번에 받지 않고 사이트별로 나눠서 페이지 단위로 가져옴
+FIREBASE_PAGE_SIZE = int(os.environ.get("FIREBASE_PAGE_SIZE", "500"))
+
+def firebase_key_order(key):
+    """Firebase orderByKey 정렬: 32비트 정수로 읽히는 키가 먼저(숫자순), 나머지는 문자열순"""
+    if key.lstrip('-').isdigit() and -2**31 <= int(key) < 2**31:
+        return (0, int(key), "")
+    return (1, 0, key)
+
+def peak_rss_mb():
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+class FirebaseProductStream:
+    """
+    products/{site} 를 order_by_key + limit_to_first 로 페이지 단위 조회해 (site, page)를 내보냅니다.
+    사이트 목록을 다 돌고 나면 제품별 views 노드를 모아 self.views 를 채웁니다.
+    조회 중 난 오류는 self.error 에 남깁니다 (병합/정규화 쪽 오류와 구분하려고)
+    """
+    def __init__(self, root='products', sites=SITES, page_size=FIREBASE_PAGE_SIZE):
+        self.root = db.reference(root)
+        self.sites = sites
+        self.page_size = page_size
+        self.views = {}
+        self.top_keys = []
+        self.pages = 0
+        self.items = 0
+        self.started_at = None
+        self.first_page_at = None
+        self.error = None
+
+    def __iter__(self):
+        # 받는 쪽(병합)에서 난 예외는 이 제너레이터를 거치지 않으므로 여기서 잡히는 것은 조회 오류뿐
+        try:
+            yield from self._pages()
+        except Exception as e:
+            self.error = e
+            raise
+
+    def _pages(self):
+        self.started_at = time.time()
+        # shallow=True: 하위 데이터 없이 최상위 키 목록만 받음
+        self.top_keys = list((self.root.get(shallow=True) or {}).keys())
+        for site in self.sites:
+            if site not in self.top_keys: continue
+            for page in self.iter_site_pages(site):
+                if self.first_page_at is None: self.first_page_at = time.time()
+                self.pages += 1
+                self.items += len(page)
+                yield site, page
+        self.fetch_views()
+
+    def iter_site_pages(self, site):
+        ref = self.root.child(site)
+        last_key = None
+        while True:
+            query = ref.order_by_key()
+            if last_key is None:
+                page = query.limit_to_first(self.page_size).get() or {}
+            else:
+                # start_at은 경계 키를 포함하므로 하나 더 받아서 첫 항목을 버림
+                page = query.start_at(last_key).limit_to_first(self.page_size + 1).get() or {}
+                page.pop(last_key, None)
+            if not page: return
+            last_key = next(reversed(page))
+            yield page
+            if len(page) < self.page_size: return
+
+    def fetch_views(self):
+        # 사이트 키를 건너뛰도록, 사이트 키가 끼지 않는 연속 구간 단위로 조회
+        ranges, current = [], []
+        for key in sorted(self.top_keys, key=firebase_key_order):
+            if key in self.sites or len(current) >= self.page_size:
+                if current: ranges.append(current)
+                current = []
+            if key not in self.sites:
+                current.append(key)
+        if current: ranges.append(current)
+
+        for keys in ranges:
+            nodes = self.root.order_by_key().start_at(keys[0]).end_at(keys[-1]).get() or {}
+            for key, node in nodes.items():
+                if key not in self.sites and isinstance(node, dict):
+                    self.views[key] = node.get('views', 0)
+
+    def report(self):
+        total = time.time() - self.started_at
+        first = self.first_page_at - self.started_at if self.first_page_at else total
+        rss = peak_rss_mb()
+        rss_text = f"{rss:.1f}MB" if rss is not None else "n/a"
+        print(f"[FETCH] {self.items} listings in {self.pages} pages | first page merged after {first:.2f}s | total {total:.2f}s | peak RSS {rss_text}")
+
+def process_data(full_rebuild=False):
+    print("[INFO] Fetching Firebase Data (streaming)...")
+    print("[INFO] Normalizing & Merging Data...")
+    state = None if full_rebuild else load_merge_state()
+    stream = FirebaseProductStream()
+    try:
+        merged_data, new_state = merge_products(stream, stream.views, SITES, state)
+    except Exception as e:
+        if e is not stream.error: raise  # 정규화/캐시/병합 버그는 빈 사이트로 덮지 않고 빌드 실패로
+        print(f"[ERROR] Firebase fetch failed: {e}")
+        return {}, []
+    stream.report()
+
+    if not merged_data: return {}, []
+    try:
+        save_merge_state(new_state)
+    except OSError as e:
+        print(f"[WARN] Merge state not saved: {e}")
+
+    # 병합 상태(JSON)는 dict로 두고, 리포트/도구에는 슬롯 기반 카탈로그로 넘김
+    catalog = Catalog.from_merged(merged_data)
+    apply_additional_images(catalog)
+    return catalog, SITES
 
 SEARCH_URLS = {
     'modu': "https://xn--hu1b83j3sfk9e3xc.kr/product/search.html?keyword=",
@@ -302,59 +885,70 @@ SEARCH_URLS = {
 
 def create_product_card_html(key, item, site_name_map, search_urls, rank=0):
     import urllib.parse
-    sorted_shops = sorted(item['prices'].items(), key=lambda x: x[1]['price'])
-    min_price = 999999
-    shops_html = ""
+    sorted_shops = item.sorted_offers()
+    min_price = item.min_price
+    shop_rows = []
     
-    for s_key, p_info in sorted_shops:
-        p = p_info['price']
-        l = p_info['link']
+    for s_key, p, l in sorted_shops:
         if not l:
-            query = urllib.parse.quote(item['display_name'])
+            query = urllib.parse.quote(item.display_name)
             base = search_urls.get(s_key, "")
             if base: l = f"{base}{query}"
         
-        if p < min_price: min_price = p
-        
         site_display_name = site_name_map.get(s_key, s_key.upper())
-        shops_html += f"""
+        shop_rows.append(f"""
             <div class='shop-row'>
                 <span>{site_display_name}</span>
                 <a href='{l}' target='_blank' class='price-link' onclick="updateViews('{key}')">{format(p, ',')}원</a>
             </div>
-        """
+        """)
+    shops_html = "".join(shop_rows)
     
     single_link = ""
     if len(sorted_shops) == 1:
-        s_key_1, p_info_1 = sorted_shops[0]
-        single_link = p_info_1['link']
+        s_key_1, _, single_link = sorted_shops[0]
         if not single_link:
-             q = urllib.parse.quote(item['display_name'])
+             q = urllib.parse.quote(item.display_name)
              b = search_urls.get(s_key_1, "")
              if b: single_link = f"{b}{q}"
     
-    safe_name = item['display_name'].replace('"', '&quot;').replace("'", "\\'")
+    safe_name = item.display_name.replace('"', '&quot;').replace("'", "\\'")
     safe_link = single_link.replace('"', '&quot;').replace("'", "\\'")
     
-    site_count = len(item['prices'])
-    img_src = item['image'] if item['image'] else "assets/logo_placeholder.png"
+    site_count = item.site_count
+    placeholder_src, placeholder_sources, fallback_src = card_placeholder_images()
+    has_image = item.image and item.image != CARD_PLACEHOLDER_IMAGE
+    img_src = item.image if has_image else placeholder_src
+    # 썸네일이 있으면 WebP(<source>) / JPEG(<img>) 1x, 2x, 이미지가 없으면 자리 이미지 AVIF/WebP
+    picture_start = picture_end = img_srcset = image_style = ""
+    if item.thumb:
+        img_src = thumbnails.thumb_path(item.thumb, thumbnails.THUMB_SIZES[0], "jpg")
+        img_srcset = f' srcset="{thumbnails.thumb_srcset(item.thumb, "jpg")}"'
+        picture_start = f'<picture><source type="image/webp" srcset="{thumbnails.thumb_srcset(item.thumb, "webp")}">'
+        picture_end = "</picture>"
+    elif not has_image and placeholder_sources:
+        picture_start = "<picture>" + "".join(f'<source type="{kind}" srcset="{url}">' for kind, url in placeholder_sources)
+        picture_end = "</picture>"
+    # 이미지가 오기 전에 보이는 흐린 색 격자 (main.css .card-image::before)
+    if item.placeholder:
+        image_style = f' style="--lqip: {thumbnails.placeholder_css(item.placeholder)}"'
     
     rank_badge = f'<div style="padding: 5px 10px; background: var(--primary); color: white; font-weight: bold; position: absolute; top: 0; left: 0; z-index: 10;">👑 추천 {rank}위</div>' if rank > 0 else ""
     
     return f"""
-    <div class="product-card" data-category="{item['category']}" data-price="{int(min_price)}" data-views="{item.get('views', 0)}" data-sitecount="{site_count}" data-key="{key}" style="position: relative;">
+    <div class="product-card" data-category="{item.category}" data-price="{int(min_price)}" data-views="{item.views}" data-sitecount="{site_count}" data-key="{key}" style="position: relative;">
         {rank_badge}
-        <div class="card-image">
-            <img src="{img_src}" loading="lazy" alt="{item['display_name']}" 
+        <div class="card-image"{image_style}>
+            {picture_start}<img src="{img_src}"{img_srcset} loading="lazy" alt="{item.display_name}" 
                  onload="this.classList.add('loaded')"
-                 onerror="this.onerror=null; this.src='https://raw.githubusercontent.com/juicepick/juicepick.github.io/master/assets/logo_placeholder.png'; this.classList.add('loaded');">
-            <span class="category-tag {item['category']}">{item['category']}</span>
+                 onerror="this.onerror=null; this.src='{fallback_src}'; this.classList.add('loaded');">{picture_end}
+            <span class="category-tag {item.category}">{item.category}</span>
             <button class="fav-btn" onclick="toggleFavorite('{key}', this)" aria-label="즐겨찾기">
                 <i class="far fa-heart"></i>
             </button>
         </div>
         <div class="card-info">
-            <h3 class="product-title">{item['display_name']}</h3>
+            <h3 class="product-title">{item.display_name}</h3>
             <div class="price-section">
                 <span class="label">최저가</span>
                 <span class="price-val">{format(min_price, ',')}원</span>
@@ -364,40 +958,525 @@ def create_product_card_html(key, item, site_name_map, search_urls, rank=0):
                 {shops_html}
             </div>
             <div class="views-count">
-                <i class="fas fa-eye"></i> 조회 수: <span class="v-val">{item.get('views', 0)}</span>회
+                <i class="fas fa-eye"></i> 조회 수: <span class="v-val">{item.views}</span>회
             </div>
         </div>
     </div>
     """
 
-def generate_report(data, sites):
-    print("[INFO] Generating HTML Report...")
-    grid_items_html = ""
-    
-    # 기본 정렬: 판매처 많은 순 (내림차순)
-    sorted_items = sorted(data.items(), key=lambda x: (len(x[1]['prices'])), reverse=True)
-    
-    for key, item in sorted_items:
-        grid_items_html += create_product_card_html(key, item, SITE_NAME_MAP, SEARCH_URLS)
+# [PERF] 카드 렌더링 캐시. 카드에 영향을 주는 입력 지문이 같으면 이전 빌드의 HTML을 그대로 씀
+# 카드 HTML은 한 파일(.pack)에 이어 붙이고, 위치는 인덱스(.index.json)에 기록합니다.
+# 카드 템플릿(create_product_card_html과 썸네일 경로/자리표시 CSS 함수 소스, 썸네일 크기/폴더, 자리표시 격자)이나 사이트 표시명/검색 URL이 바뀌면 자동으로 비워집니다.
+CARD_CACHE_PATH = os.environ.get("CARD_CACHE_PATH", ".cache/cards")
+
+def _function_source(func):
+    import inspect
+    try:
+        return inspect.getsource(func)
+    except (OSError, TypeError):  # 소스 파일을 못 읽는 환경
+        return func.__code__.co_code.hex() + repr(func.__code__.co_consts)
+
+def card_template_version():
+    # 썸네일 크기/경로 형식이 바뀌면 publish()가 지운 옛 thumbs/ 파일을 가리키는 카드가 남지 않게,
+    # --lqip 형식(placeholder_css, PLACEHOLDER_GRID)이 바뀌면 옛 자리표시 CSS가 남지 않게 함께 넣음
+    payload = json.dumps({"source": _function_source(create_product_card_html), "site_names": SITE_NAME_MAP,
+                          "search_urls": SEARCH_URLS, "placeholder": card_placeholder_images(),
+                          "thumb_sizes": list(thumbnails.THUMB_SIZES), "thumb_dir": thumbnails.THUMB_DIR,
+                          "thumb_source": [_function_source(thumbnails.thumb_path), _function_source(thumbnails.thumb_srcset)],
+                          "lqip_grid": thumbnails.PLACEHOLDER_GRID, "lqip_source": _function_source(thumbnails.placeholder_css)},
+                         ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+def card_fingerprint(key, item, rank=0):
+    """카드 HTML을 결정하는 입력(이름, 카테고리, 이미지/썸네일/자리표시, 판매처별 가격/링크, 조회수, 순위)만으로 만든 지문"""
+    # 판매처 순서/가격/링크는 Product 배열을 그대로 씀 (가격순 정렬 결과는 이 값들로 결정됨)
+    fields = [key, item.display_name, item.category, item.image or "", item.thumb, item.placeholder, str(item.views), str(rank),
+              item.site_ids.hex(), item.prices.tobytes().hex(), *item.links]
+    return hashlib.blake2b("\x1f".join(fields).encode("utf-8"), digest_size=16).hexdigest()
+
+class CardCache:
+    """
+    (match_key, rank) -> 렌더링된 카드 HTML(UTF-8 바이트). 지문이 달라진 카드만 다시 렌더링합니다.
+    다시 렌더링한 카드는 pack 끝에 덧붙이고, 재사용한 카드는 pack에서 바이트 그대로 꺼내 씁니다.
+    이번 빌드에서 안 쓰인 카드가 pack의 절반을 넘으면 save() 때 쓰는 카드만 남기고 다시 씁니다.
+    save()가 불리기 전에는 인덱스가 바뀌지 않으므로 실패한 빌드는 이전 캐시를 그대로 둡니다.
+    """
+    def __init__(self, path=CARD_CACHE_PATH):
+        self.reused = 0
+        self.rendered = 0
+        self.version = card_template_version()
+        self.index = {}
+        self.new_index = {}
+        self.pack = None
+        self.out = None
+        self.index_path = path + ".index.json" if path else None
+        self.pack_path = path + ".pack" if path else None
+        if path:
+            try:
+                self._open()
+            except (OSError, ValueError) as e:
+                print(f"[WARN] Card cache disabled: {e}")
+                self._close_files()
+                self.index_path = self.pack_path = None
+
+    def _open(self):
+        import mmap
+        folder = os.path.dirname(self.pack_path)
+        if folder: os.makedirs(folder, exist_ok=True)
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                saved = json.load(f)
+        except FileNotFoundError:
+            saved = {}
+        size = os.path.getsize(self.pack_path) if os.path.exists(self.pack_path) else 0
+        if saved.get("version") == self.version and size and size >= saved.get("size", size + 1):
+            self.index = saved.get("cards", {})
+            with open(self.pack_path, "rb") as f:
+                self.pack = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self.out = open(self.pack_path, "ab")
+        else:
+            # 템플릿이 바뀌었거나 pack이 인덱스와 안 맞으면 처음부터
+            self.out = open(self.pack_path, "wb")
+        self.offset = self.out.tell()
+
+    def render(self, key, item, rank=0):
+        fingerprint = card_fingerprint(key, item, rank)
+        slot = f"{key}\t{rank}"
+        entry = self.index.get(slot)
+        if entry is not None and entry[0] == fingerprint and self.pack is not None:
+            self.reused += 1
+            self.new_index[slot] = entry
+            return self.pack[entry[1]:entry[1] + entry[2]]
+        data = create_product_card_html(key, item, SITE_NAME_MAP, SEARCH_URLS, rank=rank).encode("utf-8")
+        self.rendered += 1
+        if self.out is not None:
+            self.out.write(data)
+            self.new_index[slot] = [fingerprint, self.offset, len(data)]
+            self.offset += len(data)
+        return data
+
+    def _close_files(self):
+        if self.pack is not None:
+            self.pack.close()
+            self.pack = None
+        if self.out is not None:
+            self.out.close()
+            self.out = None
+
+    def _compact(self):
+        """이번 빌드에서 쓰인 카드만 새 pack으로 옮김"""
+        tmp_path = self.pack_path + ".tmp"
+        offset = 0
+        with open(self.pack_path, "rb") as src, open(tmp_path, "wb") as dst:
+            for entry in sorted(self.new_index.values(), key=lambda e: e[1]):
+                src.seek(entry[1])
+                dst.write(src.read(entry[2]))
+                entry[1] = offset
+                offset += entry[2]
+        os.replace(tmp_path, self.pack_path)
+
+    def save(self):
+        """이번 빌드의 카드 목록으로 인덱스 교체 (리포트를 끝까지 쓴 뒤에 호출)"""
+        if self.out is None: return
+        self._close_files()
+        live = sum(entry[2] for entry in self.new_index.values())
+        if os.path.getsize(self.pack_path) > live * 2:
+            self._compact()
+        tmp_path = self.index_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"version": self.version, "size": os.path.getsize(self.pack_path),
+                                "cards": self.new_index}, ensure_ascii=False))
+        os.replace(tmp_path, self.index_path)
+
+    def close(self):
+        self._close_files()
+
+    def report(self):
+        total = self.reused + self.rendered
+        print(f"[CACHE] Cards: {total} | reused {self.reused} | re-rendered {self.rendered}")
+
+CARD_CACHE = None
+
+def get_card_cache():
+    global CARD_CACHE
+    if CARD_CACHE is None:
+        CARD_CACHE = CardCache()
+    return CARD_CACHE
+
+# [PERF] 상품 카드를 카테고리/페이지 단위 조각 파일(shards/<slug>/<page>.html)로 나눠 씀
+# index.html에는 '전체' 1페이지만 들어가고, 나머지 페이지는 브라우저가 필요할 때 받아갑니다.
+SHARD_DIR = "shards"
+SHARD_PAGE_SIZE = 40  # 클라이언트 itemsPerPage
+SHARD_CATALOG_FILE = "catalog.json"
+SHARD_SEARCH_FILE = "search.json"
+SHARD_SLUGS = {"all": "all", "과일/멘솔": "fruit", "연초": "tobacco", "디저트": "dessert"}
+
+def shard_slug(category):
+    """조각 폴더 이름 (URL에 한글/슬래시가 들어가지 않도록)"""
+    return SHARD_SLUGS.get(category) or "cat-" + hashlib.blake2b(category.encode("utf-8"), digest_size=4).hexdigest()
+
+def default_card_order(data):
+    """클라이언트 기본 정렬(가격 낮은순)과 같은 순서. 같은 가격이면 판매처 많은 순 (JS 정렬도 안정 정렬)"""
+    return sorted(data.by_site_count(), key=lambda item: int(item.min_price))
+
+# [PERF] 이름순 정렬 키: 브라우저 Intl.Collator('ko')(ICU 한국어 정렬)를 흉내냄
+# 공백/기호 < 숫자 < 한글 < 한자 < 라틴 문자 < 기타 순이고, 한글은 자모(초성 < 중성 < 종성) 단위로 비교합니다.
+# 대소문자는 1차 비교에서 무시하고, 1차가 같을 때 소문자가 먼저 옵니다.
+_HANGUL_BASE, _HANGUL_END = 0xAC00, 0xD7A3
+
+def _char_sort_weights(ch):
+    """글자 하나의 ([(그룹, 그룹 안 순서), ...], [대문자 여부, ...])"""
+    code = ord(ch)
+    if _HANGUL_BASE <= code <= _HANGUL_END:
+        lead, rest = divmod(code - _HANGUL_BASE, 588)
+        vowel, tail = divmod(rest, 28)
+        return [(2, lead), (2, 100 + vowel)] + ([(2, 200 + tail)] if tail else []), []
+    primary = []
+    tertiary = []
+    # 호환 자모(ㄱ)/악센트 문자(É)는 분해해서 기본 글자로 비교 (결합 부호는 1차 비교에서 무시)
+    for part in unicodedata.normalize("NFKD", ch) if code > 0x7F else ch:
+        code = ord(part)
+        if 0x1100 <= code <= 0x1112:
+            primary.append((2, code - 0x1100))
+        elif 0x1161 <= code <= 0x1175:
+            primary.append((2, 100 + code - 0x1161))
+        elif 0x11A8 <= code <= 0x11C2:
+            primary.append((2, 200 + code - 0x11A7))
+        elif part.isdigit():
+            primary.append((1, unicodedata.digit(part, 0)))
+        elif part.isalpha() and part.isascii():
+            primary.append((4, ord(part.lower())))
+            tertiary.append(part.isupper())
+        elif unicodedata.category(part) == "Mn":
+            continue
+        elif unicodedata.category(part)[0] in "ZPSC":
+            primary.append((0, code))
+        elif 0x4E00 <= code <= 0x9FFF:
+            primary.append((3, code))
+        else:
+            primary.append((5, ord(part.lower())))
+    return primary, tertiary
+
+class _SortKeyTable(dict):
+    """
+    str.translate용 글자 -> 가중치 문자열 표 (처음 보는 글자만 계산).
+    가중치 하나는 (그룹, 순서) 두 글자라 문자열끼리 비교하면 가중치 순서로 비교됩니다.
+    """
+    def __init__(self, tertiary):
+        super().__init__()
+        self.tertiary = tertiary
+
+    def __missing__(self, code):
+        primary, tertiary = _char_sort_weights(chr(code))
+        if self.tertiary:
+            value = "".join("1" if upper else "0" for upper in tertiary)
+        else:
+            value = "".join(chr(group) + chr(order) for group, order in primary)
+        self[code] = value
+        return value
+
+_PRIMARY_SORT_TABLE = _SortKeyTable(tertiary=False)
+_TERTIARY_SORT_TABLE = _SortKeyTable(tertiary=True)
+
+def korean_sort_key(text):
+    return text.translate(_PRIMARY_SORT_TABLE), text.translate(_TERTIARY_SORT_TABLE)
 
-    # [NEW] 추천 시스템 로직 (사진 있고 조회수 높고 판매처 많은 순)
+def catalog_sort_orders(items):
+    """
+    UI 정렬 모드별 상품 순서(행 번호 배열). 행 순서가 가격 낮은순이라 price-asc는 따로 싣지 않고,
+    나머지는 기존 클라이언트 정렬처럼 안정 정렬(같은 값이면 가격 낮은순)입니다.
+    """
+    rows = range(len(items))
+    primary = [item.display_name.translate(_PRIMARY_SORT_TABLE) for item in items]
+    by_name = sorted(rows, key=primary.__getitem__)
+    # 1차 가중치가 같은 이름(대소문자만 다른 경우 등)끼리만 전체 키로 다시 정렬
+    start = 0
+    for end in range(1, len(by_name) + 1):
+        if end == len(by_name) or primary[by_name[end]] != primary[by_name[start]]:
+            if end - start > 1:
+                by_name[start:end] = sorted(by_name[start:end], key=lambda i: korean_sort_key(items[i].display_name))
+            start = end
+    return {
+        "views": sorted(rows, key=lambda i: -items[i].views),
+        "name": by_name,
+        "site-desc": sorted(rows, key=lambda i: -items[i].site_count),
+    }
+
+def catalog_columns(items):
+    """
+    카드 목록(기본 정렬 순서)을 컬럼형 dict로. 사이트/카테고리는 문자열 표의 번호, 가격/조회수는 정수 배열이고
+    판매처는 상품별 시작 위치(offerStart) + 판매처 배열로 펼칩니다. (가격 낮은순, create_product_card_html과 같은 순서)
+    클라이언트(assets/catalog.js)는 이 배열과 정렬 모드별 순서(order)로 검색/정렬하고 보이는 카드만 만듭니다.
+    """
+    categories = []
+    category_ids = {}
+    site_ids = {site: idx for idx, site in enumerate(SITE_KEYS)}
+    placeholder_src, placeholder_sources, fallback_src = card_placeholder_images()
+    columns = {
+        "sites": list(SITE_KEYS),
+        "siteNames": [SITE_NAME_MAP.get(site, site.upper()) for site in SITE_KEYS],
+        "searchUrls": [SEARCH_URLS.get(site, "") for site in SITE_KEYS],
+        "categories": categories,
+        "thumbDir": thumbnails.THUMB_DIR, "thumbSizes": list(thumbnails.THUMB_SIZES),
+        "placeholderGrid": thumbnails.PLACEHOLDER_GRID,
+        "placeholderImage": placeholder_src, "placeholderSources": placeholder_sources, "fallbackImage": fallback_src,
+        "key": [], "name": [], "image": [], "thumb": [], "placeholder": [], "category": [], "price": [], "views": [],
+        "offerStart": [0], "offerSite": [], "offerPrice": [], "offerLink": [],
+    }
+    for item in items:
+        if item.category not in category_ids:
+            category_ids[item.category] = len(categories)
+            categories.append(item.category)
+        columns["key"].append(item.key)
+        columns["name"].append(item.display_name)
+        columns["image"].append(item.image or "")
+        columns["thumb"].append(item.thumb)
+        columns["placeholder"].append(item.placeholder)
+        columns["category"].append(category_ids[item.category])
+        columns["price"].append(int(item.min_price))
+        columns["views"].append(item.views)
+        for site, price, link in item.sorted_offers():
+            columns["offerSite"].append(site_ids[site])
+            columns["offerPrice"].append(price)
+            columns["offerLink"].append(link)
+        columns["offerStart"].append(len(columns["offerSite"]))
+    columns["order"] = catalog_sort_orders(items)
+    return columns
+
+# [PERF] 검색 색인 (shards/search.json, assets/search.js가 사용)
+# 상품명/별칭의 2글자 조각(bigram)과 초성 문자열 조각 -> 행 번호 목록. 행 번호는 catalog.json과 같습니다.
+# 클라이언트는 검색어 조각의 목록을 교집합해 후보를 좁히고, 실제 문자열로 한 번 더 확인합니다.
+CHOSUNG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+SEARCH_ALIAS_SEPARATOR = "\x01"
+_WHITESPACE_RE = re.compile(r'\s+')
+
+def search_text(text):
+    """클라이언트 검색과 같은 정규화 (소문자, 공백 제거)"""
+    return _WHITESPACE_RE.sub('', text.lower())
+
+_CHOSUNG_TABLE = {code: CHOSUNG[(code - _HANGUL_BASE) // 588] for code in range(_HANGUL_BASE, _HANGUL_END + 1)}
+
+def chosung_text(text):
+    """한글 음절을 초성(호환 자모)으로 바꾼 문자열. 나머지 글자는 그대로"""
+    return text.translate(_CHOSUNG_TABLE)
+
+def search_alias_map():
+    """
+    상품명에 들어 있는 단어 -> 별칭 목록
+    - WORD_MAP 역방향: 한글로 통일된 브랜드/단어의 원래 표기 (네스티 -> nasty)
+    - CUSTOM_ALIASES: 같은 상품으로 합쳐진 예전/사이트별 상품명 (match_key 기준)
+    """
+    words = {}
+    for alias, word in WORD_MAP.items():
+        if alias != word:
+            words.setdefault(search_text(word), []).append(search_text(alias))
+    by_key = {}
+    for raw_name, canonical in CUSTOM_ALIASES.items():
+        by_key.setdefault(normalize_product(canonical)['match_key'], []).append(search_text(raw_name))
+    return words, by_key
+
+def _delta_encode(rows):
+    return [row - prev for prev, row in zip([0] + rows, rows)]
+
+def build_search_index(items):
+    """
+    {"gram": {조각: 행 번호 간격 목록}, "chosung": {...}, "alias": {행: 별칭}}
+    행 번호 목록은 오름차순이라 첫 값과 이전 값과의 차이로 저장해 크기를 줄입니다.
+    """
+    alias_words, alias_by_key = search_alias_map()
+    alias_matcher = KeywordMatcher(list(alias_words))
+    grams = defaultdict(list)
+    chosung_grams = defaultdict(list)
+    aliases = {}
+    for row, item in enumerate(items):
+        name = search_text(item.display_name)
+        extra = [alias for word in alias_matcher.in_order(alias_matcher.find_all(name)) for alias in alias_words[word]]
+        extra += alias_by_key.get(item.key, [])
+        if extra:
+            aliases[row] = SEARCH_ALIAS_SEPARATOR.join(extra)
+        row_grams = set()
+        row_chosung = set()
+        for part in [name] + extra:
+            row_grams.update(map(str.__add__, part, part[1:]))
+            chosung = chosung_text(part)
+            row_chosung.update(map(str.__add__, chosung, chosung[1:]))
+        for gram in row_grams:
+            grams[gram].append(row)
+        for gram in row_chosung:
+            chosung_grams[gram].append(row)
+    return {
+        "gram": {gram: _delta_encode(rows) for gram, rows in sorted(grams.items())},
+        "chosung": {gram: _delta_encode(rows) for gram, rows in sorted(chosung_grams.items())},
+        "alias": {str(row): alias for row, alias in aliases.items()},
+    }
+
+class ShardWriter:
+    """카테고리 하나의 카드를 page_size개씩 <root>/<slug>/<page>.html 로 나눠 씀"""
+    def __init__(self, root, slug, page_size=SHARD_PAGE_SIZE):
+        self.folder = os.path.join(root, slug)
+        self.slug = slug
+        self.page_size = page_size
+        self.count = 0
+        self.file = None
+        os.makedirs(self.folder, exist_ok=True)
+
+    def write(self, card):
+        if self.count % self.page_size == 0:
+            self.close()
+            self.file = open(os.path.join(self.folder, f"{self.count // self.page_size + 1}.html"), "wb")
+        self.file.write(card if isinstance(card, bytes) else card.encode("utf-8"))
+        self.count += 1
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def info(self):
+        return {"slug": self.slug, "count": self.count, "pages": -(-self.count // self.page_size)}
+
+def write_catalog_shards(data, root=SHARD_DIR, card_cache=None, page_size=SHARD_PAGE_SIZE):
+    """
+    기본 정렬 순서의 카드를 '전체'와 카테고리별 조각에 같이 씀 (카드는 한 번만 렌더링).
+    검색/정렬용 컬럼형 카탈로그(catalog.json)와 검색 색인(search.json)도 같은 폴더에 씁니다.
+    임시 폴더에 다 쓴 뒤 기존 폴더와 바꿔서, 배포 중간에 조각이 섞이지 않게 합니다.
+    (조각 목록 manifest, index.html에 넣을 '전체' 1페이지 카드 목록)을 돌려줌
+    """
+    tmp_root = root + ".tmp"
+    shutil.rmtree(tmp_root, ignore_errors=True)
+    writers = {category: ShardWriter(tmp_root, shard_slug(category), page_size) for category in SHARD_SLUGS}
+    first_page = []
+    # 카탈로그 버전: 조각에 들어간 내용의 해시 (데이터가 같으면 빌드 시각과 무관하게 같음)
+    version = hashlib.sha256(f"{page_size}".encode("utf-8"))
+    try:
+        items = default_card_order(data)
+        for item, card in zip(items, iter_product_cards(((item.key, item) for item in items), card_cache=card_cache)):
+            if len(first_page) < page_size:
+                first_page.append(card)
+            version.update(card if isinstance(card, bytes) else card.encode("utf-8"))
+            writers["all"].write(card)
+            writer = writers.get(item.category)
+            if writer is None:
+                writer = writers[item.category] = ShardWriter(tmp_root, shard_slug(item.category), page_size)
+            writer.write(card)
+    finally:
+        for writer in writers.values():
+            writer.close()
+    for filename, payload in ((SHARD_CATALOG_FILE, catalog_columns(items)), (SHARD_SEARCH_FILE, build_search_index(items))):
+        content = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        version.update(content)
+        with open(os.path.join(tmp_root, filename), "wb") as f:
+            f.write(content)
+    shutil.rmtree(root, ignore_errors=True)
+    os.replace(tmp_root, root)
+
+    manifest = {
+        "base": os.path.basename(root) + "/",
+        "version": version.hexdigest()[:ASSET_HASH_LENGTH],
+        "pageSize": page_size,
+        "catalog": SHARD_CATALOG_FILE,
+        "search": SHARD_SEARCH_FILE,
+        "categories": {category: writer.info() for category, writer in writers.items()},
+    }
+    return manifest, first_page
+
+# [PERF] 정적 자산 지문(content hash). 같은 입력이면 빌드 결과가 바이트 단위로 같고,
+# 내용이 바뀐 파일만 새 URL을 받으므로 브라우저 캐시/새로고침이 실제 변경에만 반응합니다.
+ASSET_DIR = "assets"
+ASSET_HASH_LENGTH = 10
+FINGERPRINTED_ASSETS = ("main.css", "style.css", "search.js", "catalog.js")  # 해시 파일명으로 복사
+VERSIONED_ASSETS = ("assets/favicon.png", "sw.js")  # 파일명은 그대로, ?v=<해시>
+_FINGERPRINTED_NAME_RE = re.compile(r'^(.+)\.[0-9a-f]{%d}(\.\w+)$' % ASSET_HASH_LENGTH)
+
+def content_hash(*parts):
+    """문자열/바이트 조각들의 sha256 앞부분 (조각 경계 구분)"""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part if isinstance(part, bytes) else str(part).encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()[:ASSET_HASH_LENGTH]
+
+def fingerprint_assets(root="."):
+    """
+    assets/main.css -> assets/main.<해시>.css 처럼 해시 파일명으로 복사하고 {원래 이름: URL}을 돌려줌.
+    favicon/sw.js는 ?v=<해시>. 이전 빌드의 해시 파일은 지우고, 원본이 없으면 원래 경로를 그대로 씁니다.
+    """
+    asset_dir = os.path.join(root, ASSET_DIR)
+    urls = {}
+    for name in FINGERPRINTED_ASSETS:
+        path = os.path.join(asset_dir, name)
+        urls[name] = f"{ASSET_DIR}/{name}"
+        if not os.path.exists(path): continue
+        with open(path, "rb") as f:
+            content = f.read()
+        stem, ext = os.path.splitext(name)
+        hashed_name = f"{stem}.{content_hash(content)}{ext}"
+        hashed_path = os.path.join(asset_dir, hashed_name)
+        if not os.path.exists(hashed_path):
+            with open(hashed_path + ".tmp", "wb") as f:
+                f.write(content)
+            os.replace(hashed_path + ".tmp", hashed_path)
+        urls[name] = f"{ASSET_DIR}/{hashed_name}"
+
+    current = {os.path.basename(url) for url in urls.values()}
+    for filename in (os.listdir(asset_dir) if os.path.isdir(asset_dir) else ()):
+        match = _FINGERPRINTED_NAME_RE.match(filename)
+        if match and match.group(1) + match.group(2) in FINGERPRINTED_ASSETS and filename not in current:
+            os.remove(os.path.join(asset_dir, filename))
+
+    for rel_path in VERSIONED_ASSETS:
+        path = os.path.join(root, rel_path)
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                urls[os.path.basename(rel_path)] = f"{rel_path}?v={content_hash(f.read())}"
+        else:
+            urls[os.path.basename(rel_path)] = rel_path
+    return urls
+
+def report_output_files(filename="index.html"):
+    """압축 단계(precompress.py) 대상: 리포트 HTML, shards/ 전체, 해시 파일명 자산 (filename 폴더 기준 상대 경로)"""
+    out_dir = os.path.dirname(filename) or "."
+    paths = [os.path.basename(filename)]
+    for root, _, names in os.walk(os.path.join(out_dir, SHARD_DIR)):
+        paths.extend(os.path.relpath(os.path.join(root, name), out_dir) for name in sorted(names))
+    asset_dir = os.path.join(out_dir, ASSET_DIR)
+    for name in sorted(os.listdir(asset_dir) if os.path.isdir(asset_dir) else ()):
+        match = _FINGERPRINTED_NAME_RE.match(name)
+        if match and match.group(1) + match.group(2) in FINGERPRINTED_ASSETS:
+            paths.append(os.path.join(ASSET_DIR, name))
+    return paths
+
+def optimize_report_output(filename="index.html"):
+    """generate_report 다음 단계: 결과물을 줄이고 gzip/brotli 압축본을 내용 해시로 캐시 (deploy_site.py가 그대로 씀)"""
+    out_dir = os.path.dirname(filename) or "."
+    precompress.report(precompress.optimize_files(report_output_files(filename), root=out_dir))
+
+def recommended_items(data):
+    """[NEW] 추천 시스템 로직 (사진 있고 조회수 높고 판매처 많은 순)"""
     has_img_items = [
         (k, i) for k, i in data.items() 
-        if i.get('image') and 'logo_placeholder' not in i.get('image')
+        if i.image and 'logo_placeholder' not in i.image
     ]
-    recommended_items = sorted(has_img_items, key=lambda x: (x[1].get('views', 0), len(x[1]['prices'])), reverse=True)[:3]
-    
-    featured_html = ""
-    for idx, (r_key, r_item) in enumerate(recommended_items):
-        featured_html += create_product_card_html(r_key, r_item, SITE_NAME_MAP, SEARCH_URLS, rank=idx+1)
+    return sorted(has_img_items, key=lambda x: (x[1].views, x[1].site_count), reverse=True)[:3]
 
-    # Firebase URL 가져오기 (환경변수 또는 기본값)
-    db_url = os.environ.get("FIREBASE_DB_URL", "https://juicehunter-default-rtdb.asia-southeast1.firebasedatabase.app")
-
-    # 캐시 버스팅을 위한 버전키 생성 (현재 시간)
-    version_key = str(int(time.time()))
-
-    html_template = f"""
+def report_page_parts(version_key, db_url, shard_manifest, asset_urls):
+    """
+    index.html 뼈대를 (추천 카드 앞, 추천 카드와 전체 카드 사이, 전체 카드 뒤) 세 조각으로 돌려줍니다.
+    카드 HTML은 generate_report가 조각 사이에 바로 흘려 씁니다.
+    """
+    shard_manifest = json.dumps(shard_manifest, ensure_ascii=False)
+    # 정적 이미지 (static_images.py)가 있으면 크기별 아이콘/manifest/OG 이미지, 없으면 원본
+    if "favicon-icon-32.png" in asset_urls:
+        icon_links = (f'<link rel="icon" type="image/png" sizes="32x32" href="{asset_urls["favicon-icon-32.png"]}">\n'
+                      f'        <link rel="icon" type="image/png" sizes="16x16" href="{asset_urls["favicon-icon-16.png"]}">\n'
+                      f'        <link rel="apple-touch-icon" sizes="180x180" href="{asset_urls["favicon-apple-touch-icon.png"]}">')
+    else:
+        icon_links = f'<link rel="icon" type="image/png" href="{asset_urls["favicon.png"]}">'
+    og_image = (f"{SITE_URL}/{asset_urls['og_image-og.png']}" if "og_image-og.png" in asset_urls
+                else "https://raw.githubusercontent.com/juicepick/juicepick.github.io/master/assets/og_image.png")
+    logo_image = (f"{SITE_URL}/{asset_urls['logo_placeholder-icon-512.png']}" if "logo_placeholder-icon-512.png" in asset_urls
+                  else f"{SITE_URL}/assets/logo_placeholder.png")
+    page_head = f"""
     <!DOCTYPE html>
     <html lang="ko">
     <head>
@@ -414,8 +1493,10 @@ def generate_report(data, sites):
         <link rel="stylesheet" href="https://cdn.jsdelivr.net/gh/orioncactus/pretendard/dist/web/static/pretendard.css">
         <script src="https://www.gstatic.com/firebasejs/8.10.1/firebase-app.js"></script>
         <script src="https://www.gstatic.com/firebasejs/8.10.1/firebase-database.js"></script>
+        <script src="{asset_urls['catalog.js']}"></script>
+        <script src="{asset_urls['search.js']}"></script>
 
-        <link rel="manifest" href="manifest.json">
+        <link rel="manifest" href="{asset_urls.get('manifest.json', 'manifest.json')}">
         <meta name="theme-color" content="#00a8ff">
         <meta name="apple-mobile-web-app-capable" content="yes">
         <meta name="apple-mobile-web-app-status-bar-style" content="black-translucent">
@@ -443,7 +1524,7 @@ def generate_report(data, sites):
             "@type": "Organization",
             "name": "액상픽",
             "url": "https://juicepick.github.io",
-            "logo": "https://juicepick.github.io/assets/logo_placeholder.png",
+            "logo": "{logo_image}",
             "contactPoint": {{
                 "@type": "ContactPoint",
                 "email": "shotgeon00@gmail.com",
@@ -453,11 +1534,11 @@ def generate_report(data, sites):
         </script>
         
         <!-- Favicon & OG Image -->
-        <link rel="icon" type="image/png" href="assets/favicon.png?v={version_key}">
-        <meta property="og:image" content="https://raw.githubusercontent.com/juicepick/juicepick.github.io/master/assets/og_image.png">
+        {icon_links}
+        <meta property="og:image" content="{og_image}">
         
         <!-- Main CSS (Relative Path with Version) -->
-        <link rel="stylesheet" href="assets/main.css?v={version_key}">
+        <link rel="stylesheet" href="{asset_urls['main.css']}">
     </head>
     <body data-theme="light">
         <header>
@@ -489,7 +1570,8 @@ def generate_report(data, sites):
         <section class="featured-section" style="max-width: 1200px; margin: 40px auto 20px; padding: 0 20px;">
             <h2 style="font-size: 24px; margin-bottom: 20px; color: var(--text);">🔥 실시간 인기 급상승 액상 TOP 3</h2>
             <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(280px, 1fr)); gap: 20px;">
-                {featured_html}
+                """
+    page_middle = """
             </div>
         </section>
         <main>
@@ -512,7 +1594,8 @@ def generate_report(data, sites):
             </div>
 
             <div class="product-grid" id="productGrid">
-                {grid_items_html}
+                """
+    page_tail = f"""
             </div>
             <div id="pagination" class="pagination"></div>
 
@@ -594,10 +1677,21 @@ def generate_report(data, sites):
                 firebase.initializeApp(firebaseConfig);
             }}
 
-            let allCards = [];
-            let filteredCards = [];
+            // [PERF] 카테고리/페이지별 카드 조각(shards/) 목록. '전체' 1페이지는 이 문서에 들어 있음
+            const SHARDS = {shard_manifest};
+            const shardCache = {{}};
+            const loadedCards = [];
+            let realtimeViews = null;
+            let refreshToken = 0;
+
+            // 검색/정렬/즐겨찾기용 컬럼형 카탈로그 (assets/catalog.js). 처음 필요할 때 한 번만 받음
+            let catalogRequest = null;
+            let catalogData = null;
+            let searchRequest = null;
+            const catalogCards = new Map();
+
             let currentPage = 1;
-            const itemsPerPage = 40;
+            const itemsPerPage = SHARDS.pageSize;
             let currentCategory = 'all';
 
             // [NEW] URL 파라미터 유틸리티 함수
@@ -624,15 +1718,17 @@ def generate_report(data, sites):
 
             window.onload = function() {{
                 const grid = document.getElementById('productGrid');
-                allCards = Array.from(grid.children);
-                filteredCards = [...allCards];
+                // 문서에 들어 있는 '전체' 1페이지는 조각을 다시 받지 않음
+                const firstPage = Array.from(grid.children);
+                loadedCards.push(...firstPage);
+                shardCache[shardInfo('all').slug + '/1'] = Promise.resolve(firstPage);
                 
                 // [NEW] 실시간 조회수 동기화 logic
                 syncRealtimeViews();
 
                 if ('serviceWorker' in navigator) {{
                     // GH Pages 캐시를 뚫기 위해 버전 쿼리 스트링 다시 도입
-                    navigator.serviceWorker.register('sw.js?v={version_key}').then(reg => {{
+                    navigator.serviceWorker.register('{asset_urls['sw.js']}').then(reg => {{
                         reg.update(); // 매 로드 시 업데이트 확인
 
                         reg.onupdatefound = () => {{
@@ -687,19 +1783,112 @@ def generate_report(data, sites):
                 dbRef.on('value', (snapshot) => {{
                     const data = snapshot.val();
                     if (!data) return;
+                    realtimeViews = data;
+                    if (catalogData) catalogData.applyViews(data);
                     
-                    document.querySelectorAll('.product-card[data-key]').forEach(card => {{
-                        const key = card.dataset.key;
-                        if (data[key] && data[key].views !== undefined) {{
-                            const views = data[key].views;
-                            card.dataset.views = views;
-                            const vValNode = card.querySelector('.v-val');
-                            if (vValNode) vValNode.innerText = views;
-                        }}
-                    }});
+                    // 화면에 없는(이미 받아둔) 조각의 카드도 같이 갱신
+                    applyRealtimeViews(document.querySelectorAll('.product-card[data-key]'));
+                    applyRealtimeViews(loadedCards);
+                }});
+            }}
+
+            function applyRealtimeViews(cards) {{
+                if (!realtimeViews) return;
+                cards.forEach(card => {{
+                    const key = card.dataset.key;
+                    if (realtimeViews[key] && realtimeViews[key].views !== undefined) {{
+                        const views = realtimeViews[key].views;
+                        card.dataset.views = views;
+                        const vValNode = card.querySelector('.v-val');
+                        if (vValNode) vValNode.innerText = views;
+                    }}
                 }});
             }}
 
+            function shardInfo(cat) {{
+                return SHARDS.categories[cat] || SHARDS.categories['all'];
+            }}
+
+            // 카드 조각 하나를 받아 카드 노드 배열로 (같은 조각은 한 번만 요청)
+            function fetchShard(cat, page) {{
+                const info = shardInfo(cat);
+                if (page < 1 || page > info.pages) return Promise.resolve([]);
+                const key = info.slug + '/' + page;
+                if (!shardCache[key]) {{
+                    shardCache[key] = fetch(SHARDS.base + key + '.html?v=' + SHARDS.version)
+                        .then(res => {{
+                            if (!res.ok) throw new Error('Shard ' + key + ': ' + res.status);
+                            return res.text();
+                        }})
+                        .then(html => {{
+                            const tpl = document.createElement('template');
+                            tpl.innerHTML = html;
+                            const cards = Array.from(tpl.content.children);
+                            loadedCards.push(...cards);
+                            loadFavorites(cards);
+                            applyRealtimeViews(cards);
+                            return cards;
+                        }})
+                        .catch(err => {{
+                            delete shardCache[key]; // 다음 요청 때 다시 시도
+                            throw err;
+                        }});
+                }}
+                return shardCache[key];
+            }}
+
+            function loadCatalog() {{
+                if (!catalogRequest) {{
+                    catalogRequest = fetch(SHARDS.base + SHARDS.catalog + '?v=' + SHARDS.version)
+                        .then(res => {{
+                            if (!res.ok) throw new Error('Catalog: ' + res.status);
+                            return res.json();
+                        }})
+                        .then(json => {{
+                            catalogData = new CatalogData(json);
+                            if (realtimeViews) catalogData.applyViews(realtimeViews);
+                            return catalogData;
+                        }})
+                        .catch(err => {{
+                            catalogRequest = null; // 다음 요청 때 다시 시도
+                            throw err;
+                        }});
+                }}
+                return catalogRequest;
+            }}
+
+            // 검색 색인 (assets/search.js). 검색어가 있을 때 처음 한 번만 받음
+            function loadSearchIndex() {{
+                if (!searchRequest) {{
+                    searchRequest = Promise.all([
+                        loadCatalog(),
+                        fetch(SHARDS.base + SHARDS.search + '?v=' + SHARDS.version).then(res => {{
+                            if (!res.ok) throw new Error('Search index: ' + res.status);
+                            return res.json();
+                        }})
+                    ]).then(([data, json]) => new SearchIndex(json, data.json.name))
+                        .catch(err => {{
+                            searchRequest = null; // 다음 요청 때 다시 시도
+                            throw err;
+                        }});
+                }}
+                return searchRequest;
+            }}
+
+            // 카탈로그의 i번째 상품 카드 (만든 카드는 재사용)
+            function catalogCard(i) {{
+                let card = catalogCards.get(i);
+                if (!card) {{
+                    const tpl = document.createElement('template');
+                    tpl.innerHTML = catalogData.cardHtml(i);
+                    card = tpl.content.firstElementChild;
+                    catalogCards.set(i, card);
+                    loadedCards.push(card);
+                    loadFavorites([card]);
+                }}
+                return card;
+            }}
+
             // [DEBUG] 전역 에러 핸들링
             window.onerror = function(msg, url, line, col, error) {{
                 console.error("Error: " + msg + "\\nurl: " + url + "\\nline: " + line);
@@ -787,18 +1976,8 @@ def generate_report(data, sites):
 
             // 통합 필터 함수 (검색어 + 카테고리) - URL 업데이트 없이 내부 필터링만
             window.applyFilters = function(shouldNavigate = false) {{
-                const query = document.getElementById('mainSearch').value.toLowerCase().replace(/\\s+/g, '');
-                
-                filteredCards = allCards.filter(card => {{
-                    const catMatch = (currentCategory === 'all') || (card.dataset.category === currentCategory);
-                    const titleEl = card.querySelector('.product-title');
-                    const title = titleEl ? titleEl.innerText.toLowerCase().replace(/\\s+/g, '') : '';
-                    const searchMatch = title.includes(query);
-                    return catMatch && searchMatch;
-                }});
-                
                 // 검색 버튼/엔터로 트리거된 경우에만 1페이지로 리셋 (URL 복원 시에는 유지)
-                sortData(false, shouldNavigate); // shouldNavigate = true일 때만 페이지 리셋
+                refreshCards(shouldNavigate);
                 
                 // 검색 버튼/엔터로 트리거된 경우에만 URL 업데이트 (window.onload에서는 false)
                 if (shouldNavigate) {{
@@ -833,43 +2012,46 @@ def generate_report(data, sites):
             }};
 
             function sortData(useTimeout = true, resetPage = true) {{
-                const sortType = document.getElementById('sortSelect').value;
-                
-                const execSort = () => {{
-                    const getPrice = (node) => {{
-                        const val = node.getAttribute('data-price');
-                        if (!val) return 999999;
-                        return parseInt(val.replace(/,/g, ''), 10);
-                    }};
+                refreshCards(resetPage);
+            }}
 
-                    filteredCards.sort((a, b) => {{
-                        if (sortType === 'price-asc') {{
-                            return getPrice(a) - getPrice(b);
-                        }} else if (sortType === 'views') {{
-                            return parseInt(b.getAttribute('data-views') || 0) - parseInt(a.getAttribute('data-views') || 0);
-                        }} else if (sortType === 'name') {{
-                             return a.querySelector('.product-title').innerText.localeCompare(b.querySelector('.product-title').innerText);
-                        }} else {{
-                            return parseInt(b.getAttribute('data-sitecount') || 0) - parseInt(a.getAttribute('data-sitecount') || 0);
-                        }}
-                    }});
-                    
-                    if (resetPage) {{
-                        currentPage = 1;
-                    }}
-                    renderCards();
-                }};
+            function currentQuery() {{
+                return document.getElementById('mainSearch').value.toLowerCase().replace(/\\s+/g, '');
+            }}
 
-                if (useTimeout) {{
-                    const spinner = document.getElementById('loading-spinner');
-                    if (spinner) spinner.style.display = 'flex';
-                    setTimeout(() => {{
-                        execSort();
-                        if (spinner) spinner.style.display = 'none';
-                    }}, 100);
+            // 검색어/즐겨찾기 없이 기본 정렬(가격 낮은순)이면 현재 페이지 조각 하나만 있으면 됨
+            function isPagedView() {{
+                return !currentQuery() && !showFavoritesOnly && document.getElementById('sortSelect').value === 'price-asc';
+            }}
+
+            // 현재 상태(카테고리/검색어/정렬/페이지)에 맞는 카드를 받아서 표시
+            function refreshCards(resetPage) {{
+                if (resetPage) {{
+                    currentPage = 1;
+                }}
+                const token = ++refreshToken;
+                const spinner = document.getElementById('loading-spinner');
+                let load;
+                if (isPagedView()) {{
+                    load = fetchShard(currentCategory, currentPage).then(cards => {{
+                        if (token !== refreshToken) return;
+                        renderCards(cards, shardInfo(currentCategory).count);
+                    }});
                 }} else {{
-                    execSort();
+                    // 카드 DOM 대신 카탈로그 배열로 거르고 정렬한 뒤, 현재 페이지 카드만 만듦
+                    if (spinner) spinner.style.display = 'flex';
+                    const query = showFavoritesOnly ? '' : currentQuery();
+                    load = Promise.all([loadCatalog(), query ? loadSearchIndex() : null]).then(([data, searchIndex]) => {{
+                        if (token !== refreshToken) return;
+                        const matched = data.filter(currentCategory, query, showFavoritesOnly ? getFavorites() : null, searchIndex);
+                        const sorted = data.sort(matched, document.getElementById('sortSelect').value);
+                        const start = (currentPage - 1) * itemsPerPage;
+                        renderCards(sorted.slice(start, start + itemsPerPage).map(catalogCard), sorted.length);
+                    }});
                 }}
+                return load.catch(err => console.error('Failed to load cards', err)).finally(() => {{
+                    if (spinner && token === refreshToken) spinner.style.display = 'none';
+                }});
             }}
 
             // [기능 추가] 조회수 증가 함수 (Firebase)
@@ -941,17 +2123,18 @@ def generate_report(data, sites):
                     btn.classList.add('active');
                 }}
                 localStorage.setItem('juicepick_favorites', JSON.stringify(favs));
+                // 같은 상품이 다른 조각(전체/카테고리)에도 있으므로 같이 맞춤
+                loadFavorites(loadedCards.filter(c => c.dataset.key === key));
             }}
 
-            function loadFavorites() {{
+            function loadFavorites(cards) {{
                 const favs = getFavorites();
-                document.querySelectorAll('.product-card').forEach(card => {{
-                    const key = card.dataset.key;
+                (cards || document.querySelectorAll('.product-card')).forEach(card => {{
                     const btn = card.querySelector('.fav-btn');
-                    if (btn && favs.includes(key)) {{
-                        btn.querySelector('i').className = 'fas fa-heart';
-                        btn.classList.add('active');
-                    }}
+                    if (!btn) return;
+                    const active = favs.includes(card.dataset.key);
+                    btn.querySelector('i').className = active ? 'fas fa-heart' : 'far fa-heart';
+                    btn.classList.toggle('active', active);
                 }});
             }}
 
@@ -960,15 +2143,8 @@ def generate_report(data, sites):
                 showFavoritesOnly = !showFavoritesOnly;
                 btn.classList.toggle('active', showFavoritesOnly);
                 
-                if (showFavoritesOnly) {{
-                    const favs = getFavorites();
-                    filteredCards = allCards.filter(c => favs.includes(c.dataset.key));
-                }} else {{
-                    applyFilters();
-                    return;
-                }}
-                currentPage = 1;
-                renderCards();
+                // 켤 때만 1페이지로 (끌 때는 기존 필터 상태로 복귀)
+                refreshCards(showFavoritesOnly);
             }}
 
             function filterCategory(cat, btn) {{
@@ -980,15 +2156,11 @@ def generate_report(data, sites):
                 applyFilters();
             }}
 
-            function renderCards() {{
+            function renderCards(pageItems, total) {{
                 const grid = document.getElementById('productGrid');
                 grid.innerHTML = ''; 
 
-                const start = (currentPage - 1) * itemsPerPage;
-                const end = start + itemsPerPage;
-                const pageItems = filteredCards.slice(start, end);
-
-                if (filteredCards.length === 0) {{
+                if (total === 0) {{
                     grid.innerHTML = `
                         <div style="grid-column: 1/-1; text-align: center; padding: 60px 20px;">
                             <i class="fas fa-search" style="font-size: 48px; color: #ddd; margin-bottom: 20px;"></i>
@@ -1004,15 +2176,15 @@ def generate_report(data, sites):
                     grid.appendChild(card);
                 }});
                 
-                renderPagination();
+                renderPagination(total);
                 window.scrollTo(0, 0);
             }}
 
-            function renderPagination() {{
+            function renderPagination(total) {{
                 const pagination = document.getElementById('pagination');
                 pagination.innerHTML = '';
                 
-                const totalPages = Math.ceil(filteredCards.length / itemsPerPage);
+                const totalPages = Math.ceil(total / itemsPerPage);
                 if (totalPages <= 1) return;
 
                 const currentGroup = Math.ceil(currentPage / 10);
@@ -1042,7 +2214,7 @@ def generate_report(data, sites):
                 btn.innerText = text;
                 btn.onclick = () => {{
                     currentPage = pageNum;
-                    renderCards();
+                    refreshCards(false);
                     updateUrlParams(); // URL 업데이트
                 }};
                 return btn;
@@ -1053,18 +2225,81 @@ def generate_report(data, sites):
     </body>
     </html>
     """
+    return page_head, page_middle, page_tail
+
+def iter_product_cards(items, ranked=False, card_cache=None):
+    """(key, item) 순서대로 카드 HTML을 하나씩 내보냄 (ranked면 1위부터 추천 배지, 캐시를 쓰면 UTF-8 바이트)"""
+    for idx, (key, item) in enumerate(items):
+        rank = idx + 1 if ranked else 0
+        if card_cache is not None:
+            yield card_cache.render(key, item, rank)
+        else:
+            yield create_product_card_html(key, item, SITE_NAME_MAP, SEARCH_URLS, rank=rank)
+
+def iter_report_html(version_key, db_url, shard_manifest, asset_urls, featured, first_page):
+    """
+    index.html 전체를 조각 단위로 내보냄. 문서 전체를 한 문자열로 만들지 않음
+    추천 영역에는 featured 카드, 전체 카드 그리드에는 first_page(기본 정렬 1페이지)만 넣고
+    나머지는 shard_manifest의 조각 파일로 받습니다.
+    """
+    page_head, page_middle, page_tail = report_page_parts(version_key, db_url, shard_manifest, asset_urls)
+    yield page_head
+    yield from featured
+    yield page_middle
+    yield from first_page
+    yield page_tail
+
+def page_template_source():
+    import inspect
+    try:
+        return inspect.getsource(report_page_parts)
+    except (OSError, TypeError):  # 소스 파일을 못 읽는 환경
+        return report_page_parts.__code__.co_code.hex() + repr(report_page_parts.__code__.co_consts)
+
+def generate_report(data, sites, filename="index.html", card_cache=None):
+    print("[INFO] Generating HTML Report...")
+
+    # Firebase URL 가져오기 (환경변수 또는 기본값)
+    db_url = os.environ.get("FIREBASE_DB_URL", "https://juicehunter-default-rtdb.asia-southeast1.firebasedatabase.app")
 
-    filename = "index.html"
-    with open(filename, "w", encoding="utf-8") as f:
-        f.write(html_template)
+    # 카드 조각은 index.html 옆 shards/ 폴더에 씀
+    out_dir = os.path.dirname(filename) or "."
+    shard_root = os.path.join(out_dir, SHARD_DIR)
+    shard_manifest, first_page = write_catalog_shards(data, shard_root, card_cache)
+    featured = list(iter_product_cards(recommended_items(data), ranked=True, card_cache=card_cache))
+    asset_urls = {**fingerprint_assets(out_dir), **STATIC_IMAGE_URLS}
+
+    # 버전키: 페이지 템플릿 + 데이터 + 자산 내용의 해시 (빌드 시각 대신)
+    # 내용이 같으면 같은 값이라 checkVersionSync의 강제 새로고침도 실제 변경이 있을 때만 일어남
+    version_key = content_hash(page_template_source(), db_url, shard_manifest["version"], *featured,
+                               *(f"{name}={url}" for name, url in sorted(asset_urls.items())))
+
+    # 카드가 만들어지는 대로 파일 버퍼로 흘려 씀 (캐시에서 꺼낸 카드는 이미 UTF-8 바이트)
+    with open(filename, "wb") as f:
+        for chunk in iter_report_html(version_key, db_url, shard_manifest, asset_urls, featured, first_page):
+            f.write(chunk if isinstance(chunk, bytes) else chunk.encode("utf-8"))
+    if card_cache is not None:
+        card_cache.save()
+        card_cache.report()
     
-    print(f"[SUCCESS] Portal Style Report Generated: {filename}")
+    print(f"[INFO] Shards: {shard_root}/ " + ", ".join(
+        f"{info['slug']} {info['pages']}p" for info in shard_manifest["categories"].values()))
+    print(f"[SUCCESS] Portal Style Report Generated: {filename} (version {version_key})")
 
 if __name__ == "__main__":
     try:
-        merged_data, sites = process_data()
+        # --full: 이전 병합 상태를 무시하고 전체 재빌드
+        merged_data, sites = process_data(full_rebuild="--full" in sys.argv)
         if merged_data:
-            generate_report(merged_data, sites)
+            apply_thumbnails(merged_data)
+            apply_static_images()
+            card_cache = get_card_cache()
+            generate_report(merged_data, sites, card_cache=card_cache)
+            card_cache.close()
+            optimize_report_output()
+            if NORMALIZE_CACHE is not None:
+                NORMALIZE_CACHE.report()
+                NORMALIZE_CACHE.close()
         else:
             print("[ERROR] No data to generate.")
             # Create a simple fallback page so deployment doesn't completely fail
@@ -0,0 +1,106 @@
+"""
+액상 카탈로그 모델
+merged_data(dict의 dict의 dict)를 __slots__ 레코드와 사이트별 가격 배열로 보관합니다.
+기존 도구들이 쓰던 item['prices'], item.get('image') 같은 dict 방식 접근도 그대로 지원합니다.
+"""
+from array import array
+from enum import IntEnum
+
+# 사이트 내부 키 (순서 = 병합/표시 순서)
+SITE_KEYS = ('modu', 'juice24', 'tjf', 'siasiu', 'vapemonster', 'juice99', 'juicebox', 'vape9', 'juice23')
+Site = IntEnum('Site', [(key, idx) for idx, key in enumerate(SITE_KEYS)])
+
+# 판매처가 하나도 없을 때 최저가 자리에 들어가던 값 (기존 동작 유지)
+NO_PRICE = 999999
+
+class Product:
+    """
+    병합된 상품 하나. 판매처는 사이트 순서대로 site_ids / prices / links 세 배열에 나란히 저장되고,
+    최저가와 판매처 수는 생성 시 한 번만 계산합니다.
+    """
+    __slots__ = ('key', 'display_name', 'category', 'volume', 'image', 'views',
+                 'site_ids', 'prices', 'links', 'min_price', 'thumb', 'placeholder')
+
+    FIELDS = ('display_name', 'category', 'volume', 'image', 'views')
+
+    def __init__(self, key, display_name, category, volume, image="", views=0, offers=()):
+        """offers: 사이트 순서대로 (site_key, price, link)"""
+        self.key = key
+        self.display_name = display_name
+        self.category = category
+        self.volume = volume
+        self.image = image
+        self.views = views
+        self.site_ids = bytes(Site[site] for site, _, _ in offers)
+        self.prices = array('q', [price for _, price, _ in offers])  # 64비트: 32비트를 넘는 가격에도 빌드가 멈추지 않게
+        self.links = tuple(link for _, _, link in offers)
+        self.min_price = min(self.prices, default=NO_PRICE)
+        self.thumb = ""  # 빌드 때 thumbnails.py가 채우는 썸네일 id (없으면 원래 image URL 사용)
+        self.placeholder = ""  # 썸네일과 같이 채우는 자리표시 색 격자 (이미지가 오기 전 카드 배경)
+
+    @classmethod
+    def from_dict(cls, key, item):
+        offers = [(site, info['price'], info['link']) for site, info in item['prices'].items()]
+        return cls(key, item['display_name'], item['category'], item['volume'],
+                   item.get('image', ""), item.get('views', 0), offers)
+
+    @property
+    def site_count(self):
+        return len(self.site_ids)
+
+    @property
+    def sites(self):
+        return [SITE_KEYS[site_id] for site_id in self.site_ids]
+
+    def offers(self):
+        """(site_key, price, link) 목록 (사이트 순서)"""
+        return [(SITE_KEYS[site_id], price, link) for site_id, price, link in zip(self.site_ids, self.prices, self.links)]
+
+    def sorted_offers(self):
+        """가격 낮은 순 (같은 가격이면 사이트 순서)"""
+        return sorted(self.offers(), key=lambda offer: offer[1])
+
+    def price_map(self):
+        return {site: {"price": price, "link": link} for site, price, link in self.offers()}
+
+    def to_dict(self):
+        return {
+            "display_name": self.display_name, "category": self.category,
+            "volume": self.volume, "image": self.image, "prices": self.price_map(), "views": self.views
+        }
+
+    # --- 기존 dict 방식 접근 호환 (tools/*, debug 스크립트용) ---
+    def __getitem__(self, name):
+        if name == 'prices': return self.price_map()
+        if name in self.FIELDS: return getattr(self, name)
+        raise KeyError(name)
+
+    def __setitem__(self, name, value):
+        if name not in self.FIELDS: raise KeyError(name)
+        setattr(self, name, value)
+
+    def __contains__(self, name):
+        return name == 'prices' or name in self.FIELDS
+
+    def get(self, name, default=None):
+        try:
+            return self[name]
+        except KeyError:
+            return default
+
+    def __repr__(self):
+        return f"Product({self.key!r}, {self.display_name!r}, sites={self.site_count}, min_price={self.min_price})"
+
+class Catalog(dict):
+    """match_key -> Product. dict 그대로라 data.items() 같은 기존 코드가 그대로 동작합니다."""
+
+    @classmethod
+    def from_merged(cls, merged_data):
+        return cls((key, Product.from_dict(key, item)) for key, item in merged_data.items())
+
+    def by_site_count(self):
+        """판매처 많은 순 (같으면 기존 순서 유지)"""
+        return sorted(self.values(), key=lambda product: product.site_count, reverse=True)
+
+    def to_dict(self):
+        return {key: product.to_dict() for key, product in self.items()}
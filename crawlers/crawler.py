@@ -0,0 +1,765 @@
+"""
+쇼핑몰 크롤러 공통 엔진 (쇼핑몰별 차이는 crawlers/profiles.py의 선언형 프로필에만)
+모든 쇼핑몰이 같은 받기/파싱/저장 경로와 같은 동시성을 씁니다.
+- 받기: 커넥션 풀을 쓰는 requests.Session + 스레드 풀로 여러 쇼핑몰/페이지를 동시에, 호스트마다 동시 요청은 HOST_CONCURRENCY개까지.
+  목록 마크업이 없는 페이지(자바스크립트로 그리는 스킨)나 fetch="browser" 프로필만 headless Chrome으로
+  (고정 sleep 대신 상품이 뜨고 개수가 멈출 때까지만 대기, 로그인이 필요한 프로필은 브라우저마다 한 번 로그인)
+- 대기: 쇼핑몰마다 최대 대기(wait_timeout), 페이지별 대기 시간은 .cache/crawler/waits.jsonl에 쌓아 --wait-stats로 확인.
+  요약에 기존 크롤러의 고정 sleep(fixed_wait) 대비 줄어든 시간
+- 브라우저: BrowserPool이 BROWSER_POOL_SIZE개까지 띄워 돌려 씀 (BROWSER_RECYCLE_PAGES 페이지마다 새로).
+  chromedriver 경로는 한 번 찾아 .cache/crawler에 저장 (다음 실행부터 네트워크 없이)
+- 쇼핑몰마다 SITE_TIMEOUT(초)이 지나면 남은 페이지를 건너뛰고, 한 쇼핑몰의 오류는 그 쇼핑몰에만 남음
+- 페이지: 1페이지의 페이지 링크로 마지막 페이지를 알면 나머지를 한꺼번에, 모르면 상품이 없는 페이지가 나올 때까지 차례로
+- 파싱: BeautifulSoup (lxml이 있으면 lxml 파서). 숨김 라벨(상품명 :, 판매가 :)과 '(2,100원 할인)' 같은 괄호 금액은 제외
+- 저장: 쇼핑몰마다 Firebase 다중 경로 update 한 번 (키/필드 이름은 기존 크롤러와 같음)
+검증/시간 측정: tools/verify_crawlers.py (tools/fixtures/crawlers/ 의 저장된 HTML로, 네트워크 없이)
+
+사용법 (저장소 루트에서 실행, Firebase 저장에는 key.json 필요):
+    python crawlers/crawler.py                        # 전체 쇼핑몰 수집 후 Firebase 저장
+    python crawlers/crawler.py juice24 tjf            # 일부만
+    python crawlers/crawler.py juicebox --max-pages 2 --dry-run   # 2페이지까지만, 저장하지 않고 결과만 출력
+    python crawlers/crawler.py --wait-stats           # 지금까지 기록한 쇼핑몰별 대기 시간 (wait_timeout 조정용)
+"""
+import argparse
+import datetime
+import json
+import os
+import queue
+import re
+import shutil
+import sys
+import threading
+import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from profiles import PROFILES
+
+try:
+    import lxml  # noqa: F401  (있으면 BeautifulSoup 파서로 사용)
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+DATABASE_URL = 'https://juicehunter-default-rtdb.asia-southeast1.firebasedatabase.app'
+HOST_CONCURRENCY = int(os.environ.get("CRAWL_HOST_CONCURRENCY", "4"))
+MAX_WORKERS = int(os.environ.get("CRAWL_WORKERS", "16"))
+REQUEST_TIMEOUT = 15
+BROWSER_TIMEOUT = 20  # 브라우저로 그릴 때 상품이 뜰 때까지 최대 대기 (초, 프로필 "wait_timeout"으로 바꿈)
+WAIT_POLL = float(os.environ.get("CRAWL_WAIT_POLL", "0.25"))  # 대기 중 상품 개수 확인 간격 (초)
+# 2페이지부터: 페이지를 다 받은 뒤 이만큼 상품이 하나도 없으면 빈 마지막 페이지로 보고 그만 기다림 (초)
+EMPTY_WAIT = float(os.environ.get("CRAWL_EMPTY_WAIT", "3"))
+BROWSER_POOL_SIZE = int(os.environ.get("CRAWL_BROWSERS", "2"))  # 동시에 띄우는 headless Chrome 수
+BROWSER_RECYCLE_PAGES = int(os.environ.get("CRAWL_BROWSER_RECYCLE", "50"))  # 이만큼 그린 브라우저는 닫고 새로 (메모리 상한)
+SITE_TIMEOUT = float(os.environ.get("CRAWL_SITE_TIMEOUT", "300"))  # 쇼핑몰 하나의 최대 수집 시간 (초, 프로필 "timeout"으로 바꿈)
+DRIVER_PATH_FILE = os.path.join(os.environ.get("CRAWL_CACHE_DIR", ".cache/crawler"), "chromedriver_path")
+WAIT_STATS_FILE = os.path.join(os.environ.get("CRAWL_CACHE_DIR", ".cache/crawler"), "waits.jsonl")
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+DEFAULT_MIN_PRICE = 1000
+SAVED_FIELDS = ("name", "price", "image", "url")
+
+SKIPPED_PRICE_LABELS = ("소비자가", "적립", "배송", "요약", "리뷰", "할인율")
+_WON_RE = re.compile(r'(\d[\d,]*)\s*원')
+_NUMBER_RE = re.compile(r'\d[\d,]*')
+_PAREN_RE = re.compile(r'\([^)]*\)')
+_LIST_PRICE_RE = re.compile(r'소비자가\s*:?\s*[\d,]+\s*원')
+_NAME_LABEL_RE = re.compile(r'^\s*상품명\s*:?\s*')
+_SPACES_RE = re.compile(r'\s+')
+_PAGE_RE = re.compile(r'[?&]page=(\d+)')
+
+def list_url(profile, page):
+    return profile["list_url"].format(page=page, **profile)
+
+def absolute_url(url, base):
+    if not url: return ""
+    if url.startswith("//"): return "https:" + url
+    return urllib.parse.urljoin(base + "/", url)
+
+def _selectors(value):
+    return (value,) if isinstance(value, str) else tuple(value or ())
+
+def _visible_text(element):
+    """숨김 라벨(class title)을 뺀 글자"""
+    parts = []
+    for node in element.find_all(string=True):
+        parent = node.parent
+        while parent is not element and "title" not in (parent.get("class") or []):
+            parent = parent.parent
+        if parent is element: parts.append(node)
+    return _SPACES_RE.sub(" ", "".join(parts)).strip()
+
+def amounts(text):
+    """글의 금액들 (괄호 안 제외). '원'이 붙은 금액이 있으면 그것만, 없으면 숫자 전부"""
+    text = _PAREN_RE.sub("", text)
+    values = _WON_RE.findall(text) or _NUMBER_RE.findall(text)
+    return [int(value.replace(",", "")) for value in values if value.replace(",", "")]
+
+def pick_price(values, profile):
+    if not values: return 0
+    return values[0] if profile.get("price_pick") == "first" else min(values)
+
+def item_name(item, profile, selectors=None):
+    image = item.select_one(profile["image"]) if profile.get("image") else None
+    alt = (image.get("alt") or "").strip() if image is not None else ""
+    name = alt if profile.get("name_from") == "alt" and "상품명" not in alt else ""
+    if not name:
+        for selector in _selectors(selectors or profile.get("name")):
+            element = item.select_one(selector)
+            if element is not None:
+                name = _NAME_LABEL_RE.sub("", _visible_text(element))
+                if name: break
+    name = name or alt
+    for word in profile.get("strip_words", ()):
+        name = name.replace(word, "")
+    return _SPACES_RE.sub(" ", name).strip()
+
+def item_price(item, profile, selector=None):
+    """가격 속성 -> 라벨 붙은 가격 표(소비자가 등 제외) -> 가격 요소 -> 글 전체(소비자가 제외) 순서로 찾은 금액"""
+    if profile.get("price_attr"):
+        attr_selector, attribute = profile["price_attr"]
+        element = item.select_one(attr_selector)
+        value = (element.get(attribute) or "") if element is not None else ""
+        if value.isdigit() and int(value) > 0: return int(value)
+    values = []
+    for row in item.select(profile["price_rows"]) if profile.get("price_rows") else ():
+        label = row.select_one(".title")
+        label_text = label.get_text(strip=True) if label is not None else ""
+        if any(word in label_text for word in SKIPPED_PRICE_LABELS): continue
+        values += amounts(_visible_text(row))[:1]
+    selector = selector or profile.get("price")
+    if not values and selector:
+        element = item.select_one(selector)
+        if element is not None: values = amounts(element.get_text(" ", strip=True))
+    if not values and profile.get("price_rows"):
+        # 가격 표가 없는 맞춤 스킨: 글 전체에서 소비자가를 뺀 '원' 금액
+        text = _PAREN_RE.sub("", _LIST_PRICE_RE.sub("", item.get_text(" ", strip=True)))
+        values = [int(value.replace(",", "")) for value in _WON_RE.findall(text)]
+    return pick_price(values, profile)
+
+def item_image(item, profile, selector=None):
+    selector = selector or profile.get("image")
+    for image in item.select(selector) if selector else ():
+        src = image.get("ec-data-src") or image.get("data-original") or image.get("data-src") or image.get("src") or ""
+        if src and not src.startswith("data:") and not any(word in src.lower() for word in ("icon", "btn", "common")):
+            return absolute_url(src, profile["base"])
+    return ""
+
+def item_link(item, profile):
+    if not profile.get("link"): return ""
+    link = item if item.name == "a" and item.has_attr("href") else item.select_one(profile["link"])
+    return absolute_url(link.get("href", ""), profile["base"]) if link is not None else ""
+
+def url_param(url, name):
+    values = urllib.parse.parse_qs(urllib.parse.urlsplit(url).query).get(name)
+    return values[0] if values else ""
+
+def accept(product, profile):
+    """저장 대상인지 (이름, 제외 단어, 가격 범위)"""
+    if not product["name"] or any(word in product["name"] for word in profile.get("skip_words", ())): return False
+    return profile.get("min_price", DEFAULT_MIN_PRICE) < product["price"] < profile.get("max_price", float("inf"))
+
+def parse_item(item, profile):
+    """
+    상품 요소 -> {"name", "price", "image", "url"(, "id")} (저장 대상이 아니면 None).
+    상세 페이지 프로필은 {"url", "id"}만 (이름/가격은 parse_detail에서)
+    """
+    url = item_link(item, profile)
+    product = {"url": url}
+    if profile.get("id_param"):
+        product["id"] = url_param(url, profile["id_param"])
+        if not product["id"]: return None
+    if profile.get("detail"): return product
+    product = {"name": item_name(item, profile), "price": item_price(item, profile),
+               "image": item_image(item, profile), **product}
+    return product if accept(product, profile) else None
+
+def parse_list(html, profile):
+    """
+    목록 HTML -> (상품 목록, 마지막 페이지 번호 또는 None, 상품 요소 수, 목록 페이지인지)
+    상품 요소도 list_markers도 없으면 자바스크립트로 그리는 페이지로 보고 브라우저로 다시 받습니다.
+    """
+    soup = BeautifulSoup(html, HTML_PARSER)
+    items = []
+    for selector in _selectors(profile["item"]):
+        items = soup.select(selector)
+        if items: break
+    has_list = bool(items) or any(marker in html for marker in profile.get("list_markers", ()))
+    hrefs = [link["href"] for link in soup.select(profile["paging"])] if profile.get("paging") else []
+    return parse_items(items, profile), max_page(hrefs), len(items), has_list
+
+def parse_extracted(extracted, profile):
+    """
+    Browser.extract 결과 {"items": [상품 요소 outerHTML], "paging": [페이지 링크 href]} -> parse_list와 같은 값.
+    상품 요소만 다시 파싱하므로 쇼핑몰별 규칙(parse_item)은 HTML 페이지와 같음
+    """
+    soup = BeautifulSoup("".join(f"<x-item>{html}</x-item>" for html in extracted["items"]), HTML_PARSER)
+    items = [wrapper.find(True) for wrapper in soup.find_all("x-item")]
+    items = [item for item in items if item is not None]
+    return parse_items(items, profile), max_page(extracted["paging"]), len(items), True
+
+def parse_items(items, profile):
+    products, seen = [], set()
+    for item in items:
+        product = parse_item(item, profile)
+        if product is None: continue
+        # 선택자가 겹치는 요소(상품을 감싼 목록 등)는 같은 상품으로 나옴
+        key = product.get("id") or product["name"]
+        if key in seen: continue
+        seen.add(key)
+        products.append(product)
+    return products
+
+def max_page(hrefs):
+    pages = [int(match.group(1)) for match in (_PAGE_RE.search(href or "") for href in hrefs) if match]
+    return max(pages) if pages else None
+
+def parse_detail(html, profile, stub):
+    """상세 페이지 HTML -> 상품 (저장 대상이 아니면 None)"""
+    soup = BeautifulSoup(html, HTML_PARSER)
+    detail = profile["detail"]
+    product = {"name": item_name(soup, profile, detail["name"]), "price": item_price(soup, profile, detail["price"]),
+               "image": item_image(soup, profile, detail.get("image")), **stub}
+    return product if accept(product, profile) else None
+
+class PageFetcher:
+    """커넥션 풀을 쓰는 requests.Session. 호스트마다 동시에 HOST_CONCURRENCY개까지만 요청"""
+    def __init__(self, per_host=HOST_CONCURRENCY, session=None):
+        self.per_host = per_host
+        self.session = session or requests.Session()
+        retry = Retry(total=2, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504))
+        adapter = HTTPAdapter(pool_connections=len(PROFILES), pool_maxsize=per_host, max_retries=retry)
+        if session is None:
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
+        self.session.headers.update({"User-Agent": USER_AGENT, "Accept-Language": "ko-KR,ko;q=0.9"})
+        self.hosts = {}
+        self.lock = threading.Lock()
+        self.requests = 0
+
+    def _host_slot(self, url):
+        host = urllib.parse.urlsplit(url).netloc
+        with self.lock:
+            if host not in self.hosts: self.hosts[host] = threading.Semaphore(self.per_host)
+            self.requests += 1
+            return self.hosts[host]
+
+    def get(self, url):
+        with self._host_slot(url):
+            response = self.session.get(url, timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()
+        response.encoding = response.apparent_encoding if response.encoding in (None, "ISO-8859-1") else response.encoding
+        return response.text
+
+# 브라우저에서 한 번에 실행: 상품 요소(첫 번째로 찾은 선택자)의 outerHTML과 페이지 링크 href만 돌려줌.
+# pick_each면 선택자마다 첫 요소 하나씩 (상세 페이지의 이름/가격/이미지)
+EXTRACT_SCRIPT = """
+const [selectors, paging, pickEach] = arguments;
+let items = [];
+for (const selector of selectors) {
+    if (pickEach) {
+        const element = document.querySelector(selector);
+        if (element) items.push(element.outerHTML);
+        continue;
+    }
+    const found = Array.from(document.querySelectorAll(selector));
+    // 다른 상품 요소를 감싼 바깥 요소(목록 전체 div 등)는 빼고 안쪽 요소만: 같은 HTML을 두 번 보내지 않음
+    if (!found.length) continue;
+    items = found.filter(element => !found.some(other => other !== element && element.contains(other)))
+                 .map(element => element.outerHTML);
+    break;
+}
+const hrefs = paging ? Array.from(document.querySelectorAll(paging), link => link.getAttribute('href') || '') : [];
+return {items: items, paging: hrefs};
+"""
+
+_driver_path = None
+_driver_lock = threading.Lock()
+
+def driver_path(refresh=False):
+    """
+    chromedriver 경로: CHROMEDRIVER 환경 변수 -> PATH -> 저장해 둔 경로 -> ChromeDriverManager (네트워크, 결과 저장).
+    한 프로세스에서 한 번만 찾음. refresh=True면 저장해 둔 경로를 버리고 다시 받음 (Chrome이 업데이트돼 드라이버가 안 맞을 때)
+    """
+    global _driver_path
+    with _driver_lock:
+        if _driver_path and not refresh: return _driver_path
+        candidates = [os.environ.get("CHROMEDRIVER"), shutil.which("chromedriver")]
+        if not refresh:
+            try:
+                with open(DRIVER_PATH_FILE, "r", encoding="utf-8") as f:
+                    candidates.append(f.read().strip())
+            except OSError:
+                pass
+        path = next((candidate for candidate in candidates if candidate and os.path.exists(candidate)), None)
+        if path is None:
+            from webdriver_manager.chrome import ChromeDriverManager
+            path = ChromeDriverManager().install()
+            os.makedirs(os.path.dirname(DRIVER_PATH_FILE), exist_ok=True)
+            with open(DRIVER_PATH_FILE, "w", encoding="utf-8") as f:
+                f.write(path)
+        _driver_path = path
+        return path
+
+class Browser:
+    """
+    headless Chrome 하나. 처음 필요할 때 띄우고 한 번에 한 페이지씩.
+    extract(url, wait, selectors, paging)는 wait 선택자 요소가 뜨고 개수가 멈출 때까지만 기다린 뒤
+    (안 뜨면 timeout 뒤 그대로: 빈 마지막 페이지) EXTRACT_SCRIPT 한 번으로 상품 요소 HTML만 받음. 요소마다 find_element/text/get_attribute를 부르면
+    호출마다 WebDriver 왕복이라, 한 페이지 호출 수는 상품 수와 상관없이 get + 대기 + execute_script 몇 번뿐.
+    calls: 이 브라우저가 보낸 WebDriver 명령 수
+    """
+    def __init__(self, timeout=BROWSER_TIMEOUT):
+        self.timeout = timeout
+        self.driver = None
+        self.lock = threading.Lock()
+        self.logged_in = set()
+        self.pages = 0
+        self.calls = 0
+
+    def _count_calls(self, driver):
+        """모든 WebDriver 명령(요소 찾기/글자/속성/스크립트)은 driver.execute를 거침"""
+        execute = driver.execute
+        def counted(*args, **kwargs):
+            self.calls += 1
+            return execute(*args, **kwargs)
+        driver.execute = counted
+        return driver
+
+    def _start(self):
+        from selenium import webdriver
+        from selenium.common.exceptions import SessionNotCreatedException
+        from selenium.webdriver.chrome.options import Options
+        from selenium.webdriver.chrome.service import Service
+        options = Options()
+        for argument in ("--headless=new", "--disable-gpu", "--log-level=3",
+                         "--disable-blink-features=AutomationControlled", f"user-agent={USER_AGENT}"):
+            options.add_argument(argument)
+        try:
+            driver = webdriver.Chrome(service=Service(driver_path()), options=options)
+        except SessionNotCreatedException:  # 저장해 둔 드라이버가 지금 Chrome과 안 맞음
+            driver = webdriver.Chrome(service=Service(driver_path(refresh=True)), options=options)
+        driver.set_page_load_timeout(self.timeout + REQUEST_TIMEOUT)
+        return self._count_calls(driver)
+
+    def start(self):
+        with self.lock:
+            if self.driver is None: self.driver = self._start()
+
+    def _wait(self, selector):
+        from selenium.common.exceptions import TimeoutException
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions
+        from selenium.webdriver.support.ui import WebDriverWait
+        by = By.XPATH if selector.startswith("//") else By.CSS_SELECTOR
+        try:
+            return WebDriverWait(self.driver, self.timeout).until(expected_conditions.presence_of_element_located((by, selector)))
+        except TimeoutException:
+            return None
+
+    def _ready(self, selector, timeout, empty_after=None):
+        """
+        selector 요소가 있고 개수가 WAIT_POLL 간격으로 두 번 연속 같을 때까지 (늦게 붙는 상품까지 기다림).
+        empty_after초 동안 하나도 없으면 빈 페이지로 보고 멈춤. -> (기다린 초, 준비됐는지). timeout이 지나면 그대로 돌려줌
+        """
+        from selenium.common.exceptions import TimeoutException
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        started = time.perf_counter()
+        counts = []
+        def stable(driver):
+            counts.append(len(driver.find_elements(By.CSS_SELECTOR, selector)))
+            if not counts[-1]: return "empty" if empty_after is not None and time.perf_counter() - started >= empty_after else False
+            return "ready" if len(counts) > 1 and counts[-1] == counts[-2] else False
+        try:
+            ready = WebDriverWait(self.driver, timeout, poll_frequency=WAIT_POLL).until(stable) == "ready"
+        except TimeoutException:
+            ready = False
+        return time.perf_counter() - started, ready
+
+    def _login(self, login):
+        from selenium.webdriver.support.ui import WebDriverWait
+        self.driver.get(login["url"])
+        user = self._wait(login["user"])
+        if user is None: raise RuntimeError(f"login form not found: {login['url']}")
+        user.send_keys(login["username"])
+        self._wait(login["password"]).send_keys(login["secret"])
+        self._wait(login["submit"]).click()
+        WebDriverWait(self.driver, self.timeout).until(lambda driver: driver.current_url != login["url"])
+        self.logged_in.add(login["url"])
+
+    def extract(self, url, wait, selectors, paging=None, pick_each=False, login=None, timeout=None, empty_after=None):
+        """-> {"items": [요소 outerHTML], "paging": [href], "waited": 기다린 초, "ready": 준비 조건을 만족했는지}"""
+        with self.lock:
+            if self.driver is None: self.driver = self._start()
+            if login and login["url"] not in self.logged_in: self._login(login)
+            self.driver.get(url)
+            waited, ready = self._ready(wait, self.timeout if timeout is None else timeout, empty_after)
+            self.pages += 1
+            extracted = self.driver.execute_script(EXTRACT_SCRIPT, list(selectors), paging, pick_each)
+            return {**extracted, "waited": waited, "ready": ready}
+
+    def close(self):
+        if self.driver is not None:
+            try:
+                self.driver.quit()
+            finally:
+                self.driver = None
+
+class BrowserPool:
+    """
+    돌려 쓰는 Browser 묶음 (Browser와 같은 extract/close). 동시에 size개까지 그리고, 쉬는 브라우저는 다시 씀.
+    recycle_after 페이지를 그린 브라우저와 오류가 난 브라우저는 닫고 다음에 새로 띄움.
+    warm(n): 목록을 받기 전에 미리 띄워 둠 (Chrome 시작 시간을 HTTP 수집과 겹침)
+    calls/seconds: 닫은 브라우저까지 합친 WebDriver 명령 수와 페이지 시간 (페이지당 통계용)
+    """
+    def __init__(self, size=BROWSER_POOL_SIZE, recycle_after=BROWSER_RECYCLE_PAGES, factory=Browser):
+        self.size = max(1, size)
+        self.recycle_after = recycle_after
+        self.factory = factory
+        self.slots = threading.Semaphore(self.size)
+        self.idle = queue.LifoQueue()
+        self.lock = threading.Lock()
+        self.started = 0
+        self.recycled = 0
+        self.failed = 0
+        self.pages = 0
+        self.calls = 0
+        self.seconds = 0.0
+
+    def _new(self):
+        with self.lock:
+            self.started += 1
+        return self.factory()
+
+    def warm(self, count=1):
+        def start():
+            # 띄우는 동안 자리를 잡고 있어 extract가 그 사이에 브라우저를 더 띄우지 않음
+            with self.slots:
+                browser = self._new()
+                try:
+                    if hasattr(browser, "start"): browser.start()
+                    self.idle.put(browser)
+                except Exception:
+                    with self.lock:
+                        self.failed += 1
+                    browser.close()
+        threads = [threading.Thread(target=start, daemon=True) for _ in range(min(count, self.size))]
+        for thread in threads: thread.start()
+        return threads
+
+    def extract(self, url, wait, selectors, paging=None, pick_each=False, login=None, timeout=None, empty_after=None):
+        with self.slots:
+            try:
+                browser = self.idle.get_nowait()
+            except queue.Empty:
+                browser = self._new()
+            calls, started = browser.calls, time.perf_counter()
+            try:
+                extracted = browser.extract(url, wait, selectors, paging, pick_each, login, timeout, empty_after)
+            except Exception:
+                with self.lock:
+                    self.failed += 1
+                    self.calls += browser.calls - calls
+                browser.close()
+                raise
+            with self.lock:
+                self.pages += 1
+                self.calls += browser.calls - calls
+                self.seconds += time.perf_counter() - started
+                recycle = browser.pages >= self.recycle_after
+                if recycle: self.recycled += 1
+            if recycle: browser.close()
+            else: self.idle.put(browser)
+            return extracted
+
+    def close(self):
+        while True:
+            try:
+                self.idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+class SiteCrawl:
+    """쇼핑몰 하나의 수집 상태: 페이지별 상품, 브라우저 사용 여부, 시간, 브라우저 페이지별 대기 시간"""
+    def __init__(self, site, profile=None):
+        self.site = site
+        self.profile = profile or PROFILES[site]
+        self.pages = {}  # 페이지 번호 -> 상품 목록
+        self.needs_browser = self.profile.get("fetch") == "browser"
+        self.browser_pages = 0
+        self.detail_pages = 0
+        self.waits = []  # 브라우저 페이지마다 기다린 초
+        self.wait_timeouts = 0  # 준비 조건을 못 채운 페이지 (빈 마지막 페이지 포함)
+        self.errors = []
+        self.started = time.perf_counter()
+        self.deadline = self.started + self.profile.get("timeout", SITE_TIMEOUT)
+        self.timed_out = False
+        self.seconds = 0.0
+
+    def status(self):
+        if not self.pages.get(1): return "failed"
+        if self.timed_out: return "timeout"
+        return "partial" if self.errors else "ok"
+
+    def wait_timeout(self):
+        """브라우저 페이지 하나의 최대 대기: 프로필 wait_timeout, 쇼핑몰 시간 제한이 더 가까우면 그때까지"""
+        return max(0.0, min(self.profile.get("wait_timeout", BROWSER_TIMEOUT), self.deadline - time.perf_counter()))
+
+    def fixed_wait(self):
+        """같은 페이지를 기존 크롤러가 받았다면 고정 sleep으로 쉬었을 시간 (프로필 fixed_wait)"""
+        detail_wait = (self.profile.get("detail") or {}).get("fixed_wait", 0)
+        return self.profile.get("fixed_wait", 0) * len(self.pages) + detail_wait * self.detail_pages
+
+    def products(self):
+        """페이지 순서대로, 같은 이름은 처음 것만 (기존 크롤러의 seen_names와 같음)"""
+        seen, result = set(), []
+        for page in sorted(self.pages):
+            for product in self.pages[page]:
+                if product["name"] in seen: continue
+                seen.add(product["name"])
+                result.append(product)
+        return result
+
+def browser_extract(crawl, browser, url, selectors, paging=None, pick_each=False, wait=None, empty_after=None):
+    if browser is None: raise RuntimeError("page needs JavaScript and no browser is available")
+    crawl.browser_pages += 1
+    extracted = browser.extract(url, wait or ", ".join(selectors), selectors, paging, pick_each,
+                                crawl.profile.get("login"), crawl.wait_timeout(), empty_after)
+    crawl.waits.append(extracted["waited"])
+    if not extracted["ready"]: crawl.wait_timeouts += 1
+    return extracted
+
+def fetch_list(crawl, page, fetcher, browser):
+    """
+    목록 페이지 -> parse_list 값. 브라우저로 받는 쇼핑몰은 상품 요소만 한 번에 받아 같은 규칙으로 파싱
+    (1페이지는 wait_timeout까지 기다리고, 이후 페이지는 EMPTY_WAIT초 동안 비어 있으면 마지막 다음 페이지)
+    """
+    profile = crawl.profile
+    url = list_url(profile, page)
+    if not crawl.needs_browser: return parse_list(fetcher.get(url), profile)
+    extracted = browser_extract(crawl, browser, url, _selectors(profile["item"]), profile.get("paging"),
+                                empty_after=EMPTY_WAIT if page > 1 else None)
+    return parse_extracted(extracted, profile)
+
+def fetch_detail(crawl, stub, fetcher, browser):
+    """상세 페이지 -> 상품. 브라우저는 이름/가격/이미지 요소만 받음"""
+    profile = crawl.profile
+    detail = profile["detail"]
+    crawl.detail_pages += 1
+    if not crawl.needs_browser: return parse_detail(fetcher.get(stub["url"]), profile, stub)
+    selectors = _selectors(detail["name"]) + _selectors(detail["price"]) + _selectors(detail.get("image"))
+    extracted = browser_extract(crawl, browser, stub["url"], selectors, pick_each=True,
+                                wait=", ".join(_selectors(detail["name"])))
+    return parse_detail("".join(extracted["items"]), profile, stub)
+
+def fetch_page(crawl, page, fetcher, browser):
+    """
+    한 페이지를 받아 파싱 -> (상품 목록, 마지막 페이지, 상품 요소 수).
+    1페이지 HTTP 응답이 목록 페이지가 아니면 브라우저로 다시 받고, 그 쇼핑몰의 이후 페이지도 브라우저로
+    (2페이지부터는 목록이 없으면 마지막 다음 페이지)
+    """
+    profile = crawl.profile
+    if time.perf_counter() > crawl.deadline:
+        if not crawl.timed_out: crawl.errors.append(f"page {page}: timed out after {profile.get('timeout', SITE_TIMEOUT):g}s")
+        crawl.timed_out = True
+        return [], None, 0
+    try:
+        products, last_page, count, has_list = fetch_list(crawl, page, fetcher, browser)
+        if not has_list and not crawl.needs_browser and page == 1:
+            crawl.needs_browser = True
+            products, last_page, count, _ = fetch_list(crawl, page, fetcher, browser)
+        if profile.get("detail"):
+            products = [product for product in (fetch_detail(crawl, stub, fetcher, browser) for stub in products) if product]
+        return products, last_page, count
+    except Exception as e:  # 네트워크/HTTP/브라우저 오류: 그 페이지만 빠지고 나머지는 계속
+        crawl.errors.append(f"page {page}: {type(e).__name__}: {e}"[:200])
+        return [], None, 0
+
+def crawl_sites(sites, fetcher=None, browser=None, workers=MAX_WORKERS, max_pages=None, profiles=PROFILES):
+    """
+    여러 쇼핑몰을 동시에 수집해 {site: SiteCrawl}을 돌려줌.
+    1페이지를 받은 쇼핑몰부터, 마지막 페이지 번호를 알면 나머지 페이지를 한꺼번에, 모르면 빈 페이지가 나올 때까지 차례로.
+    browser는 Browser 또는 BrowserPool (브라우저로만 받는 프로필이 있으면 미리 띄움)
+    """
+    fetcher = fetcher or PageFetcher()
+    crawls = {site: SiteCrawl(site, profiles[site]) for site in sites}
+    if browser is not None and hasattr(browser, "warm"):
+        browser.warm(sum(1 for crawl in crawls.values() if crawl.needs_browser))
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        def crawl_rest(crawl, first):
+            try:
+                follow_pages(crawl, first.result())
+            except Exception as e:  # 예상 못 한 오류도 그 쇼핑몰에만
+                crawl.errors.append(f"{type(e).__name__}: {e}"[:200])
+            crawl.seconds = time.perf_counter() - crawl.started
+
+        def follow_pages(crawl, first):
+            products, last_page, count = first
+            crawl.pages[1] = products
+            limit = min(crawl.profile["max_pages"], max_pages or crawl.profile["max_pages"])
+            if last_page is not None:
+                pages = range(2, min(last_page, limit) + 1)
+                for page, result in zip(pages, pool.map(lambda page: fetch_page(crawl, page, fetcher, browser), pages)):
+                    crawl.pages[page] = result[0]
+            else:
+                page = 2
+                while count and page <= limit:
+                    products, _, count = fetch_page(crawl, page, fetcher, browser)
+                    crawl.pages[page] = products
+                    page += 1
+
+        firsts = {site: pool.submit(fetch_page, crawl, 1, fetcher, browser) for site, crawl in crawls.items()}
+        # 나머지 페이지 요청은 같은 풀에서 돌므로, 쇼핑몰별 진행은 별도 스레드에서 기다림
+        threads = [threading.Thread(target=crawl_rest, args=(crawls[site], future)) for site, future in firsts.items()]
+        for thread in threads: thread.start()
+        for thread in threads: thread.join()
+    return crawls
+
+def product_key(product, profile):
+    """Firebase 키 (기존 크롤러와 같은 키라 이전 기록을 그대로 갱신)"""
+    if profile.get("key") == "id": return f"item_{product['id']}"
+    name = product["name"]
+    if profile.get("key_pattern"): key = re.sub(profile["key_pattern"], "", name)
+    else: key = "".join(c for c in name if c.isalnum())
+    return key[:profile["key_length"]] if profile.get("key_length") else key
+
+def product_updates(site, products, updated_at, profile=None):
+    """products/<site> 아래 다중 경로 update 내용 {"<키>/<필드>": 값}"""
+    profile = profile or PROFILES[site]
+    fields = profile.get("fields", {})
+    updates = {}
+    for product in products:
+        key = product_key(product, profile)
+        if not key: continue
+        for field in SAVED_FIELDS:
+            if product[field] or field in ("name", "price"): updates[f"{key}/{fields.get(field, field)}"] = product[field]
+        updates[f"{key}/site"] = site
+        updates[f"{key}/last_update"] = updated_at
+    return updates
+
+def save_products(site, products, updated_at=None):
+    """Firebase products/<site> 에 한 번의 다중 경로 update로 저장 (다른 필드는 그대로)"""
+    from firebase_admin import db
+    updates = product_updates(site, products, updated_at or time.strftime("%Y-%m-%d %H:%M:%S"))
+    if updates: db.reference(f"products/{site}").update(updates)
+    return len(products)
+
+def init_firebase():
+    import firebase_admin
+    from firebase_admin import credentials
+    if not os.path.exists("key.json"):
+        print("❌ key.json 파일이 없습니다!")
+        return False
+    try:
+        firebase_admin.get_app()
+    except ValueError:
+        firebase_admin.initialize_app(credentials.Certificate("key.json"), {'databaseURL': DATABASE_URL})
+    return True
+
+def wait_stats(waits):
+    """대기 시간 목록 -> {"pages", "total", "p50", "p95", "max"} (초)"""
+    ordered = sorted(waits)
+    if not ordered: return {"pages": 0, "total": 0.0, "p50": 0.0, "p95": 0.0, "max": 0.0}
+    def percentile(fraction):
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+    return {"pages": len(ordered), "total": sum(ordered), "p50": percentile(0.5), "p95": percentile(0.95), "max": ordered[-1]}
+
+def record_waits(crawls, path=WAIT_STATS_FILE):
+    """브라우저를 쓴 쇼핑몰마다 이번 대기 시간을 한 줄씩 추가 (wait_timeout/fixed_wait 조정용 기록)"""
+    lines = [json.dumps({"at": datetime.datetime.now().isoformat(timespec="seconds"), "site": crawl.site,
+                         "wait_timeout": crawl.profile.get("wait_timeout", BROWSER_TIMEOUT),
+                         "timeouts": crawl.wait_timeouts, "waits": [round(wait, 2) for wait in crawl.waits]})
+             for crawl in crawls.values() if crawl.waits]
+    if not lines: return
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("".join(line + "\n" for line in lines))
+
+def print_wait_stats(path=WAIT_STATS_FILE):
+    """기록된 대기 시간을 쇼핑몰별로 합쳐 출력 (p95가 wait_timeout에 가까우면 늘리고, 한참 아래면 줄일 후보)"""
+    if not os.path.exists(path):
+        print(f"[WAIT] no wait statistics yet ({path})")
+        return
+    runs = {}
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if not line.strip(): continue
+            record = json.loads(line)
+            runs.setdefault(record["site"], []).append(record)
+    for site, records in runs.items():
+        stats = wait_stats([wait for record in records for wait in record["waits"]])
+        print(f"[WAIT] {site:<11} {len(records):>3} runs, {stats['pages']:>4} pages: p50 {stats['p50']:.2f}s, "
+              f"p95 {stats['p95']:.2f}s, max {stats['max']:.2f}s, {sum(r['timeouts'] for r in records)} not ready "
+              f"(wait_timeout {records[-1]['wait_timeout']:g}s)")
+
+def report(crawls, wall=None, browser=None):
+    """쇼핑몰별 상태/상품/페이지/시간/대기, 전체 시간(쇼핑몰 시간의 합과 비교), 고정 sleep 대비 줄어든 대기와 브라우저 풀 통계"""
+    for crawl in crawls.values():
+        mode = f"browser {crawl.browser_pages}p" if crawl.needs_browser else "http"
+        stats = wait_stats(crawl.waits)
+        waits = (f", waits p50 {stats['p50']:.1f}s p95 {stats['p95']:.1f}s"
+                 + (f", {crawl.wait_timeouts} not ready" if crawl.wait_timeouts else "")) if crawl.waits else ""
+        print(f"[CRAWL] {crawl.site:<11} {crawl.status():<7} {len(crawl.products()):>4} products, "
+              f"{len(crawl.pages):>2} pages ({mode}), {crawl.seconds:.1f}s{waits}"
+              + (f", {len(crawl.errors)} errors" if crawl.errors else ""))
+        for error in crawl.errors[:3]:
+            print(f"            {error}")
+    if wall is None: return
+    statuses = [crawl.status() for crawl in crawls.values()]
+    print(f"[CRAWL] total: {len(crawls)} sites ({statuses.count('ok')} ok), "
+          f"{sum(len(crawl.pages) for crawl in crawls.values())} pages, "
+          f"{sum(len(crawl.products()) for crawl in crawls.values())} products in {wall:.1f}s "
+          f"(sum of site times {sum(crawl.seconds for crawl in crawls.values()):.1f}s)")
+    waited = sum(sum(crawl.waits) for crawl in crawls.values())
+    fixed = sum(crawl.fixed_wait() for crawl in crawls.values())
+    print(f"[CRAWL] waits: {waited:.1f}s on {sum(len(crawl.waits) for crawl in crawls.values())} browser pages; "
+          f"old fixed sleeps for the same pages {fixed:g}s, saved {fixed - waited:.1f}s")
+    if isinstance(browser, BrowserPool) and browser.started:
+        per_page = (f", {browser.calls / browser.pages:.1f} WebDriver calls and "
+                    f"{browser.seconds / browser.pages * 1000:.0f}ms per page") if browser.pages else ""
+        print(f"[CRAWL] browsers: {browser.started} started, {browser.pages} pages, "
+              f"{browser.recycled} recycled, {browser.failed} failed{per_page}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="쇼핑몰 상품 수집 (crawlers/profiles.py)")
+    parser.add_argument("sites", nargs="*", help=f"쇼핑몰 (기본: 전체 = {', '.join(PROFILES)})")
+    parser.add_argument("--dry-run", action="store_true", help="저장하지 않고 결과만 출력")
+    parser.add_argument("--max-pages", type=int, help="쇼핑몰마다 이 페이지까지만")
+    parser.add_argument("--wait-stats", action="store_true", help=f"기록된 대기 시간만 출력 ({WAIT_STATS_FILE})")
+    args = parser.parse_args(argv)
+    if args.wait_stats:
+        print_wait_stats()
+        return 0
+    sites = args.sites or list(PROFILES)
+    unknown = [site for site in sites if site not in PROFILES]
+    if unknown:
+        print(f"❌ 알 수 없는 쇼핑몰: {', '.join(unknown)} (가능: {', '.join(PROFILES)})")
+        return 1
+    if not args.dry_run and not init_firebase(): return 1
+
+    started = time.perf_counter()
+    browser = BrowserPool()
+    try:
+        crawls = crawl_sites(sites, browser=browser, max_pages=args.max_pages)
+    finally:
+        browser.close()
+    report(crawls, time.perf_counter() - started, browser)
+    record_waits(crawls)
+    if not args.dry_run:
+        for site, crawl in crawls.items():
+            if not crawl.pages.get(1): continue
+            try:
+                save_products(site, crawl.products())
+            except Exception as e:  # 저장 실패도 그 쇼핑몰만
+                print(f"❌ {site} 저장 실패: {type(e).__name__}: {e}")
+    print(f"🏁 {len(sites)}개 쇼핑몰 수집 완료: {sum(len(c.products()) for c in crawls.values())}개 상품, "
+          f"{time.perf_counter() - started:.1f}s")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+"""
+쇼핑몰별 크롤링 프로필 (crawlers/crawler.py가 읽음)
+쇼핑몰마다 다른 것은 목록 URL, 선택자, 가격/키 규칙뿐이라 여기 값으로만 적습니다. 새 쇼핑몰 = PROFILES에 한 줄.
+Cafe24 쇼핑몰은 cafe24(주소, 카테고리, 최대 페이지, ...)로 공통 마크업 값을 채움.
+
+프로필 키 (선택자는 CSS, 튜플이면 앞에서부터 찾은 첫 결과)
+- base, list_url: 목록 주소. list_url은 "{base}", "{page}" 및 프로필의 다른 값으로 채움
+- max_pages: 최대 페이지. paging(페이지 링크 선택자)이 있으면 1페이지에서 마지막 페이지를 읽어 나머지를 한꺼번에,
+  없으면 빈 페이지가 나올 때까지 차례로
+- fetch: "auto"(기본, HTTP로 받고 목록이 없을 때만 브라우저) / "browser"(항상 브라우저, 로그인 필요 등)
+- list_markers: 이 글자가 HTML에 있으면 상품이 0개여도 목록 페이지로 봄 (빈 마지막 페이지 vs 자바스크립트로 그리는 페이지)
+- item, name, price, image, link: 상품 하나 / 그 안의 이름, 가격, 이미지, 링크
+- name_from: "alt"면 이미지 alt를 이름으로
+- price_rows: 라벨이 붙은 가격 표 (Cafe24 판매가/할인판매가, 소비자가/적립금은 제외)
+- price_attr: (선택자, 속성) 가격이 속성에 있는 경우
+- price_pick: "min"(기본, 판매가/할인가 중 낮은 값) / "first"(처음 나온 금액)
+- min_price, max_price: 이 범위를 벗어나면 (min_price 이하 또는 max_price 이상) 저장 안 함. skip_words: 이름에 있으면 저장 안 함
+- strip_words: 이름에서 지울 말
+- detail: 목록에는 링크만 있고 이름/가격/이미지는 상세 페이지에 있을 때 상세 페이지 선택자 {"name", "price", "image"}
+  (+ "fixed_wait": 기존 크롤러의 상세 페이지 고정 대기)
+- login: 브라우저로 먼저 로그인 {"url", "user", "password", "submit"(CSS 또는 "//"로 시작하는 XPath), "username", "secret"}
+- key: Firebase 키 규칙. "name"(기본, 이름의 글자/숫자) / "id"("item_<id_param 값>")
+  key_pattern/key_length: "name" 키에서 지울 글자(정규식)와 길이 제한
+- fields: 저장 필드 이름 바꾸기 (예: {"image": "img", "url": "link"}. 기존 DB 필드 그대로)
+- wait_timeout: 브라우저 페이지에서 상품이 뜰 때까지 최대 대기 (초, 기본 crawler.BROWSER_TIMEOUT).
+  python crawlers/crawler.py --wait-stats 의 p95를 보고 조정
+- fixed_wait: 기존 Selenium 크롤러가 페이지마다 쉬던 고정 sleep (초). 수집 요약의 줄어든 대기 시간 계산에만 씀
+"""
+import os
+
+CAFE24 = {
+    "list_url": "{base}/product/list.html?cate_no={category}&page={page}",
+    "paging": ".xans-product-normalpaging a[href], .ec-base-paginate a[href]",
+    "list_markers": ("xans-product-listnormal", "prdList", "anchorBoxId_"),
+    # 상품 li는 id="anchorBoxId_<상품번호>" (맞춤 스킨도 대부분 유지)
+    "item": ('[id^="anchorBoxId_"]', ".prdList > li"),
+    "name": (".name a", ".sp-product-name a", ".description .name"),
+    "price_rows": ".xans-product-listitem > li",
+    "image": ".thumbnail img, .prdImg img, .thumb img",
+    "link": "a[href*='product_no'], .name a, .sp-product-name a, .thumbnail a, .prdImg a, .thumb a",
+}
+
+def cafe24(base, category, max_pages, **options):
+    return {**CAFE24, "base": base, "category": category, "max_pages": max_pages, **options}
+
+PROFILES = {
+    "juice23": cafe24("https://23juice.kr", 23, 20, skip_words=("묶음", "SET", "문의"),
+                      key_pattern=r'[^a-zA-Z0-9가-힣]', key_length=50, fixed_wait=4),
+    "juice24": cafe24("https://juice24.kr", 48, 13, min_price=3000, fixed_wait=5),
+    # 무거운 스킨 (기존 크롤러도 10초씩 쉼): 최대 대기만 넉넉히
+    "juice99": cafe24("https://99juice.co.kr", 42, 13, min_price=3000, max_price=150000, wait_timeout=30, fixed_wait=10),
+    "juicebox": cafe24("https://juicebox.co.kr", 52, 53, name_from="alt", strip_words=("이미지",), fixed_wait=3),
+    "vape9": cafe24("https://vape9.co.kr", 101, 24, price_attr=(".discount_rate", "data-prod-price"), fixed_wait=5),
+    "modu": cafe24("https://xn--hu1b83j3sfk9e3xc.kr", 127, 30, min_price=3000, fixed_wait=5),
+    # 아임웹
+    "tjf": {
+        "base": "https://www.tjf.kr", "max_pages": 3,
+        "list_url": "{base}/?productListFilter=241674&productListPage={page}&productSortFilter=PRODUCT_ORDER_NO",
+        "list_markers": ("shopProduct",),
+        "item": ("div[class*='shopProduct'], .product_item",),
+        "name": (".productName, .name, h4, .tit",),
+        "price": ".productPriceSpan, .price, .pay", "price_pick": "first", "min_price": 3000,
+        "image": "img", "link": "a[href]", "fixed_wait": 8,
+    },
+    # 고도몰
+    "vapemonster": {
+        "base": "https://vapemonster.co.kr", "max_pages": 10,
+        "list_url": "{base}/goods/goods_list.php?cateCd=016002&page={page}",
+        "paging": ".pagination a[href]", "list_markers": ("item_gallery_type", "item_basket_type"),
+        "item": (".item_gallery_type > ul > li, .item_basket_type > ul > li",),
+        "name": (".item_tit_box .item_name, .item_name",),
+        "price": ".item_price_box .item_price, .item_price", "min_price": 0,
+        "image": ".item_photo_box img", "link": ".item_photo_box a",
+        "key": "id", "id_param": "goodsNo", "fields": {"image": "img", "url": "link"}, "fixed_wait": 3,
+    },
+    # NHN 샵바이 (로그인해야 가격이 보이고, 목록은 자바스크립트로 그림)
+    "siasiu": {
+        "base": "https://siasiu.com", "max_pages": 23, "fetch": "browser",
+        "list_url": "{base}/pages/product/product-list.html?categoryNo=937592&pageNumber={page}&pageSize=20",
+        "item": ("a[href*='productNo=']",), "link": "a[href*='productNo=']",
+        "detail": {"name": ("h2, .product-summary__title",), "price": ".product-summary__price",
+                   "image": "img[src*='/product/']", "fixed_wait": 4},
+        "price_pick": "first", "min_price": 3000,
+        "login": {"url": "https://siasiu.com/pages/sign-in/sign-in.html", "user": "input[type='text']",
+                  "password": "input[type='password']",
+                  "submit": "//button[contains(text(), '로그인')] | //button[@type='submit']",
+                  "username": os.environ.get("SIASIU_ID", "qwerqwer12"),
+                  "secret": os.environ.get("SIASIU_PW", "qwerqwer12")},
+        "key": "id", "id_param": "productNo", "fields": {"image": "img", "url": "link"}, "fixed_wait": 6,
+    },
+}
@@ -1,8 +1,8 @@
 import os
 import json
 import hashlib
-import gzip
 import requests
+import precompress
 import google.auth.transport.requests
 from google.oauth2 import service_account
 
@@ -23,14 +23,16 @@ def get_file_hash(content):
     return hashlib.sha256(content).hexdigest()
 
 def compress_content(content):
-    return gzip.compress(content)
+    # build_site.py의 압축 단계가 만든 gzip 본이 있으면 그대로 씀 (없으면 같은 설정으로 압축)
+    cached = precompress.cached_gzip(content)
+    return cached if cached is not None else precompress.gzip_bytes(content)
 
 def find_files_to_deploy():
     files = {} # path -> content (bytes)
     
     # Files to include explicitly or folders
     include_files = ['index.html', 'sw.js', 'firebase.json']
-    include_dirs = ['assets']
+    include_dirs = ['assets', 'shards', 'thumbs']  # shards: build_site.py가 만드는 카드 조각, thumbs: 상품 썸네일
 
     for f in include_files:
         if os.path.exists(f):
@@ -0,0 +1,392 @@
+"""
+빌드 결과물 압축 단계 (generate_report 다음에 실행)
+index.html, shards/, 해시 파일명 자산(assets/main.<해시>.css 등)을 제자리에서 줄이고(minify),
+최대 압축 gzip / brotli 본을 .cache/precompressed/<내용 sha256>.gz|.br 로 만들어 둡니다.
+- 내용 해시가 같은 파일은 이전 빌드의 압축본을 그대로 씀 (다시 압축하지 않음)
+- deploy_site.py는 여기서 만든 gzip 바이트를 그대로 올림 (배포 때 다시 압축하지 않음)
+- brotli 패키지가 없으면 gzip만 만듦
+
+줄이기는 안전한 것만 합니다. 줄바꿈은 남기므로(자동 세미콜론 삽입 보존) 들여쓰기/주석/빈 줄이 주로 빠집니다.
+- HTML: 태그 사이 공백 묶기, 주석 제거, 인라인 <script>/<style>은 아래 JS/CSS 규칙
+- CSS: 주석 제거, 공백 묶기, { } ; , > : 주변 공백과 } 앞 ; 제거
+- JS: 주석 제거, 들여쓰기 제거, 낱말 사이가 아닌 공백 제거 (문자열/템플릿/정규식 리터럴은 그대로)
+"""
+import gzip
+import hashlib
+import json
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import brotli
+except ImportError:  # pip install brotli 가 없으면 gzip만
+    brotli = None
+
+PRECOMPRESS_CACHE_DIR = os.environ.get("PRECOMPRESS_CACHE_DIR", ".cache/precompressed")
+GZIP_LEVEL = 9
+# brotli 11은 gzip보다 훨씬 느림 (카드 조각 수십 MB면 수십 초). 캐시가 없는 빌드가 너무 느리면 낮춤
+BROTLI_QUALITY = int(os.environ.get("PRECOMPRESS_BROTLI_QUALITY", 11))
+INDEX_FILE = "index.json"
+REPORT_FILE = "report.json"
+
+# ---------------------------------------------------------------- JS
+
+_JS_WORD_RE = re.compile(r"[\w$\u0080-\uffff]")
+# 이 낱말 뒤의 / 는 나눗셈이 아니라 정규식 리터럴
+_JS_REGEX_KEYWORDS = {"return", "typeof", "instanceof", "in", "of", "new", "delete", "void", "throw",
+                      "case", "do", "else", "yield", "await"}
+# 줄바꿈을 지워도 문장 구분이 바뀌지 않는 앞/뒤 글자
+_JS_NEWLINE_AFTER = set("{(,;[")
+_JS_NEWLINE_BEFORE = set("})],;")
+
+def _is_js_word(ch):
+    return bool(ch) and _JS_WORD_RE.match(ch) is not None
+
+def _skip_js_string(src, i):
+    """src[i]의 따옴표로 시작하는 문자열의 끝 다음 위치"""
+    quote, n = src[i], len(src)
+    i += 1
+    while i < n and src[i] != quote:
+        if src[i] == "\\": i += 1
+        elif src[i] == "\n": break  # 닫히지 않은 문자열은 줄 끝까지
+        i += 1
+    return i + 1
+
+def _skip_js_template(src, i):
+    """src[i]의 백틱으로 시작하는 템플릿 리터럴의 끝 다음 위치 (${ } 안의 중첩 문자열/템플릿 포함)"""
+    n = len(src)
+    i += 1
+    while i < n and src[i] != "`":
+        if src[i] == "\\":
+            i += 2
+        elif src.startswith("${", i):
+            depth, i = 1, i + 2
+            while i < n and depth:
+                ch = src[i]
+                if ch in "'\"": i = _skip_js_string(src, i); continue
+                if ch == "`": i = _skip_js_template(src, i); continue
+                if ch == "{": depth += 1
+                elif ch == "}": depth -= 1
+                i += 1
+        else:
+            i += 1
+    return i + 1
+
+def _skip_js_regex(src, i):
+    """src[i]의 / 로 시작하는 정규식 리터럴(플래그 포함)의 끝 다음 위치"""
+    n = len(src)
+    i += 1
+    in_class = False
+    while i < n and src[i] != "\n":
+        ch = src[i]
+        if ch == "\\": i += 1
+        elif ch == "[": in_class = True
+        elif ch == "]": in_class = False
+        elif ch == "/" and not in_class: break
+        i += 1
+    i += 1
+    while i < n and _is_js_word(src[i]): i += 1
+    return i
+
+def minify_js(source):
+    out = []
+    pending = ""  # 앞 토큰과 사이의 공백 ("", " ", "\n")
+    last = ""  # 마지막으로 내보낸 글자
+    last_word = ""  # 마지막으로 내보낸 낱말 (정규식 판별용)
+    i, n = 0, len(source)
+
+    def emit(token):
+        nonlocal pending, last, last_word
+        first = token[0]
+        if pending and out:
+            if pending == "\n" and last not in _JS_NEWLINE_AFTER and first not in _JS_NEWLINE_BEFORE:
+                out.append("\n")
+            elif (_is_js_word(last) and _is_js_word(first)) or (last == first and last in "+-/") \
+                    or (last.isdigit() and first == "."):
+                out.append(" ")
+        out.append(token)
+        pending = ""
+        last = token[-1]
+        last_word = ""
+
+    while i < n:
+        ch = source[i]
+        if ch in " \t\r\n\f\v\ufeff":
+            j = i
+            while j < n and source[j] in " \t\r\n\f\v\ufeff": j += 1
+            if "\n" in source[i:j] or pending == "\n": pending = "\n"
+            else: pending = " "
+            i = j
+        elif source.startswith("//", i):
+            j = source.find("\n", i)
+            i = n if j < 0 else j
+        elif source.startswith("/*", i):
+            j = source.find("*/", i + 2)
+            j = n if j < 0 else j + 2
+            pending = "\n" if "\n" in source[i:j] or pending == "\n" else (pending or " ")
+            i = j
+        elif ch in "'\"":
+            j = _skip_js_string(source, i)
+            emit(source[i:j])
+            i = j
+        elif ch == "`":
+            j = _skip_js_template(source, i)
+            emit(source[i:j])
+            i = j
+        elif ch == "/" and (not last or (last not in ")]}" and not _is_js_word(last))
+                            or last_word in _JS_REGEX_KEYWORDS):
+            j = _skip_js_regex(source, i)
+            emit(source[i:j])
+            i = j
+        elif _is_js_word(ch):
+            j = i
+            while j < n and _is_js_word(source[j]): j += 1
+            emit(source[i:j])
+            last_word = source[i:j]
+            i = j
+        else:
+            emit(ch)
+            i += 1
+    return "".join(out)
+
+# ---------------------------------------------------------------- CSS
+
+_CSS_TOKEN_RE = re.compile(r"""("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')|(/\*.*?\*/)|(\s+)|([^"'/\s]+|/)""", re.S | re.A)
+# 이 글자 앞뒤의 공백은 필요 없음 (: 는 뒤쪽만 - 선택자의 "a :hover"는 뜻이 다름)
+_CSS_SPACE_AROUND = set("{};,>")
+
+def minify_css(source):
+    out = []
+    space = False
+    for string, comment, whitespace, text in _CSS_TOKEN_RE.findall(source):
+        if comment: continue
+        if whitespace:
+            space = True
+            continue
+        token = string or text
+        if space and out and out[-1][-1] not in _CSS_SPACE_AROUND and out[-1][-1] != ":" \
+                and token[0] not in _CSS_SPACE_AROUND:
+            out.append(" ")
+        space = False
+        if text:
+            # 블록 끝 } 앞의 ; 는 필요 없음 (토큰 안이든 앞 토큰 끝이든)
+            token = token.replace(";}", "}")
+            if token.startswith("}") and out and out[-1].endswith(";"): out[-1] = out[-1][:-1]
+        out.append(token)
+    return "".join(out).strip()
+
+# ---------------------------------------------------------------- HTML
+
+# 따로 줄이거나 그대로 두는 블록: <script>/<style>/<pre>/<textarea>
+_HTML_BLOCK_PATTERN = (r"<(?P<raw>script|style|pre|textarea)\b(?P<attrs>(?:\"[^\"]*\"|'[^']*'|[^'\">])*)>"
+                       r"(?P<body>.*?)</(?P=raw)\s*>")
+_HTML_BLOCK_RE = re.compile(_HTML_BLOCK_PATTERN, re.S | re.I | re.A)
+# 주석(앞뒤 공백 포함), 블록, 태그, 연속 공백
+_HTML_TOKEN_RE = re.compile(r"(?P<lead>\s*)<!--(?P<comment>.*?)-->(?P<trail>\s*)|" + _HTML_BLOCK_PATTERN
+                            + r"|<[a-zA-Z/!](?:\"[^\"]*\"|'[^']*'|[^'\">])*>|\s{2,}|[^\S ]", re.S | re.I | re.A)
+# 따옴표 속성값 안에 줄바꿈/연속 공백이 있으면 (흔치 않음) 태그를 하나씩 나눠서 처리
+_HTML_QUOTED_SPACE_RE = re.compile(r"""=\s*(?:"[^"]*?(?:\s\s|[^\S ])[^"]*"|'[^']*?(?:\s\s|[^\S ])[^']*')""", re.A)
+_HTML_TAG_PART_RE = re.compile(r"(\"[^\"]*\"|'[^']*')|(\s+)|([^\"'\s]+)", re.A)
+_HTML_TAG_SPACE_RE = re.compile(r"\s\s|[^\S ]", re.A)
+_SPACE_RUN_RE = re.compile(r"[ \t\r\f\v]{2,}|[\t\r\f\v]")
+# HTML 공백 (&nbsp; 같은 유니코드 공백은 글자로 취급해 그대로 둠 - 위 정규식들도 re.A)
+_HTML_SPACE = " \t\n\r\f\v"
+_SCRIPT_TYPE_RE = re.compile(r"""\btype\s*=\s*["']?([^"'\s>]+)""", re.I)
+_JS_TYPES = {"text/javascript", "application/javascript", "module", "application/ld+json", "application/json"}
+
+def _collapse_space(space):
+    return "\n" if "\n" in space else " "
+
+def _collapse_text(text):
+    """연속 공백을 하나로 (줄바꿈이 있으면 줄바꿈 하나, 없으면 빈칸 하나). 줄 단위 strip이 정규식보다 훨씬 빠름"""
+    middle = text.strip(_HTML_SPACE)
+    if not middle: return _collapse_space(text) if text else ""
+    lead = text[:len(text) - len(text.lstrip(_HTML_SPACE))]
+    trail = text[len(text.rstrip(_HTML_SPACE)):]
+    body = "\n".join(line for line in (line.strip(_HTML_SPACE) for line in middle.split("\n")) if line)
+    body = _SPACE_RUN_RE.sub(" ", body)
+    return (_collapse_space(lead) if lead else "") + body + (_collapse_space(trail) if trail else "")
+
+def _minify_tag(tag):
+    """태그 안 (따옴표 밖) 공백 묶기. 속성값은 그대로"""
+    if not _HTML_TAG_SPACE_RE.search(tag): return tag
+    return "".join(quoted or (_collapse_space(whitespace) if whitespace else text)
+                   for quoted, whitespace, text in _HTML_TAG_PART_RE.findall(tag))
+
+def _minify_html_block(match):
+    name, attrs, body = match.group("raw"), match.group("attrs"), match.group("body")
+    if name.lower() == "script":
+        script_type = _SCRIPT_TYPE_RE.search(attrs)
+        if script_type is None or script_type.group(1).lower() in _JS_TYPES:
+            body = minify_js(body)
+    elif name.lower() == "style":
+        body = minify_css(body)
+    return _minify_tag(f"<{name}{attrs}>") + body + f"</{name}>"  # pre/textarea 본문은 그대로
+
+def _minify_html_token(match):
+    token = match.group()
+    if match.group("comment") is not None:
+        # 주석은 앞뒤 공백과 함께 공백 하나로 (조건부 주석은 남김)
+        if match.group("comment").startswith("[if"): return token
+        space = match.group("lead") + match.group("trail")
+        return _collapse_space(space) if space else ""
+    if match.group("raw"): return _minify_html_block(match)
+    if token[0] != "<": return _collapse_space(token)  # 글 사이 공백
+    return _minify_tag(token)
+
+def minify_html(source):
+    if "<!--" in source or _HTML_QUOTED_SPACE_RE.search(source):
+        return _HTML_TOKEN_RE.sub(_minify_html_token, source).strip() + "\n"
+    # 빠른 길 (카드 조각은 대부분 이쪽): 주석이 없고 속성값을 건드릴 일이 없으므로
+    # 블록 사이는 태그/글 구분 없이 통째로 공백만 묶음 (결과는 위와 같음)
+    out, pos = [], 0
+    for match in _HTML_BLOCK_RE.finditer(source):
+        out.append(_collapse_text(source[pos:match.start()]))
+        out.append(_minify_html_block(match))
+        pos = match.end()
+    out.append(_collapse_text(source[pos:]))
+    return "".join(out).strip() + "\n"
+
+_MINIFIERS = {".html": minify_html, ".css": minify_css, ".js": minify_js}
+
+def minify_bytes(path, content):
+    """확장자에 맞게 줄인 바이트 (HTML/CSS/JS가 아니면 그대로)"""
+    minifier = _MINIFIERS.get(os.path.splitext(path)[1].lower())
+    if minifier is None: return content
+    return minifier(content.decode("utf-8")).encode("utf-8")
+
+# ---------------------------------------------------------------- 압축본 캐시
+
+def content_digest(content):
+    return hashlib.sha256(content).hexdigest()
+
+def precompressed_path(digest, encoding, cache_dir=PRECOMPRESS_CACHE_DIR):
+    """encoding: 'gz' 또는 'br'"""
+    return os.path.join(cache_dir, f"{digest}.{encoding}")
+
+def cached_gzip(content, cache_dir=PRECOMPRESS_CACHE_DIR):
+    """이 내용의 gzip 압축본이 캐시에 있으면 그 바이트, 없으면 None (deploy_site.py용)"""
+    try:
+        with open(precompressed_path(content_digest(content), "gz", cache_dir), "rb") as f:
+            return f.read()
+    except OSError:
+        return None
+
+def gzip_bytes(content):
+    # mtime=0: 같은 내용이면 압축본도 바이트까지 같음 (배포 해시가 빌드마다 바뀌지 않게)
+    return gzip.compress(content, compresslevel=GZIP_LEVEL, mtime=0)
+
+def _write_atomic(path, content):
+    with open(path + ".tmp", "wb") as f:
+        f.write(content)
+    os.replace(path + ".tmp", path)
+
+def _compress(job):
+    digest, content, encodings, cache_dir = job
+    sizes = {}
+    for encoding in encodings:
+        compressed = gzip_bytes(content) if encoding == "gz" else brotli.compress(content, quality=BROTLI_QUALITY)
+        _write_atomic(precompressed_path(digest, encoding, cache_dir), compressed)
+        sizes[encoding] = len(compressed)
+    return sizes
+
+def minifier_version():
+    """줄이기 규칙이 바뀌면 (이 파일이 바뀌면) 원본 -> 줄인 결과 캐시를 버림"""
+    with open(__file__, "rb") as f:
+        return content_digest(f.read())[:16]
+
+def _load_index(cache_dir):
+    try:
+        with open(os.path.join(cache_dir, INDEX_FILE), "r", encoding="utf-8") as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return index.get("minified", {}) if index.get("version") == minifier_version() else {}
+
+def optimize_files(paths, root=".", cache_dir=PRECOMPRESS_CACHE_DIR, workers=None):
+    """
+    paths(root 기준 상대 경로)를 제자리에서 줄이고 압축본을 캐시에 만든 뒤 파일별 결과 목록을 돌려줌.
+    결과: {"path", "original", "minified", "gz", "br", "cached"} (br은 brotli가 없으면 None)
+    원본 해시 -> 줄인 결과 해시도 기억해 두고, 이전 빌드와 같은 원본은 줄이지 않고 캐시의 gzip을 풀어 씀.
+    이번에 쓰지 않은 캐시 압축본은 지웁니다.
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    encodings = ("gz", "br") if brotli is not None else ("gz",)
+    index, new_index = _load_index(cache_dir), {}
+    results, jobs, used = [], {}, set()
+    for rel_path in paths:
+        path = os.path.join(root, rel_path)
+        with open(path, "rb") as f:
+            original = f.read()
+        source_digest = content_digest(original)
+        digest = index.get(source_digest)
+        if digest == source_digest:
+            content = original
+        elif digest is not None and os.path.exists(precompressed_path(digest, "gz", cache_dir)):
+            with open(precompressed_path(digest, "gz", cache_dir), "rb") as f:
+                content = gzip.decompress(f.read())
+        else:
+            content = minify_bytes(path, original)
+            digest = content_digest(content)
+        if content != original: _write_atomic(path, content)
+        new_index[source_digest] = new_index[digest] = digest  # 줄인 파일을 다시 넣어도 그대로
+        used.add(digest)
+        missing = tuple(e for e in encodings if not os.path.exists(precompressed_path(digest, e, cache_dir)))
+        if missing and digest not in jobs: jobs[digest] = (digest, content, missing, cache_dir)
+        results.append({"path": rel_path.replace(os.sep, "/"), "original": len(original),
+                        "minified": len(content), "digest": digest, "cached": not missing})
+
+    # zlib/brotli는 압축 중 GIL을 놓으므로 스레드로 나눠 돌림
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count() or 1) as pool:
+        list(pool.map(_compress, jobs.values()))
+
+    for result in results:
+        digest = result.pop("digest")
+        for encoding in ("gz", "br"):
+            path = precompressed_path(digest, encoding, cache_dir)
+            result[encoding] = os.path.getsize(path) if os.path.exists(path) else None
+
+    # 이번에 쓴 결과로 가는 이전 원본 항목도 남김 (줄인 파일만 다시 넣은 실행 뒤에도 다음 빌드가 캐시를 씀)
+    for source_digest, digest in index.items():
+        if digest in used: new_index.setdefault(source_digest, digest)
+    for filename in os.listdir(cache_dir):
+        if filename not in (INDEX_FILE, REPORT_FILE) and filename.split(".", 1)[0] not in used:
+            os.remove(os.path.join(cache_dir, filename))
+    with open(os.path.join(cache_dir, INDEX_FILE), "w", encoding="utf-8") as f:
+        json.dump({"version": minifier_version(), "minified": new_index}, f, separators=(",", ":"))
+    with open(os.path.join(cache_dir, REPORT_FILE), "w", encoding="utf-8") as f:
+        json.dump(results, f, ensure_ascii=False, indent=1)
+    return results
+
+def _format_size(size):
+    return "-" if size is None else f"{size / 1024:,.1f}KB"
+
+def _sum(rows, key):
+    values = [row[key] for row in rows]
+    return None if None in values else sum(values)
+
+def report(results, group_dirs=("shards",)):
+    """파일별 줄어든 바이트 출력. group_dirs 아래 파일은 폴더 합계 한 줄로 (전체 목록은 캐시 폴더의 report.json)"""
+    rows, groups = [], {}
+    for result in results:
+        top, _, rest = result["path"].partition("/")
+        if top in group_dirs and rest: groups.setdefault(top, []).append(result)
+        else: rows.append(result)
+    for top, members in groups.items():
+        row = {key: _sum(members, key) for key in ("original", "minified", "gz", "br")}
+        row.update(path=f"{top}/ ({len(members)} files)", cached=all(m["cached"] for m in members))
+        rows.append(row)
+
+    for row in rows:
+        saved = 1 - row["minified"] / row["original"] if row["original"] else 0
+        print(f"[MINIFY] {row['path']:<30} {_format_size(row['original']):>11} -> {_format_size(row['minified']):>11} "
+              f"(-{saved:.0%}) | gzip {_format_size(row['gz']):>10} | br {_format_size(row['br']):>10}"
+              + (" (cached)" if row["cached"] else ""))
+    total = {key: _sum(rows, key) for key in ("original", "minified", "gz", "br")}
+    smallest = total["br"] if total["br"] is not None else total["gz"]
+    print(f"[MINIFY] total {_format_size(total['original'])} -> minified {_format_size(total['minified'])}, "
+          f"gzip {_format_size(total['gz'])}, br {_format_size(total['br'])} "
+          f"({1 - smallest / total['original'] if total['original'] else 0:.0%} smaller over the wire)")
+    if brotli is None:
+        print("[INFO] brotli not installed: gzip variants only (pip install brotli)")
@@ -0,0 +1,190 @@
+"""
+정적 이미지 자산 최적화 (빌드 단계: 카드 캐시/리포트 생성 전)
+assets/의 favicon.png(1024px), logo_placeholder.png(1024px, 1.2MB), og_image.png는 그대로 두면 페이지마다 원본 크기로
+내려갑니다. 쓰는 곳에 맞는 크기로 만들어 assets/img/<원본>-<용도>.<해시>.<확장자> 에 두고, 페이지(build_site.py)는 이 URL을 씁니다.
+- favicon: 16/32px 아이콘 + 180px apple-touch-icon
+- 카드 자리 이미지(logo_placeholder): 카드 2x 크기 PNG + WebP/AVIF (<picture>로 고름), 웹 앱 manifest 아이콘 192/512px
+  (manifest.json은 같은 URL에 아이콘만 바꿔 다시 씀)
+- OG 이미지: 크기 그대로 무손실 재압축만 (공유 미리보기 크롤러는 PNG/JPEG만 확실히 읽음)
+- PNG는 무손실로만 다시 압축 (알파가 전부 불투명하면 RGB, 색이 256개 이하면 팔레트) 후 가장 작은 것. 원본 크기 그대로면 원본보다 커지지 않음
+- WebP/AVIF는 같은 용도의 PNG보다 작을 때만 만듦. Pillow에 AVIF 인코더가 없으면 WebP만
+- 캐시: 원본 내용 해시 + 만드는 방식(이 파일, Pillow 버전)이 같으면 .cache/static_images 의 결과를 그대로 복사
+- Pillow가 없거나 원본이 없으면 빈 결과 -> 페이지는 원래 경로를 그대로 씀
+"""
+import hashlib
+import io
+import json
+import os
+import shutil
+
+try:
+    import PIL
+    from PIL import Image
+except ImportError:  # pip install pillow 가 없으면 원본 이미지를 그대로 씀
+    PIL = Image = None
+
+SOURCE_DIR = "assets"
+STATIC_IMAGE_DIR = "assets/img"
+STATIC_IMAGE_CACHE_DIR = os.environ.get("STATIC_IMAGE_CACHE_DIR", ".cache/static_images")
+HASH_LENGTH = 10
+# 원본 -> (용도, 긴 변 크기(None = 원본 크기), 형식). 첫 용도가 원본 대신 페이지에서 주로 받는 파일 (절약량 계산용)
+VARIANTS = {
+    "favicon.png": (("icon-32", 32, "png"), ("icon-16", 16, "png"), ("apple-touch-icon", 180, "png")),
+    "logo_placeholder.png": (("card", 400, "png"), ("card", 400, "webp"), ("card", 400, "avif"),
+                             ("icon-192", 192, "png"), ("icon-512", 512, "png")),
+    "og_image.png": (("og", None, "png"),),
+}
+ENCODE_OPTIONS = {
+    "webp": ("WEBP", {"quality": 85, "method": 6}),
+    "avif": ("AVIF", {"quality": 60}),
+}
+MANIFEST_FILE = "manifest.json"
+MANIFEST_ICONS = (("logo_placeholder-icon-192.png", "192x192"), ("logo_placeholder-icon-512.png", "512x512"))
+
+def variant_name(source, purpose, ext):
+    """URL 표의 키: 'favicon-icon-32.png'"""
+    return f"{os.path.splitext(source)[0]}-{purpose}.{ext}"
+
+def avif_supported():
+    Image.init()
+    return "AVIF" in Image.SAVE
+
+def recipe_version():
+    """이 파일 + Pillow 버전 + AVIF 지원 여부 (바뀌면 캐시를 다시 만듦)"""
+    digest = hashlib.sha256()
+    with open(__file__, "rb") as f:
+        digest.update(f.read())
+    digest.update(f"{PIL.__version__}:{avif_supported()}".encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+def _save(image, kind, **options):
+    buffer = io.BytesIO()
+    image.save(buffer, kind, **options)
+    return buffer.getvalue()
+
+def png_bytes(image):
+    """무손실 PNG 후보(그대로 / 불투명 알파 제거 / 팔레트) 중 가장 작은 것"""
+    if image.mode == "RGBA" and image.getchannel("A").getextrema() == (255, 255):
+        image = image.convert("RGB")
+    elif image.mode not in ("RGB", "RGBA", "L", "LA"):
+        image = image.convert("RGBA")
+    candidates = [image]
+    if image.mode == "RGB" and image.getcolors(256) is not None:
+        palette = image.convert("P", palette=Image.Palette.ADAPTIVE, colors=256)
+        if palette.convert("RGB").tobytes() == image.tobytes(): candidates.append(palette)
+    return min((_save(candidate, "PNG", optimize=True) for candidate in candidates), key=len)
+
+def render_variants(source, content):
+    """원본 바이트 -> {URL 표 키: 바이트}"""
+    outputs = {}
+    with Image.open(io.BytesIO(content)) as original:
+        original.load()
+        for purpose, size, ext in VARIANTS[source]:
+            image = original.copy()
+            if size is not None: image.thumbnail((size, size), Image.LANCZOS)
+            png_name = variant_name(source, purpose, "png")
+            if ext == "png":
+                data = png_bytes(image)
+                # 크기를 바꾸지 않았으면 원본 PNG보다 커지지 않게
+                if image.size == original.size and len(content) <= len(data): data = content
+            else:
+                if ext == "avif" and not avif_supported(): continue
+                kind, options = ENCODE_OPTIONS[ext]
+                data = _save(image, kind, **options)
+                if png_name in outputs and len(data) >= len(outputs[png_name]): continue
+            outputs[variant_name(source, purpose, ext)] = data
+    return outputs
+
+def hashed_filename(name, data):
+    stem, ext = os.path.splitext(name)
+    return f"{stem}.{hashlib.sha256(data).hexdigest()[:HASH_LENGTH]}{ext}"
+
+def _write(path, data):
+    with open(path + ".tmp", "wb") as f:
+        f.write(data)
+    os.replace(path + ".tmp", path)
+
+def optimize_static_images(root=".", cache_dir=STATIC_IMAGE_CACHE_DIR):
+    """
+    root/assets의 원본으로 root/assets/img 를 채우고 ({URL 표 키: URL}, 결과 목록)을 돌려줌.
+    결과: {"source", "bytes", "outputs": {키: 바이트 수}, "cached"}. 이전 빌드에서 만든 안 쓰는 파일은 지움
+    """
+    sources = [name for name in VARIANTS if os.path.exists(os.path.join(root, SOURCE_DIR, name))]
+    if Image is None or not sources: return {}, []
+    out_dir = os.path.join(root, STATIC_IMAGE_DIR)
+    files_dir = os.path.join(cache_dir, "files")
+    index_path = os.path.join(cache_dir, "index.json")
+    os.makedirs(out_dir, exist_ok=True)
+    os.makedirs(files_dir, exist_ok=True)
+    try:
+        with open(index_path, "r", encoding="utf-8") as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        index = {}
+    version = recipe_version()
+
+    urls, results, new_index = {}, [], {}
+    for source in sources:
+        with open(os.path.join(root, SOURCE_DIR, source), "rb") as f:
+            content = f.read()
+        key = f"{hashlib.sha256(content).hexdigest()}:{version}"
+        entry = index.get(source)
+        cached = (entry is not None and entry["key"] == key
+                  and all(os.path.exists(os.path.join(files_dir, filename)) for filename in entry["files"].values()))
+        if not cached:
+            entry = {"key": key, "files": {}}
+            for name, data in render_variants(source, content).items():
+                filename = hashed_filename(name, data)
+                _write(os.path.join(files_dir, filename), data)
+                entry["files"][name] = filename
+        new_index[source] = entry
+        outputs = {}
+        for name, filename in entry["files"].items():
+            target = os.path.join(out_dir, filename)
+            if not os.path.exists(target): shutil.copyfile(os.path.join(files_dir, filename), target)
+            urls[name] = f"{STATIC_IMAGE_DIR}/{filename}"
+            outputs[name] = os.path.getsize(target)
+        results.append({"source": source, "bytes": len(content), "outputs": outputs, "cached": cached})
+
+    manifest_url = write_manifest(root, urls)
+    if manifest_url: urls[MANIFEST_FILE] = manifest_url
+    current = {os.path.basename(url) for url in urls.values()}
+    for filename in os.listdir(out_dir):
+        if filename not in current: os.remove(os.path.join(out_dir, filename))
+    used = {filename for entry in new_index.values() for filename in entry["files"].values()}
+    for filename in os.listdir(files_dir):
+        if filename not in used: os.remove(os.path.join(files_dir, filename))
+    with open(index_path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(new_index, f, ensure_ascii=False, indent=1)
+    os.replace(index_path + ".tmp", index_path)
+    return urls, results
+
+def write_manifest(root, urls):
+    """
+    웹 앱 manifest.json의 아이콘을 만든 크기별 PNG로 바꿔 그 자리(사이트 루트 /manifest.json)에 다시 씀 (URL 반환).
+    manifest URL은 그대로 둠: sw.js가 /manifest.json을 미리 받아 두고, 설치된 앱도 manifest URL로 찾기 때문.
+    아이콘만 바꾸므로 여러 번 실행해도 결과가 같고, 바뀐 게 없으면 쓰지 않음
+    """
+    path = os.path.join(root, MANIFEST_FILE)
+    if not os.path.exists(path) or not all(name in urls for name, _ in MANIFEST_ICONS): return None
+    with open(path, "rb") as f:
+        current = f.read()
+    manifest = json.loads(current.decode("utf-8"))
+    manifest["icons"] = [{"src": urls[name], "sizes": sizes, "type": "image/png", "purpose": "any maskable"}
+                         for name, sizes in MANIFEST_ICONS]
+    data = json.dumps(manifest, ensure_ascii=False, indent=4).encode("utf-8")
+    if data != current: _write(path, data)
+    return MANIFEST_FILE
+
+def report(results):
+    """원본별 결과 크기와, 페이지가 원본 대신 받는 파일 기준 절약량 (같은 용도는 가장 작은 형식)"""
+    saved = 0
+    for result in results:
+        primary = VARIANTS[result["source"]][0][0]
+        served = min((size for name, size in result["outputs"].items()
+                      if name.startswith(variant_name(result["source"], primary, ""))), default=result["bytes"])
+        saved += result["bytes"] - served
+        outputs = ", ".join(f"{name.split('-', 1)[1]} {size / 1024:.1f}KB" for name, size in result["outputs"].items())
+        print(f"[ASSET] {result['source']} {result['bytes'] / 1024:.1f}KB -> {outputs}"
+              + (" (cached)" if result["cached"] else ""))
+    if results: print(f"[INFO] Static images: {saved / 1024:.1f}KB saved per page that loads them")
@@ -0,0 +1,289 @@
+"""
+상품 이미지 썸네일 (빌드 단계: process_data 다음, generate_report 전)
+카드가 쇼핑몰 CDN의 원본 이미지를 그대로 걸지 않도록, 상품 image URL을 한 번만 받아 내용 해시로 보관하고
+작은 WebP/JPEG 썸네일(1x, 2x)을 만들어 thumbs/ 에 둡니다. 카드는 <picture> + srcset으로 이 파일을 씁니다.
+- 원본: .cache/images/originals/<sha256>  (URL -> 해시는 .cache/images/index.json)
+- 썸네일: .cache/images/thumbs/<해시 앞 16자>-<크기>.<webp|jpg>  -> 빌드 폴더 thumbs/ 로 복사
+- 증분: 이미 받은 URL은 다시 받지 않고, 이미 만든 썸네일은 다시 만들지 않음. 안 쓰는 파일은 지움
+- 받기/만들기는 스레드 풀 (사이트별 동시 요청 수 제한). 실패한 URL은 하루 뒤에 다시 시도
+- 자리표시(placeholder): 원본을 3x3 색 격자(12비트 색 9개 = 27자)로 줄여 카드 데이터에 넣음 -> 이미지가 오기 전
+  카드 배경에 흐린 그림을 바로 그림 (요청 없음). 해시별로 index.json에 보관해 바뀐 이미지만 계산
+- Pillow가 없으면 이 단계는 건너뛰고 카드는 원래 이미지 URL을 씀. NumPy가 없으면 자리표시는 Pillow로 계산
+  (배포 워크플로(.github/workflows/deploy.yml)는 NumPy를 설치하므로 실제 빌드는 NumPy 경로. Pillow 경로는 로컬용 대체)
+테스트/벤치마크는 DirectoryFetcher로 네트워크 없이 로컬 폴더의 이미지를 씁니다. (tools/verify_thumbnails.py)
+"""
+import hashlib
+import io
+import json
+import os
+import shutil
+import threading
+import time
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # pip install pillow 가 없으면 썸네일 없이 원래 이미지 URL 사용
+    Image = ImageOps = None
+try:
+    import numpy as np
+except ImportError:  # pip install numpy 가 없으면 자리표시 색은 Pillow 축소로 계산 (sRGB 평균)
+    np = None
+
+THUMB_DIR = "thumbs"
+IMAGE_CACHE_DIR = os.environ.get("IMAGE_CACHE_DIR", ".cache/images")
+# 카드 이미지 영역은 최대 200px 정도 -> 1x / 2x
+THUMB_SIZES = (200, 400)
+# (확장자, Pillow 형식, 저장 옵션)
+THUMB_FORMATS = (
+    ("webp", "WEBP", {"quality": 80, "method": 6}),
+    ("jpg", "JPEG", {"quality": 82, "optimize": True, "progressive": True}),
+)
+THUMB_ID_LENGTH = 16
+THUMB_WORKERS = int(os.environ.get("THUMB_WORKERS", "16"))
+FETCH_PER_HOST = 4
+FETCH_TIMEOUT = 15
+FETCH_MAX_BYTES = 20 * 1024 * 1024
+FAILED_RETRY_SECONDS = 24 * 3600
+INDEX_VERSION = 1
+# 자리표시 색 격자 (PLACEHOLDER_GRID x PLACEHOLDER_GRID). 계산 방식이 바뀌면 저장된 값은 다시 계산
+PLACEHOLDER_GRID = 3
+PLACEHOLDER_SAMPLE = 30  # 격자 계산 전에 줄이는 크기 (PLACEHOLDER_GRID의 배수)
+PLACEHOLDER_VERSION = f"grid{PLACEHOLDER_GRID}-{'numpy' if np is not None else 'pillow'}"
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36"
+
+def thumb_path(thumb_id, size, ext, folder=THUMB_DIR):
+    return f"{folder}/{thumb_id}-{size}.{ext}"
+
+def thumb_files(thumb_id):
+    return [os.path.basename(thumb_path(thumb_id, size, ext)) for size in THUMB_SIZES for ext, _, _ in THUMB_FORMATS]
+
+class UrlFetcher:
+    """URL에서 이미지 바이트를 받음. 사이트(호스트)마다 동시에 FETCH_PER_HOST개까지만 요청"""
+    def __init__(self, per_host=FETCH_PER_HOST, timeout=FETCH_TIMEOUT):
+        self.per_host = per_host
+        self.timeout = timeout
+        self.hosts = {}
+        self.lock = threading.Lock()
+
+    def _host_slot(self, url):
+        host = urllib.parse.urlsplit(url).netloc
+        with self.lock:
+            if host not in self.hosts: self.hosts[host] = threading.Semaphore(self.per_host)
+            return self.hosts[host]
+
+    def fetch(self, url):
+        request = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
+        with self._host_slot(url):
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                data = response.read(FETCH_MAX_BYTES + 1)
+        if len(data) > FETCH_MAX_BYTES: raise ValueError("image too large")
+        return data
+
+class DirectoryFetcher:
+    """네트워크 없이 로컬 폴더에서 URL 경로의 파일 이름으로 이미지를 찾음 (테스트/벤치마크용)"""
+    def __init__(self, directory):
+        self.directory = directory
+
+    def fetch(self, url):
+        name = os.path.basename(urllib.parse.urlsplit(url).path)
+        with open(os.path.join(self.directory, name), "rb") as f:
+            return f.read()
+
+def _flatten(image):
+    """방향(EXIF)을 바로잡은 RGB 이미지. 투명 배경은 카드 배경과 같은 흰색으로"""
+    image = ImageOps.exif_transpose(image)
+    if image.mode in ("RGBA", "LA", "P"):
+        image = image.convert("RGBA")
+        background = Image.new("RGB", image.size, "white")
+        background.paste(image, mask=image.getchannel("A"))
+        return background
+    return image if image.mode == "RGB" else image.convert("RGB")
+
+def _render_thumbnails(original, thumb_id, out_dir):
+    """원본 바이트 -> 크기/형식별 썸네일 파일"""
+    with Image.open(io.BytesIO(original)) as image:
+        image = _flatten(image)
+        for size in sorted(THUMB_SIZES, reverse=True):
+            # 큰 것부터 줄여 가며 만듦 (원본보다 크게 늘리지는 않음)
+            image.thumbnail((size, size), Image.LANCZOS)
+            for ext, kind, options in THUMB_FORMATS:
+                path = os.path.join(out_dir, os.path.basename(thumb_path(thumb_id, size, ext)))
+                image.save(path + ".tmp", kind, **options)
+                os.replace(path + ".tmp", path)
+
+def image_placeholder(original):
+    """
+    원본 바이트 -> 자리표시 문자열: 3x3 격자 칸별 평균색을 12비트('rgb' 16진 3자리)로, 위 줄부터 27자
+    NumPy가 있으면 선형 밝기로 평균 (흰 배경과 진한 상품이 섞인 칸이 너무 어두워지지 않음)
+    """
+    grid = PLACEHOLDER_GRID
+    with Image.open(io.BytesIO(original)) as image:
+        image.draft("RGB", (PLACEHOLDER_SAMPLE * 2, PLACEHOLDER_SAMPLE * 2))  # JPEG는 작게 디코딩
+        image = _flatten(image)
+        if np is None:
+            colors = list(image.resize((grid, grid), Image.BOX).getdata())
+        else:
+            pixels = np.asarray(image.resize((PLACEHOLDER_SAMPLE, PLACEHOLDER_SAMPLE), Image.BOX), dtype=np.float32) / 255
+            linear = np.where(pixels <= 0.04045, pixels / 12.92, ((pixels + 0.055) / 1.055) ** 2.4)
+            cell = PLACEHOLDER_SAMPLE // grid
+            mean = linear.reshape(grid, cell, grid, cell, 3).mean(axis=(1, 3))
+            srgb = np.where(mean <= 0.0031308, mean * 12.92, 1.055 * mean ** (1 / 2.4) - 0.055)
+            colors = np.rint(np.clip(srgb, 0, 1) * 255).astype(int).reshape(-1, 3).tolist()
+    return "".join(f"{(value * 15 + 127) // 255:x}" for color in colors for value in color)
+
+class ThumbnailStore:
+    """
+    image URL -> 썸네일 id (원본 sha256 앞 16자). update()가 필요한 것만 받고 만든 뒤
+    {URL: id}를 돌려줍니다. 원본을 받지 못했거나 이미지로 읽을 수 없는 URL은 빠집니다.
+    id별 자리표시 문자열은 placeholders에 있습니다.
+    """
+    def __init__(self, cache_dir=IMAGE_CACHE_DIR):
+        self.cache_dir = cache_dir
+        self.originals_dir = os.path.join(cache_dir, "originals")
+        self.thumbs_dir = os.path.join(cache_dir, "thumbs")
+        self.index_path = os.path.join(cache_dir, "index.json")
+        self.urls = {}  # URL -> {"sha": ...} 또는 {"failed_at": ..., "error": ...}
+        self.placeholders = {}  # 썸네일 id -> 자리표시 문자열
+        self.fetched = self.failed = self.encoded = self.reused = self.placeholders_computed = 0
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                index = json.load(f)
+            if index.get("version") == INDEX_VERSION: self.urls = index.get("urls", {})
+            if index.get("placeholder_version") == PLACEHOLDER_VERSION: self.placeholders = index.get("placeholders", {})
+        except (OSError, ValueError):
+            pass
+
+    def _fetch_one(self, fetcher, url, now):
+        try:
+            data = fetcher.fetch(url)
+            sha = hashlib.sha256(data).hexdigest()
+            path = os.path.join(self.originals_dir, sha)
+            if not os.path.exists(path):
+                # 내용이 같은 URL 여러 개를 동시에 받을 수 있으므로 임시 파일은 스레드마다 따로
+                temp_path = f"{path}.{threading.get_ident()}.tmp"
+                with open(temp_path, "wb") as f:
+                    f.write(data)
+                os.replace(temp_path, path)
+            return url, {"sha": sha}
+        except Exception as e:  # 네트워크/HTTP 오류, 없는 파일 등은 모두 실패로 기록하고 다음 빌드에 재시도
+            return url, {"failed_at": int(now), "error": f"{type(e).__name__}: {e}"[:200]}
+
+    def _encode_one(self, sha):
+        thumb_id = sha[:THUMB_ID_LENGTH]
+        try:
+            with open(os.path.join(self.originals_dir, sha), "rb") as f:
+                _render_thumbnails(f.read(), thumb_id, self.thumbs_dir)
+            return sha, None
+        except Exception as e:  # 이미지가 아닌 응답(HTML 오류 페이지 등), 깨진 파일
+            for name in thumb_files(thumb_id):
+                if os.path.exists(os.path.join(self.thumbs_dir, name)): os.remove(os.path.join(self.thumbs_dir, name))
+            return sha, f"{type(e).__name__}: {e}"[:200]
+
+    def _placeholder_one(self, sha):
+        try:
+            with open(os.path.join(self.originals_dir, sha), "rb") as f:
+                return sha, image_placeholder(f.read())
+        except Exception:  # 썸네일은 만들었으니 자리표시만 빠짐 (다음 빌드에 다시 시도)
+            return sha, None
+
+    def update(self, image_urls, fetcher=None, workers=THUMB_WORKERS, now=None):
+        if Image is None: return {}
+        fetcher = fetcher or UrlFetcher()
+        now = time.time() if now is None else now
+        os.makedirs(self.originals_dir, exist_ok=True)
+        os.makedirs(self.thumbs_dir, exist_ok=True)
+        urls = sorted({url for url in image_urls if url and url.startswith(("http://", "https://"))})
+
+        def needs_fetch(url):
+            entry = self.urls.get(url)
+            if entry is None: return True
+            if "sha" in entry: return not os.path.exists(os.path.join(self.originals_dir, entry["sha"]))
+            return now - entry.get("failed_at", 0) >= FAILED_RETRY_SECONDS
+
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            for url, entry in pool.map(lambda url: self._fetch_one(fetcher, url, now), [u for u in urls if needs_fetch(u)]):
+                self.urls[url] = entry
+                if "sha" in entry: self.fetched += 1
+                else: self.failed += 1
+
+            shas = sorted({self.urls[url]["sha"] for url in urls if "sha" in self.urls.get(url, {})})
+            missing = [sha for sha in shas
+                       if not all(os.path.exists(os.path.join(self.thumbs_dir, name)) for name in thumb_files(sha[:THUMB_ID_LENGTH]))]
+            self.reused = len(shas) - len(missing)
+            bad = set()
+            # Pillow는 축소/인코딩 중 GIL을 놓으므로 스레드로 나눠 돌림
+            for sha, error in pool.map(self._encode_one, missing):
+                if error is None:
+                    self.encoded += 1
+                else:
+                    bad.add(sha)
+                    for url in urls:
+                        if self.urls.get(url, {}).get("sha") == sha:
+                            self.urls[url] = {"failed_at": int(now), "error": error}
+                    self.failed += 1
+
+            shas = [sha for sha in shas if sha not in bad]
+            for sha, placeholder in pool.map(self._placeholder_one,
+                                             [sha for sha in shas if sha[:THUMB_ID_LENGTH] not in self.placeholders]):
+                if placeholder is None: continue
+                self.placeholders[sha[:THUMB_ID_LENGTH]] = placeholder
+                self.placeholders_computed += 1
+
+        result = {url: self.urls[url]["sha"][:THUMB_ID_LENGTH] for url in urls if "sha" in self.urls.get(url, {})}
+        self._prune(set(urls), set(shas))
+        self._save()
+        return result
+
+    def _prune(self, urls, shas):
+        """이번 카탈로그에 없는 URL 기록/원본/썸네일은 지움"""
+        self.urls = {url: entry for url, entry in self.urls.items() if url in urls}
+        thumb_ids = {sha[:THUMB_ID_LENGTH] for sha in shas}
+        self.placeholders = {thumb_id: value for thumb_id, value in self.placeholders.items() if thumb_id in thumb_ids}
+        for name in os.listdir(self.originals_dir):
+            if name not in shas: os.remove(os.path.join(self.originals_dir, name))
+        keep = {name for sha in shas for name in thumb_files(sha[:THUMB_ID_LENGTH])}
+        for name in os.listdir(self.thumbs_dir):
+            if name not in keep: os.remove(os.path.join(self.thumbs_dir, name))
+
+    def _save(self):
+        with open(self.index_path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump({"version": INDEX_VERSION, "urls": self.urls,
+                       "placeholder_version": PLACEHOLDER_VERSION, "placeholders": self.placeholders}, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(self.index_path + ".tmp", self.index_path)
+
+    def publish(self, thumb_ids, out_dir="."):
+        """쓰는 썸네일만 out_dir/thumbs/ 로 복사 (이미 있으면 그대로), 나머지는 지움"""
+        folder = os.path.join(out_dir, THUMB_DIR)
+        os.makedirs(folder, exist_ok=True)
+        keep = {name for thumb_id in set(thumb_ids) for name in thumb_files(thumb_id)}
+        for name in keep:
+            target = os.path.join(folder, name)
+            if not os.path.exists(target): shutil.copyfile(os.path.join(self.thumbs_dir, name), target)
+        for name in os.listdir(folder):
+            if name not in keep: os.remove(os.path.join(folder, name))
+
+    def report(self):
+        print(f"[INFO] Thumbnails: {self.fetched} fetched, {self.encoded} encoded, {self.reused} reused, "
+              f"{self.failed} failed, {self.placeholders_computed} placeholders computed")
+
+def thumb_srcset(thumb_id, ext):
+    """'thumbs/<id>-200.webp, thumbs/<id>-400.webp 2x' (첫 크기가 1x)"""
+    base = THUMB_SIZES[0]
+    return ", ".join(thumb_path(thumb_id, size, ext) + ("" if size == base else f" {size / base:g}x")
+                     for size in THUMB_SIZES)
+
+def placeholder_css(placeholder):
+    """
+    자리표시 문자열 -> CSS background 값 (격자 한 줄 = 가로 그라데이션 한 겹). 카드에서는 흐리게 그림 (main.css)
+    assets/catalog.js placeholderCss와 같은 값이어야 합니다.
+    """
+    grid = PLACEHOLDER_GRID
+    colors = [f"#{placeholder[i:i + 3]}" for i in range(0, len(placeholder), 3)]
+    rows = []
+    for row in range(grid):
+        position = f"{row * 100 // (grid - 1)}%"
+        rows.append(f"linear-gradient(90deg,{','.join(colors[row * grid:(row + 1) * grid])}) 0 {position}/100% {100 // grid + 1}% no-repeat")
+    return ",".join(rows)
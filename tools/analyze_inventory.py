@@ -1,97 +1,154 @@
-import result
 import difflib
+from collections import Counter
 from datetime import datetime
 
-def analyze_duplicates(data):
+def tokenize(text):
+    """괄호 제거 + 소문자 토큰 집합 (30ml 등 용량 단위는 구분 위해 보존)"""
+    text = text.lower().replace("(", " ").replace(")", " ").replace("[", " ").replace("]", " ")
+    return frozenset(text.split())
+
+def duplicate_score(item, name):
+    """기준(Target) 자동 선정 원칙: 이미지 있음 > 판매처 많음 > 이름 김"""
+    return (1 if item.get('image') else 0) * 100 + len(item['prices']) * 10 + len(name) * 0.1
+
+def make_duplicate_pair(item_a, item_b, ratio):
+    name_a, name_b = item_a['display_name'], item_b['display_name']
+    if duplicate_score(item_b, name_b) >= duplicate_score(item_a, name_a):
+        source, target = item_a, item_b
+    else:
+        source, target = item_b, item_a
+    return {
+        "item_a": source,   # 바뀔 놈
+        "item_b": target,   # 기준이 될 놈
+        "ratio": ratio,
+        "pair_key": tuple(sorted([name_a, name_b]))  # 중복 저장 방지 키
+    }
+
+def char_ratio(counts_a, counts_b, total):
+    """difflib.SequenceMatcher.quick_ratio와 같은 값 (글자 Counter를 미리 만들어 재사용)"""
+    if not total: return 1.0
+    if len(counts_a) > len(counts_b): counts_a, counts_b = counts_b, counts_a
+    matches = sum(min(count, counts_b[ch]) for ch, count in counts_a.items() if ch in counts_b)
+    return 2.0 * matches / total
+
+class UnionFind:
+    def __init__(self):
+        self.parent = {}
+
+    def find(self, x):
+        parent = self.parent
+        parent.setdefault(x, x)
+        root = x
+        while parent[root] != root: root = parent[root]
+        while parent[x] != root: parent[x], x = root, parent[x]
+        return root
+
+    def union(self, a, b):
+        ra, rb = self.find(a), self.find(b)
+        if ra != rb: self.parent[rb] = ra
+
+def cluster_duplicates(duplicates):
+    """
+    중복 쌍을 union-find로 묶어 클러스터 목록을 돌려줍니다. (A-B, B-C -> {A, B, C})
+    각 쌍에는 소속 클러스터 번호('cluster')를 기록합니다.
+    """
+    uf = UnionFind()
+    for d in duplicates:
+        uf.union(d['pair_key'][0], d['pair_key'][1])
+    groups = {}
+    for d in duplicates:
+        groups.setdefault(uf.find(d['pair_key'][0]), set()).update(d['pair_key'])
+    clusters = sorted((sorted(names) for names in groups.values()), key=lambda names: (-len(names), names))
+    cluster_index = {name: i for i, names in enumerate(clusters) for name in names}
+    for d in duplicates:
+        d['cluster'] = cluster_index[d['pair_key'][0]]
+    return clusters
+
+def analyze_duplicates(data, threshold=0.6):
     """
-    데이터 내에서 유사한 상품명을 가진 항목들을 찾습니다.
-    O(N^2) 복잡도이므로 데이터가 매우 많으면 최적화가 필요할 수 있습니다.
+    데이터 내에서 유사한 상품명을 가진 항목들을 찾습니다. (Strict Mode)
+    - 후보 생성: 토큰 역색인. A의 토큰을 모두 가진 상품(= 부분집합 관계 후보)은
+      A의 토큰별 상품 목록의 교집합이므로, 이름 정렬 순서와 상관없이 빠짐없이 찾습니다.
+    - 규칙: 같은 사이트에서 둘 다 팔면 제외, 토큰 집합이 부분집합 관계여야 함
+    - 유사도: 글자 구성 비율 (difflib quick_ratio와 같은 값, 순서 무관). SequenceMatcher.ratio의 상한이라
+      기존 슬라이딩 윈도우가 찾던 쌍(ratio > 0.6)은 모두 포함됩니다.
     """
-    items = list(data.values())
-    keys = list(data.keys())
+    items = sorted(data.values(), key=lambda x: x['display_name'])
     n = len(items)
-    
-    potential_duplicates = []
-    
-    print(f"🔍 총 {n}개 항목에 대해 중복 분석 시작 (Strict Mode)...")
-    
-    # 이름순 정렬
-    items.sort(key=lambda x: x['display_name'])
-    
-    # Sliding Window 방식
-    window_size = 50 
-    
-    for i in range(n):
-        for j in range(1, window_size + 1):
-            if i + j >= n: break
-            
-            item_a = items[i]
-            item_b = items[i+j]
-            
-            name_a = item_a['display_name']
-            name_b = item_b['display_name']
-            
-            # 1. 동일 사이트 충돌 방지
-            sites_a = set(item_a['prices'].keys())
-            sites_b = set(item_b['prices'].keys())
-            if not sites_a.isdisjoint(sites_b):
-                # 교집합이 있으면(같은 사이트에서 둘 다 팔면) 병합 금지
-                continue
+    print(f"🔍 총 {n}개 항목에 대해 중복 분석 시작 (Strict Mode, 토큰 역색인)...")
 
-            # 2. 토큰 집합 포함 관계 확인 (엄격한 기준)
-            # 괄호 제거 및 소문자 해체
-            def tokenize(text):
-                # 30ml 등 용량 단위는 구분 위해 보존하되, 특수문자는 제거
-                text = text.lower().replace("(", " ").replace(")", " ").replace("[", " ").replace("]", " ")
-                tokens = set(text.split())
-                return tokens
+    names = [item['display_name'] for item in items]
+    tokens = [tokenize(name) for name in names]
+    site_sets = [frozenset(item['prices'].keys()) for item in items]
+    char_counts = {}  # 후보 검사를 통과한 상품만 글자 Counter 생성
 
-            tokens_a = tokenize(name_a)
-            tokens_b = tokenize(name_b)
-            
-            # a가 b의 부분집합이거나, b가 a의 부분집합이어야 함
-            # (즉, 다른 맛/단어가 섞여 있으면 안됨)
-            if not (tokens_a.issubset(tokens_b) or tokens_b.issubset(tokens_a)):
-                continue
+    postings = {}
+    for i, toks in enumerate(tokens):
+        for t in toks: postings.setdefault(t, set()).add(i)
+
+    duplicates = []
+    seen_pairs = set()
+    for i in range(n):
+        if not tokens[i]: continue
+        # 작은 목록부터 교집합 -> i의 토큰을 모두 포함하는 상품들
+        lists = sorted((postings[t] for t in tokens[i]), key=len)
+        candidates = lists[0].intersection(*lists[1:]) if len(lists) > 1 else lists[0]
+        for j in candidates:
+            if j == i: continue
+            # 토큰 집합이 같으면 양쪽에서 한 번씩 잡히므로 한쪽만 처리
+            if len(tokens[j]) == len(tokens[i]) and j < i: continue
+            # 1. 동일 사이트 충돌 방지 (같은 사이트에서 둘 다 팔면 병합 금지)
+            if not site_sets[i].isdisjoint(site_sets[j]): continue
+            name_a, name_b = names[i], names[j]
+            if name_a == name_b: continue
+            if i not in char_counts: char_counts[i] = Counter(name_a)
+            if j not in char_counts: char_counts[j] = Counter(name_b)
+            ratio = char_ratio(char_counts[i], char_counts[j], len(name_a) + len(name_b))
+            if ratio <= threshold: continue
+            # 기존과 같이 이름순으로 앞선 쪽을 A로 넘김 (점수가 같으면 A -> B)
+            pair = make_duplicate_pair(items[min(i, j)], items[max(i, j)], ratio)
+            if pair['pair_key'] in seen_pairs: continue
+            seen_pairs.add(pair['pair_key'])
+            duplicates.append(pair)
+
+    # 유사도 순 정렬
+    duplicates.sort(key=lambda x: x['ratio'], reverse=True)
+    clusters = cluster_duplicates(duplicates)
+    print(f"   중복 예상 {len(duplicates)}쌍, {len(clusters)}개 묶음")
+    return duplicates
 
-            # 유사도 측정 (보조 수단)
+def analyze_duplicates_window(data, window_size=50):
+    """
+    비교용: 기존 방식. 이름순 정렬 후 앞뒤 window_size개만 SequenceMatcher로 비교합니다.
+    이름 정렬상 멀리 떨어진 중복(브랜드 먼저 vs 맛 먼저)은 놓칩니다.
+    """
+    items = sorted(data.values(), key=lambda x: x['display_name'])
+    n = len(items)
+    duplicates = []
+    seen_pairs = set()
+    for i in range(n):
+        for j in range(1, window_size + 1):
+            if i + j >= n: break
+            item_a, item_b = items[i], items[i + j]
+            name_a, name_b = item_a['display_name'], item_b['display_name']
+            if not set(item_a['prices'].keys()).isdisjoint(item_b['prices'].keys()): continue
+            tokens_a, tokens_b = tokenize(name_a), tokenize(name_b)
+            if not (tokens_a.issubset(tokens_b) or tokens_b.issubset(tokens_a)): continue
             ratio = difflib.SequenceMatcher(None, name_a, name_b).ratio()
-            
-            # 부분집합 관계라면 유사도는 꽤 높겠지만, 안전장치로 한번 더 확인 (0.6 이상)
             if ratio > 0.6:
                 if name_a == name_b: continue
-                
-                # 3. 기준(Target) 자동 선정
-                # 원칙: 이미지 있음 > 판매처 많음 > 이름 김
-                score_a = (1 if item_a.get('image') else 0) * 100 + len(item_a['prices']) * 10 + len(name_a) * 0.1
-                score_b = (1 if item_b.get('image') else 0) * 100 + len(item_b['prices']) * 10 + len(name_b) * 0.1
-                
-                if score_b >= score_a:
-                    source, target = item_a, item_b
-                else:
-                    source, target = item_b, item_a
+                pair = make_duplicate_pair(item_a, item_b, ratio)
+                if pair['pair_key'] not in seen_pairs:
+                    seen_pairs.add(pair['pair_key'])
+                    duplicates.append(pair)
+    duplicates.sort(key=lambda x: x['ratio'], reverse=True)
+    return duplicates
 
-                # 중복 저장 방지 키
-                pair_key = tuple(sorted([name_a, name_b]))
-                
-                potential_duplicates.append({
-                    "item_a": source,   # 바뀔 놈
-                    "item_b": target,   # 기준이 될 놈
-                    "ratio": ratio,
-                    "pair_key": pair_key
-                })
-
-    # 중복 제거
-    unique_duplicates = []
-    seen_pairs = set()
-    for d in potential_duplicates:
-        if d['pair_key'] not in seen_pairs:
-            seen_pairs.add(d['pair_key'])
-            unique_duplicates.append(d)
-            
-    # 유사도 순 정렬
-    unique_duplicates.sort(key=lambda x: x['ratio'], reverse=True)
-    return unique_duplicates
+def duplicate_recall(found, reference):
+    """reference(기존 방식) 쌍 중 found가 찾은 비율"""
+    found_keys = {d['pair_key'] for d in found}
+    ref_keys = {d['pair_key'] for d in reference}
+    return len(ref_keys & found_keys) / len(ref_keys) if ref_keys else 1.0
 
 def analyze_suspicious_names(data):
     """
@@ -273,11 +330,16 @@ def generate_analysis_report(duplicates, suspicious):
     print(f"✅ 분석 완료! analysis_report.html 파일이 생성되었습니다.")
 
 if __name__ == "__main__":
+    import sys
+    import result
     # result.py의 로직을 사용하여 데이터 가져오기 (정규화된 상태)
     data, sites = result.process_data()
     
     if data:
         duplicates = analyze_duplicates(data)
+        if "--compare" in sys.argv:
+            legacy = analyze_duplicates_window(data)
+            print(f"   기존 슬라이딩 윈도우 {len(legacy)}쌍 대비 recall {duplicate_recall(duplicates, legacy):.1%}")
         suspicious = analyze_suspicious_names(data)
         generate_analysis_report(duplicates, suspicious)
     else:
@@ -0,0 +1,218 @@
+"""
+브라우저 목록 페이지 벤치마크: 페이지당 WebDriver 호출 수 / 시간 / 받은 크기
+- elements: 기존 Selenium 크롤러 방식 (상품마다 find_element + .text / get_attribute)
+- page_source: 페이지 전체 HTML을 받아 Python에서 파싱 (user-022 엔진)
+- extract: EXTRACT_SCRIPT 한 번으로 상품 요소만 받아 parse_extracted (crawler.Browser.extract)
+저장 HTML(tools/fixtures/crawlers/)의 상품 요소를 --items개로 늘려 씁니다.
+
+기본은 가짜 드라이버: 명령 하나마다 --rtt ms (로컬 chromedriver 왕복 수준) 뒤 BeautifulSoup으로 답함.
+selenium + Chrome이 있으면 --chrome으로 실제 headless Chrome(file:// 주소)에서 같은 세 방식을 잽니다.
+
+사용법 (저장소 루트에서 실행):
+    python tools/bench_browser_extract.py
+    python tools/bench_browser_extract.py --items 60 --rtt 5
+    python tools/bench_browser_extract.py --chrome
+"""
+import argparse
+import copy
+import json
+import os
+import sys
+import tempfile
+import time
+
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, '.')
+sys.path.insert(0, 'tools')
+sys.path.insert(0, 'crawlers')
+import crawler
+from profiles import PROFILES
+from verify_crawlers import FIXTURES, extract_html, fixture
+
+LIST_FIXTURES = [name for name in FIXTURES if "_detail_" not in name and name != "juice99_shell"]
+
+def enlarge(html, profile, count):
+    """상품 요소를 복사해 count개로 (이름 뒤에 번호를 붙여 중복 제거에 걸리지 않게)"""
+    soup = BeautifulSoup(html, crawler.HTML_PARSER)
+    items = next((found for found in (soup.select(selector) for selector in crawler._selectors(profile["item"])) if found), [])
+    items = [item for item in items if not any(parent in items for parent in item.parents)]
+    if not items: return html
+    last = items[-1]
+    for index in range(count - len(items)):
+        clone = copy.copy(items[index % len(items)])
+        for text in clone.find_all(string=True):
+            if text.strip() and not any(char.isdigit() for char in text):
+                text.replace_with(f"{text} {index}")
+                break
+        last.insert_after(clone)
+        last = clone
+    return str(soup)
+
+class NoSuchElement(Exception):
+    pass
+
+class SimElement:
+    def __init__(self, driver, tag):
+        self.driver = driver
+        self.tag = tag
+
+    def find_element(self, by, selector):
+        self.driver._call()
+        found = self.tag.select_one(selector)
+        if found is None: raise NoSuchElement(selector)
+        return SimElement(self.driver, found)
+
+    def find_elements(self, by, selector):
+        self.driver._call()
+        return [SimElement(self.driver, tag) for tag in self.tag.select(selector)]
+
+    @property
+    def text(self):
+        self.driver._call()
+        return self.tag.get_text(" ", strip=True)
+
+    def get_attribute(self, name):
+        self.driver._call()
+        return self.tag.get(name)
+
+class SimDriver:
+    """chromedriver 대신: 명령마다 rtt초 쉬고 BeautifulSoup으로 답함. calls = 보낸 명령 수"""
+    def __init__(self, pages, rtt):
+        self.pages = pages
+        self.rtt = rtt
+        self.calls = 0
+        self.html = ""
+        self.soup = None
+
+    def _call(self):
+        self.calls += 1
+        time.sleep(self.rtt)
+
+    def get(self, url):
+        self._call()
+        self.html = self.pages[url]
+        self.soup = BeautifulSoup(self.html, crawler.HTML_PARSER)
+
+    def find_element(self, by, selector):
+        return SimElement(self, self.soup).find_element(by, selector)
+
+    def find_elements(self, by, selector):
+        return SimElement(self, self.soup).find_elements(by, selector)
+
+    @property
+    def page_source(self):
+        self._call()
+        return self.html
+
+    def execute_script(self, script, selectors, paging, pick_each):
+        self._call()
+        return extract_html(self.soup, selectors, paging, pick_each)
+
+def _text(item, selector, attribute=None):
+    try:
+        element = item.find_element("css selector", selector)
+        return element.get_attribute(attribute) if attribute else element.text
+    except Exception:
+        return ""
+
+def by_elements(driver, url, profile):
+    """기존 크롤러: 상품마다 이름/가격 글자, 이미지/링크 속성을 따로 요청. 받은 크기는 글자/속성 합"""
+    driver.get(url)
+    wait = ", ".join(crawler._selectors(profile["item"]))
+    driver.find_elements("css selector", wait)
+    size = 0
+    for item in driver.find_elements("css selector", wait):
+        values = [_text(item, crawler._selectors(profile.get("name"))[0] if profile.get("name") else "a"),
+                  _text(item, profile.get("price_rows") or profile.get("price") or "li"),
+                  _text(item, profile.get("image") or "img", "src"), _text(item, profile.get("link") or "a", "href")]
+        size += sum(len(value or "") for value in values)
+    return None, size
+
+def by_page_source(driver, url, profile):
+    driver.get(url)
+    driver.find_elements("css selector", ", ".join(crawler._selectors(profile["item"])))
+    html = driver.page_source
+    return crawler.parse_list(html, profile)[:3], len(html.encode("utf-8"))
+
+def by_extract(driver, url, profile):
+    selectors = crawler._selectors(profile["item"])
+    driver.get(url)
+    driver.find_elements("css selector", ", ".join(selectors))
+    extracted = driver.execute_script(crawler.EXTRACT_SCRIPT, list(selectors), profile.get("paging"), False)
+    return crawler.parse_extracted(extracted, profile)[:3], len(json.dumps(extracted, ensure_ascii=False).encode("utf-8"))
+
+STRATEGIES = {"elements": by_elements, "page_source": by_page_source, "extract": by_extract}
+
+def chrome_driver():
+    """실제 headless Chrome (crawler.Browser와 같은 옵션, 명령 수 세기 포함). selenium/Chrome이 없으면 None"""
+    try:
+        browser = crawler.Browser()
+        browser.driver = browser._start()
+    except Exception as e:
+        print(f"[WARN] headless Chrome unavailable: {type(e).__name__}: {e}")
+        return None, None
+    return browser.driver, browser
+
+def run(args):
+    workdir = tempfile.mkdtemp(prefix="bench_browser_extract_")
+    pages, urls = {}, {}
+    for name in LIST_FIXTURES:
+        path = os.path.join(workdir, f"{name}.html")
+        html = enlarge(fixture(name), PROFILES[FIXTURES[name]], args.items)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(html)
+        urls[name] = f"file://{path}"
+        pages[urls[name]] = html
+
+    browser = None
+    if args.chrome:
+        driver, browser = chrome_driver()
+        if driver is None: return False
+        counter = browser
+        print(f"[INFO] real headless Chrome, {args.items} items per page, {args.repeat} runs")
+    else:
+        driver = counter = SimDriver(pages, args.rtt / 1000)
+        print(f"[INFO] simulated WebDriver ({args.rtt:.1f}ms per command), {args.items} items per page, {args.repeat} runs "
+              f"(pass --chrome with selenium + Chrome installed to measure a real browser)")
+
+    totals = {strategy: [0, 0.0, 0] for strategy in STRATEGIES}
+    same = True
+    try:
+        print(f"{'fixture':<18} " + " ".join(f"{strategy:>26}" for strategy in STRATEGIES))
+        for name in LIST_FIXTURES:
+            profile = PROFILES[FIXTURES[name]]
+            cells, results = [], {}
+            for strategy, measure in STRATEGIES.items():
+                calls, start = counter.calls, time.perf_counter()
+                for _ in range(args.repeat):
+                    results[strategy], size = measure(driver, urls[name], profile)
+                seconds = (time.perf_counter() - start) / args.repeat
+                calls = (counter.calls - calls) / args.repeat
+                total = totals[strategy]
+                total[0] += calls
+                total[1] += seconds
+                total[2] += size
+                cells.append(f"{calls:5.0f} calls {seconds * 1000:6.1f}ms {size / 1024:5.1f}KB")
+            same &= results["page_source"][:2] == results["extract"][:2]
+            print(f"{name:<18} " + " ".join(f"{cell:>26}" for cell in cells))
+    finally:
+        if browser is not None: browser.close()
+
+    count = len(LIST_FIXTURES)
+    print(f"{'per page':<18} " + " ".join(f"{calls / count:5.0f} calls {seconds / count * 1000:6.1f}ms {size / count / 1024:5.1f}KB"
+                                          .rjust(26) for calls, seconds, size in totals.values()))
+    before, after = totals["elements"], totals["extract"]
+    print(f"[BENCH] extract vs per-element calls: {before[0] / count:.0f} -> {after[0] / count:.0f} WebDriver calls, "
+          f"{before[1] / count * 1000:.0f}ms -> {after[1] / count * 1000:.0f}ms per page; "
+          f"vs page_source: {totals['page_source'][2] / count / 1024:.1f}KB -> {after[2] / count / 1024:.1f}KB transferred")
+    print(f"[{'PASS' if same else 'FAIL'}] extract and page_source parse to the same products")
+    return same
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark WebDriver round trips per browser list page")
+    parser.add_argument("--items", type=int, default=40, help="items per list page (default 40)")
+    parser.add_argument("--rtt", type=float, default=2.0, help="simulated ms per WebDriver command (default 2)")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--chrome", action="store_true", help="use a real headless Chrome (needs selenium + Chrome)")
+    sys.exit(0 if run(parser.parse_args()) else 1)
@@ -0,0 +1,67 @@
+"""
+카탈로그 메모리 벤치마크: 기존 merged_data(dict 중첩) vs catalog.Catalog(__slots__ + 배열)
+10k / 100k 상품 기준으로 메모리 사용량과 정렬/최저가 계산 시간을 비교합니다.
+
+사용법 (저장소 루트에서 실행):
+    python tools/bench_catalog.py
+"""
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, '.')
+from catalog import Catalog, SITE_KEYS
+
+def make_merged(n, seed=1):
+    rnd = random.Random(seed)
+    merged = {}
+    for i in range(n):
+        sites = [s for s in SITE_KEYS if rnd.random() < 0.3] or [rnd.choice(SITE_KEYS)]
+        merged[f"상품{i}30ml"] = {
+            "display_name": f"상품 {i} 30ml", "category": rnd.choice(["연초", "디저트", "과일/멘솔"]),
+            "volume": "30ml", "image": f"https://cdn.example.com/{i}.jpg",
+            "prices": {s: {"price": rnd.randint(3000, 20000), "link": f"https://{s}.example.com/{i}"} for s in sites},
+            "views": rnd.randint(0, 500)
+        }
+    return merged
+
+def measure(build):
+    tracemalloc.start()
+    obj = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return obj, size
+
+def legacy_walk(merged):
+    """generate_report 방식: 판매처 수 정렬 + 상품마다 가격 정렬/최저가"""
+    total = 0
+    for key, item in sorted(merged.items(), key=lambda x: len(x[1]['prices']), reverse=True):
+        shops = sorted(item['prices'].items(), key=lambda x: x[1]['price'])
+        total += min(p['price'] for _, p in shops)
+    return total
+
+def catalog_walk(catalog):
+    total = 0
+    for product in catalog.by_site_count():
+        product.sorted_offers()
+        total += product.min_price
+    return total
+
+def timed(func, arg):
+    start = time.perf_counter()
+    result = func(arg)
+    return result, time.perf_counter() - start
+
+if __name__ == "__main__":
+    for n in (10000, 100000):
+        source = make_merged(n)
+        # 같은 문자열을 공유하지 않도록 각자 새로 만들어서 측정
+        merged, dict_bytes = measure(lambda: make_merged(n))
+        catalog, catalog_bytes = measure(lambda: Catalog.from_merged(make_merged(n)))
+        legacy_total, legacy_sec = timed(legacy_walk, merged)
+        catalog_total, catalog_sec = timed(catalog_walk, catalog)
+        assert legacy_total == catalog_total
+        assert catalog.to_dict() == source
+        print(f"[BENCH] {n:>7,} products | dict {dict_bytes / 1e6:7.1f}MB | catalog {catalog_bytes / 1e6:7.1f}MB "
+              f"({catalog_bytes / dict_bytes:.0%}) | walk {legacy_sec:.3f}s -> {catalog_sec:.3f}s")
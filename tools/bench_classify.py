@@ -0,0 +1,85 @@
+"""
+카테고리 분류기 검증 + 벤치마크
+- build_site.CategoryClassifier 결과가 기존 classify_category(순차 replace + 부분 문자열 검사)와 같은지 확인합니다.
+- 현재 키워드 수와, 키워드 목록이 커졌을 때(합성 키워드 추가)의 처리량을 비교합니다.
+
+사용법 (저장소 루트에서 실행):
+    python tools/bench_classify.py
+"""
+import random
+import sys
+import time
+
+sys.path.insert(0, '.')
+sys.path.insert(0, 'tools')
+import build_site
+from bench_normalize import load_golden, make_fuzz_names
+
+def legacy_classify(name, categories, exceptions):
+    """비교용: 리팩터링 전 classify_category"""
+    name_lower = name.lower()
+    temp_name = name_lower
+    for brand in exceptions:
+        temp_name = temp_name.replace(brand, "")
+    if any(k in temp_name for k in categories["연초"]): return "연초"
+    if any(k in temp_name for k in categories["디저트"]): return "디저트"
+    return "과일/멘솔"
+
+def make_names(categories, exceptions, n, seed=3):
+    """실제 상품명 + 키워드/예외 브랜드를 이어 붙인 무작위 이름"""
+    rnd = random.Random(seed)
+    keywords = [k for words in categories.values() for k in words] + list(exceptions)
+    names = make_fuzz_names(n // 2)
+    for _ in range(n - len(names)):
+        parts = [rnd.choice(keywords + ["망고", "민트", " ", "a"]) for _ in range(rnd.randint(1, 5))]
+        names.append(rnd.choice(["", " "]).join(parts))
+    return names
+
+def grow_categories(categories, extra, seed=5):
+    """키워드 목록이 늘어난 상황을 흉내내기 위해 카테고리마다 합성 키워드를 추가"""
+    rnd = random.Random(seed)
+    syllables = "가나다라마바사아자차카타파하브스트로"
+    grown = {}
+    for category, keywords in categories.items():
+        synthetic = ["".join(rnd.choice(syllables) for _ in range(rnd.randint(3, 5))) for _ in range(extra)]
+        grown[category] = list(keywords) + synthetic
+    return grown
+
+def timed(func, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def run(label, categories, exceptions, names):
+    classifier = build_site.CategoryClassifier(categories, exceptions)
+    expected = [legacy_classify(n, categories, exceptions) for n in names]
+    single = [classifier.classify(n) for n in names]
+    batch = [category for category, _ in classifier.classify_all(names)]
+    ok = expected == single == batch
+    keyword_count = sum(len(words) for words in categories.values())
+    print(f"[{'PASS' if ok else 'FAIL'}] {label}: {keyword_count} keywords, {len(names)} names 일치")
+
+    legacy_sec = timed(lambda: [legacy_classify(n, categories, exceptions) for n in names])
+    single_sec = timed(lambda: [classifier.classify(n) for n in names])
+    batch_sec = timed(lambda: classifier.classify_all(names))
+    print(f"[BENCH] {label}: legacy {legacy_sec:.3f}s | classify {single_sec:.3f}s ({legacy_sec / single_sec:.2f}x) "
+          f"| classify_all {batch_sec:.3f}s ({legacy_sec / batch_sec:.2f}x)")
+    return ok
+
+if __name__ == "__main__":
+    categories, exceptions = build_site.CATEGORIES, build_site.BRAND_EXCEPTIONS
+    # 실제 상품명 형태(골든 결과의 display_name)와 키워드가 몰린 무작위 이름을 따로 측정
+    golden_names = [case['expected']['display_name'] for case in load_golden()]
+    ok = run("golden", categories, exceptions, golden_names * (20000 // len(golden_names) + 1))
+    ok = run("dense", categories, exceptions, make_names(categories, exceptions, 20000)) and ok
+    grown = grow_categories(categories, 300)
+    ok = run("grown", grown, exceptions, make_names(grown, exceptions, 20000)) and ok
+
+    # 오분류 디버깅용: 골든 입력이 어떤 키워드로 분류됐는지 일부 출력
+    for case in load_golden()[:10]:
+        category, keyword = build_site.CATEGORY_CLASSIFIER.explain(case['expected']['display_name'])
+        print(f"  {case['expected']['display_name']!r} -> {category} (keyword: {keyword})")
+    sys.exit(0 if ok else 1)
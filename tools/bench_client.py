@@ -0,0 +1,166 @@
+"""
+클라이언트 검색/정렬 벤치마크: 카드 DOM 방식 vs 컬럼형 카탈로그(assets/catalog.js)
+합성 카탈로그로 리포트를 만든 뒤 다음을 비교합니다.
+- 전송 바이트: 검색/정렬 한 번에 필요한 카드 조각 전체 vs catalog.json (+gzip)
+- DOM 노드 수: 카테고리 카드 전체를 노드로 만드는 경우 vs 보이는 한 페이지 카드만 만드는 경우
+- 필터/정렬 시간 (node 필요): 기존 방식은 data-* 속성 문자열을 읽는 카드 객체로 흉내냄 (실제 DOM보다 빠르므로 보수적인 비교)
+  컬럼형은 비교 함수 정렬(sortByValues)과 빌드 때 만든 순서의 번호 교집합(sort)을 따로 잽니다.
+  결과 순서가 같은지도 확인합니다. (이름순은 Intl.Collator('ko') 정렬과 비교)
+
+사용법 (저장소 루트에서 실행):
+    python tools/bench_client.py                    # 상품 5k, 20k, 55k
+    python tools/bench_client.py --products 10000
+"""
+import argparse
+import contextlib
+import gzip
+import io
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from html.parser import HTMLParser
+
+sys.path.insert(0, '.')
+sys.path.insert(0, 'tools')
+import build_site
+from verify_report import make_catalog
+
+REPO_ROOT = os.path.abspath('.')
+
+# node에서 실행: argv = [catalog.js 경로, catalog.json 경로]
+NODE_HARNESS = r"""
+const fs = require('fs');
+const { CatalogData } = require(process.argv[1]);
+const json = JSON.parse(fs.readFileSync(process.argv[2], 'utf8'));
+const data = new CatalogData(json);
+
+// 기존 방식: 카드마다 data-* 속성 문자열과 제목을 읽어서 거르고 정렬
+const cards = json.key.map((key, i) => {
+    const attrs = {
+        'data-category': json.categories[json.category[i]], 'data-price': String(json.price[i]),
+        'data-views': String(json.views[i]), 'data-sitecount': String(json.offerStart[i + 1] - json.offerStart[i]),
+    };
+    return { index: i, dataset: { key, category: attrs['data-category'] }, title: json.name[i],
+             getAttribute: name => attrs[name] };
+});
+function legacyFilter(category, query, favorites) {
+    if (favorites) return cards.filter(c => favorites.includes(c.dataset.key));
+    return cards.filter(card => {
+        const catMatch = (category === 'all') || (card.dataset.category === category);
+        return catMatch && card.title.toLowerCase().replace(/\s+/g, '').includes(query);
+    });
+}
+function legacySort(list, sortType) {
+    const getPrice = (node) => {
+        const val = node.getAttribute('data-price');
+        if (!val) return 999999;
+        return parseInt(val.replace(/,/g, ''), 10);
+    };
+    return list.sort((a, b) => {
+        if (sortType === 'price-asc') return getPrice(a) - getPrice(b);
+        if (sortType === 'views') return parseInt(b.getAttribute('data-views') || 0) - parseInt(a.getAttribute('data-views') || 0);
+        if (sortType === 'name') return a.title.localeCompare(b.title);
+        return parseInt(b.getAttribute('data-sitecount') || 0) - parseInt(a.getAttribute('data-sitecount') || 0);
+    });
+}
+
+const favorites = json.key.filter((_, i) => i % 97 === 0);
+// [이름, 카테고리, 검색어, 즐겨찾기, 정렬]
+const scenarios = [
+    ['search', 'all', '망고', null, 'price-asc'],
+    ['category', '연초', '', null, 'price-asc'],
+    ['favorites', 'all', '', favorites, 'price-asc'],
+    ['views', 'all', '', null, 'views'],
+    ['name', 'all', '', null, 'name'],
+    ['sitecount', 'all', '', null, 'site-desc'],
+    ['cat+views', '디저트', '', null, 'views'],
+    ['cat+name', '디저트', '', null, 'name'],
+    ['search+name', 'all', '망고', null, 'name'],
+];
+function best(fn, repeat) {
+    let min = Infinity, result;
+    for (let r = 0; r < repeat; r++) {
+        const start = process.hrtime.bigint();
+        result = fn();
+        min = Math.min(min, Number(process.hrtime.bigint() - start) / 1e6);
+    }
+    return [min, result];
+}
+const sameOrder = (a, b) => a.length === b.length && a.every((x, k) => x === b[k]);
+const out = [];
+for (const [label, category, query, favs, sortType] of scenarios) {
+    const [legacyMs, legacy] = best(() => legacySort(legacyFilter(category, query, favs), sortType), 5);
+    const [comparatorMs, compared] = best(() => data.sortByValues(data.filter(category, query, favs), sortType), 5);
+    const [permutationMs, permuted] = best(() => data.sort(data.filter(category, query, favs), sortType), 5);
+    const same = sameOrder(permuted, compared) && (sortType === 'name' || sameOrder(legacy.map(c => c.index), permuted));
+    out.push({ label, matched: permuted.length, legacyMs, comparatorMs, permutationMs, same });
+}
+process.stdout.write(JSON.stringify(out));
+"""
+
+class ElementCounter(HTMLParser):
+    def __init__(self):
+        super().__init__()
+        self.count = 0
+
+    def handle_starttag(self, tag, attrs):
+        self.count += 1
+
+def count_elements(html):
+    parser = ElementCounter()
+    parser.feed(html)
+    return parser.count
+
+def folder_bytes(path):
+    return sum(os.path.getsize(os.path.join(root, name)) for root, _, names in os.walk(path) for name in names)
+
+def run_node(catalog_path, catalog_js=os.path.join(REPO_ROOT, "assets", "catalog.js")):
+    if shutil.which("node") is None: return None
+    output = subprocess.check_output(["node", "-e", NODE_HARNESS, catalog_js, catalog_path], text=True)
+    return json.loads(output)
+
+def bench(products):
+    # 합성 레코드 2.5개 ~ 상품 1.5개 정도로 병합되므로 넉넉히 만든 뒤 앞에서부터 자름
+    catalog = build_site.Catalog(list(make_catalog(products * 2).items())[:products])
+    workdir = tempfile.mkdtemp(prefix="bench_client_")
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            build_site.generate_report(catalog, build_site.SITES, filename=os.path.join(workdir, "index.html"))
+        shard_root = os.path.join(workdir, build_site.SHARD_DIR)
+        catalog_path = os.path.join(shard_root, build_site.SHARD_CATALOG_FILE)
+        with open(catalog_path, "rb") as f:
+            catalog_gzip = len(gzip.compress(f.read()))
+        all_shards = os.path.join(shard_root, build_site.shard_slug("all"))
+        all_html = "".join(open(os.path.join(all_shards, name), encoding="utf-8").read() for name in os.listdir(all_shards))
+        page_html = open(os.path.join(all_shards, "1.html"), encoding="utf-8").read()
+
+        print(f"[BENCH] {len(catalog):,} products")
+        print(f"  index.html          {os.path.getsize(os.path.join(workdir, 'index.html')) / 1e6:8.2f}MB")
+        print(f"  bytes for search    shards {folder_bytes(all_shards) / 1e6:8.2f}MB -> catalog.json "
+              f"{os.path.getsize(catalog_path) / 1e6:.2f}MB (gzip {catalog_gzip / 1e6:.2f}MB)")
+        print(f"  DOM nodes           all cards {count_elements(all_html):,} -> one page {count_elements(page_html):,}")
+        results = run_node(catalog_path)
+        if results is None:
+            print("  [SKIP] node 없음: 필터/정렬 시간 측정 생략")
+            return True
+        ok = True
+        for row in results:
+            ok = ok and row["same"]
+            print(f"  [{'PASS' if row['same'] else 'FAIL'}] {row['label']:<12} {row['matched']:>7,} matched | "
+                  f"dom-style {row['legacyMs']:8.2f}ms | comparator {row['comparatorMs']:7.2f}ms "
+                  f"| permutation {row['permutationMs']:7.2f}ms")
+        return ok
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--products", default="5000,20000,55000", help="상품 수 (쉼표 구분)")
+    args = parser.parse_args()
+    ok = True
+    for products in (int(n) for n in args.products.split(",") if n):
+        ok = bench(products) and ok
+    sys.exit(0 if ok else 1)
@@ -0,0 +1,90 @@
+"""
+중복 탐지 벤치마크: 토큰 역색인(analyze_duplicates) vs 기존 슬라이딩 윈도우(analyze_duplicates_window)
+합성 상품 목록(브랜드 먼저/맛 먼저 순서가 섞인 중복 포함)으로 처리 시간과 recall을 비교합니다.
+
+사용법 (저장소 루트에서 실행):
+    python tools/bench_duplicates.py          # 1k / 10k (윈도우 비교) + 100k (역색인만)
+    python tools/bench_duplicates.py --full   # 100k에서도 슬라이딩 윈도우 실행 (느림)
+"""
+import contextlib
+import difflib
+import io
+import random
+import sys
+import time
+
+sys.path.insert(0, 'tools')
+from analyze_inventory import analyze_duplicates, analyze_duplicates_window, char_ratio, duplicate_recall
+from collections import Counter
+
+SITE_KEYS = ('modu', 'juice24', 'tjf', 'siasiu', 'vapemonster', 'juice99', 'juicebox', 'vape9', 'juice23')
+
+def make_data(n, seed=11):
+    """
+    n개 상품. 약 10%는 기존 상품의 중복(토큰 하나 빠짐 / 브랜드 순서 바뀜 / 괄호 표기)이고,
+    중복은 원본과 겹치지 않는 사이트에 배정합니다.
+    """
+    rnd = random.Random(seed)
+    syllables = "가나다라마바사아자차카타파하브스트로망고민트"
+    brands = ["".join(rnd.choice(syllables) for _ in range(rnd.randint(2, 4))) for _ in range(max(20, n // 200))]
+    flavors = ["".join(rnd.choice(syllables) for _ in range(rnd.randint(2, 3))) for _ in range(max(50, n // 50))]
+    data = {}
+    originals = []
+    while len(data) < n:
+        if originals and rnd.random() < 0.1:
+            brand, picked, volume, sites = rnd.choice(originals)
+            other_sites = [s for s in SITE_KEYS if s not in sites] or list(SITE_KEYS)
+            dup_sites = rnd.sample(other_sites, min(len(other_sites), rnd.randint(1, 2)))
+            variant = rnd.random()
+            if variant < 0.4 and len(picked) > 1:
+                tokens = [brand] + rnd.sample(picked, len(picked) - 1)
+                name = " ".join(tokens) + " " + volume
+            elif variant < 0.7:
+                name = " ".join(sorted(picked)) + " " + brand + " " + volume  # 맛 먼저
+            else:
+                name = f"[{brand}] " + " ".join(picked) + " " + volume
+            sites = dup_sites
+        else:
+            brand = rnd.choice(brands)
+            picked = rnd.sample(flavors, rnd.randint(1, 3))
+            volume = rnd.choice(["30ml", "30ml", "60ml"])
+            sites = rnd.sample(SITE_KEYS, rnd.randint(1, 3))
+            name = " ".join([brand] + sorted(picked)) + " " + volume
+            originals.append((brand, picked, volume, sites))
+        data[f"k{len(data)}"] = {
+            "display_name": name, "category": "과일/멘솔", "views": 0,
+            "image": "" if rnd.random() < 0.3 else f"https://cdn.example.com/{len(data)}.jpg",
+            "prices": {s: {"price": rnd.randint(3000, 20000), "link": ""} for s in sites}
+        }
+    return data
+
+def timed(func, *args):
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = func(*args)
+    return result, time.perf_counter() - start
+
+def check_char_ratio(data, samples=2000, seed=3):
+    """char_ratio가 difflib quick_ratio와 같은 값인지 확인"""
+    rnd = random.Random(seed)
+    names = [item['display_name'] for item in data.values()]
+    for _ in range(samples):
+        a, b = rnd.choice(names), rnd.choice(names)
+        expected = difflib.SequenceMatcher(None, a, b).quick_ratio()
+        if abs(char_ratio(Counter(a), Counter(b), len(a) + len(b)) - expected) > 1e-12: return False
+    return True
+
+if __name__ == "__main__":
+    ok = check_char_ratio(make_data(1000))
+    print(f"[{'PASS' if ok else 'FAIL'}] char_ratio == difflib quick_ratio")
+    for n in (1000, 10000, 100000):
+        data = make_data(n)
+        indexed, indexed_sec = timed(analyze_duplicates, data)
+        line = f"[BENCH] {n:>7,} products | index {indexed_sec:6.2f}s {len(indexed):6,} pairs"
+        if n <= 10000 or "--full" in sys.argv:
+            window, window_sec = timed(analyze_duplicates_window, data)
+            recall = duplicate_recall(indexed, window)
+            ok = ok and recall == 1.0
+            line += f" | window {window_sec:6.2f}s {len(window):6,} pairs | recall {recall:.1%}"
+        print(line)
+    sys.exit(0 if ok else 1)
@@ -0,0 +1,168 @@
+"""
+normalize_product 골든 테스트 + 처리량 벤치마크
+- tools/normalize_golden.json 의 기대값과 현재 결과를 비교합니다.
+- 기존(리팩터링 전) 구현과 초당 처리 건수를 비교합니다.
+
+사용법 (저장소 루트에서 실행):
+    python tools/bench_normalize.py            # 골든 비교 + 벤치마크
+    python tools/bench_normalize.py --update   # 규칙 변경 후 골든 파일 갱신
+"""
+import json
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, '.')
+import build_site
+
+GOLDEN_PATH = "tools/normalize_golden.json"
+
+def legacy_normalize_product(raw_name):
+    """비교용: 리팩터링 전 normalize_product (규칙 테이블은 build_site 것을 그대로 사용)"""
+    raw_name = re.sub(r' - .*? 이미지$', '', raw_name)
+    if raw_name in build_site.CUSTOM_ALIASES:
+        raw_name = build_site.CUSTOM_ALIASES[raw_name]
+    temp_name = raw_name.lower()
+
+    event_suffix = ""
+    if "1+1" in temp_name: event_suffix = " (1+1)"
+    elif "2+1" in temp_name: event_suffix = " (2+1)"
+    elif "3+1" in temp_name: event_suffix = " (3+1)"
+    temp_name = temp_name.replace("1+1", "").replace("2+1", "").replace("3+1", "")
+    text = temp_name
+    text = re.sub(r'리뷰\s*\d+', ' ', text)
+    text = re.sub(r'평점\s*\d+(\.\d+)?', ' ', text)
+    text = re.sub(r'\(\d+\)', ' ', text)
+    text = re.sub(r'하이민트|high\s*mint', ' ', text, flags=re.IGNORECASE)
+    text = re.sub(r'\d+(\.\d+)?\s*mg', ' ', text, flags=re.IGNORECASE)
+    text = re.sub(r'\d+(\.\d+)?\s*%', ' ', text, flags=re.IGNORECASE)
+    text = re.sub(r'(^|\s)\d+(\.\d+)?(\s|$)', ' ', text)
+    temp_name = text.strip()
+
+    temp_name = re.sub(r'flex\s*x', 'flex', temp_name, flags=re.IGNORECASE)
+    temp_name = re.sub(r'플렉스\s*x', '플렉스', temp_name, flags=re.IGNORECASE)
+    temp_name = temp_name.replace("더블 슬로우 블로우", "더블슬로우블로우").replace("더블 블로우 슬로우", "더블슬로우블로우")
+    temp_name = temp_name.replace("슬로우 블로우", "슬로우블로우").replace("블로우 슬로우", "슬로우블로우")
+
+    volume = "30ml"
+    vol_match = re.search(r'(\d+)\s*ml', temp_name, re.IGNORECASE)
+    if vol_match:
+        volume = vol_match.group(1) + "ml"
+        temp_name = re.sub(r'\d+\s*ml', ' ', temp_name, flags=re.IGNORECASE)
+
+    extracted_brand = ""
+    bracket_match = re.search(r'[\[\(](.*?)[\]\)]', temp_name)
+    if bracket_match:
+        extracted_brand = bracket_match.group(1).strip()
+        temp_name = re.sub(r'[\[\(].*?[\]\)]', ' ', temp_name)
+
+    for junk in build_site.JUNK_WORDS:
+        temp_name = temp_name.replace(junk, ' ')
+
+    tokens = temp_name.split()
+    if extracted_brand:
+        for junk in build_site.JUNK_WORDS: extracted_brand = extracted_brand.replace(junk, '')
+        tokens = extracted_brand.split() + tokens
+
+    final_tokens = []
+    seen = set()
+    for t in tokens:
+        t_clean = re.sub(r'[^a-z0-9가-힣]', '', t)
+        if not t_clean: continue
+        t_mapped = build_site.WORD_MAP.get(t_clean, t_clean)
+        for sub_t in t_mapped.split():
+            if sub_t in build_site.JUNK_WORDS or sub_t == '0': continue
+            if sub_t not in seen:
+                seen.add(sub_t)
+                final_tokens.append(sub_t)
+
+    final_tokens.sort()
+    clean_name = " ".join(final_tokens)
+    clean_name = clean_name.replace("더블슬로우블로우", "더블 슬로우 블로우").replace("슬로우블로우", "슬로우 블로우")
+    category = build_site.classify_category(clean_name)
+
+    for brand in build_site.PRIORITY_BRANDS:
+        if brand in clean_name:
+            if not clean_name.startswith(brand):
+                temp_name = clean_name.replace(brand, "").strip()
+                clean_name = f"{brand} {temp_name}"
+            break
+
+    display_name = f"{clean_name} {volume}{event_suffix}"
+    match_key = clean_name.replace(" ", "") + volume + event_suffix.strip()
+
+    return {
+        "original": raw_name, "category": category,
+        "volume": volume, "match_key": match_key,
+        "display_name": display_name
+    }
+
+def load_golden():
+    with open(GOLDEN_PATH, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def check_golden():
+    cases = load_golden()
+    failed = 0
+    for case in cases:
+        got = build_site.normalize_product(case['raw'])
+        if got != case['expected']:
+            failed += 1
+            print(f"[FAIL] '{case['raw']}'\n   Got      {got}\n   Expected {case['expected']}")
+    print(f"[{'PASS' if not failed else 'FAIL'}] 골든 비교: {len(cases) - failed}/{len(cases)}")
+    return failed == 0
+
+def update_golden():
+    cases = load_golden()
+    for case in cases:
+        case['expected'] = build_site.normalize_product(case['raw'])
+    with open(GOLDEN_PATH, "w", encoding="utf-8") as f:
+        json.dump(cases, f, ensure_ascii=False, indent=2)
+    print(f"[INFO] 골든 파일 갱신: {len(cases)}건")
+
+def make_fuzz_names(n, seed=42):
+    """골든 입력의 토큰과 노이즈를 섞어 만든 무작위 상품명"""
+    rnd = random.Random(seed)
+    words = sorted({w for case in load_golden() for w in case['raw'].split()})
+    noise = build_site.JUNK_WORDS + build_site.PRIORITY_BRANDS + [
+        "1+1", "2+1", "3+1", "30ml", "60ML", "9.8mg", "3%", "리뷰 12", "평점 4.5", "(12)", "[", "]", "(", ")",
+        "flex x", "슬로우 블로우", "더블 블로우 슬로우", "0", " - 상세 이미지"
+    ]
+    names = []
+    for _ in range(n):
+        parts = [rnd.choice(words if rnd.random() < 0.7 else noise) for _ in range(rnd.randint(1, 8))]
+        names.append(rnd.choice(["", " "]).join(parts) if rnd.random() < 0.2 else " ".join(parts))
+    return names
+
+def check_fuzz(names):
+    mismatched = [n for n in names if build_site.normalize_product(n) != legacy_normalize_product(n)]
+    for n in mismatched[:10]:
+        print(f"[FAIL] '{n}'\n   New    {build_site.normalize_product(n)}\n   Legacy {legacy_normalize_product(n)}")
+    print(f"[{'PASS' if not mismatched else 'FAIL'}] 무작위 비교: {len(names) - len(mismatched)}/{len(names)}")
+    return not mismatched
+
+def bench(func, names, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for n in names: func(n)
+        best = min(best, time.perf_counter() - start)
+    return len(names) / best
+
+if __name__ == "__main__":
+    if "--update" in sys.argv:
+        update_golden()
+        sys.exit(0)
+
+    ok = check_golden()
+    ok = check_fuzz(make_fuzz_names(20000)) and ok
+
+    # 실제 상품명 형태에 가까운 골든 입력을 반복해서 측정
+    golden_names = [case['raw'] for case in load_golden()]
+    names = golden_names * (20000 // len(golden_names) + 1)
+    legacy_rate = bench(legacy_normalize_product, names)
+    new_rate = bench(build_site.normalize_product, names)
+    print(f"[BENCH] legacy: {legacy_rate:,.0f} items/sec")
+    print(f"[BENCH] engine: {new_rate:,.0f} items/sec ({new_rate / legacy_rate:.2f}x)")
+    sys.exit(0 if ok else 1)
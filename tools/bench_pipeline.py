@@ -0,0 +1,177 @@
+"""
+빌드 파이프라인 벤치마크 (Firebase 없이 합성 카탈로그 사용)
+1k / 10k / 100k 상품 레코드 트리를 만들어 단계별 시간과 메모리를 측정하고 JSON으로 저장합니다.
+
+측정 단계
+- normalize:        고유 상품명 전체에 normalize_product (캐시 없이)
+- process_cold:     process_data(full_rebuild=True), 빈 캐시/상태에서 병합 + 카탈로그 구성
+- process_warm:     process_data() 재실행, 정규화 캐시 + 병합 상태 재사용 (변경 없음)
+- generate_report:  index.html 생성 (카드 캐시 없이)
+- report_cards_*:   카드 캐시를 쓴 index.html 생성 (빈 캐시 -> 전부 재사용)
+각 단계마다 소요 시간, 단계 중 파이썬 할당 최대치(tracemalloc, --trace-memory일 때), 누적 최대 RSS를 기록합니다.
+
+사용법 (저장소 루트에서 실행):
+    python tools/bench_pipeline.py                              # 1k, 10k, 100k
+    python tools/bench_pipeline.py --tiers 1000,10000 --out a.json
+    python tools/bench_pipeline.py --compare .cache/bench/pipeline-abc1234.json
+결과 기본 경로: .cache/bench/pipeline-<commit>.json
+"""
+import argparse
+import contextlib
+import gc
+import io
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, '.')
+sys.path.insert(0, 'tools')
+import build_site
+from synthetic_catalog import count_listings, make_tree
+
+RESULT_VERSION = 1
+DEFAULT_TIERS = (1000, 10000, 100000)
+REPO_ROOT = os.path.abspath('.')
+
+class SyntheticStream:
+    """FirebaseProductStream 대신 메모리의 트리를 같은 (site, page) 형태로 내보냄"""
+    def __init__(self, tree, page_size=build_site.FIREBASE_PAGE_SIZE):
+        self.tree = tree
+        self.page_size = page_size
+        self.views = {}
+
+    def __iter__(self):
+        for site, listings in build_site.iter_tree_pages(self.tree):
+            keys = sorted(listings, key=build_site.firebase_key_order)
+            for start in range(0, len(keys), self.page_size):
+                yield site, {k: listings[k] for k in keys[start:start + self.page_size]}
+        self.views.update(build_site.views_from_tree(self.tree))
+
+    def report(self):
+        pass
+
+def git_commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT,
+                                       stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+def run_stage(results, name, func, trace_memory):
+    gc.collect()
+    if trace_memory: tracemalloc.start()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        value = func()
+    seconds = time.perf_counter() - start
+    stage = {"seconds": round(seconds, 4)}
+    if trace_memory:
+        stage["traced_peak_mb"] = round(tracemalloc.get_traced_memory()[1] / 1e6, 2)
+        tracemalloc.stop()
+    rss = build_site.peak_rss_mb()
+    stage["peak_rss_mb"] = round(rss, 1) if rss is not None else None
+    results[name] = stage
+    print(f"  {name:<18} {seconds:8.3f}s" + (f"  traced {stage['traced_peak_mb']:8.1f}MB" if trace_memory else "")
+          + (f"  rss {stage['peak_rss_mb']:8.1f}MB" if rss is not None else ""))
+    return value
+
+def report_with_card_cache(catalog, sites, path):
+    card_cache = build_site.CardCache(path)
+    try:
+        build_site.generate_report(catalog, sites, card_cache=card_cache)
+    finally:
+        card_cache.close()
+
+def bench_tier(listings, seed, trace_memory):
+    tree = make_tree(listings, seed=seed)
+    raw_names = list(dict.fromkeys(r.get('name', '') for site in build_site.SITES for r in (tree.get(site) or {}).values()))
+    print(f"[BENCH] {listings:,} listings ({len(raw_names):,} unique names)")
+    stages = {}
+    workdir = tempfile.mkdtemp(prefix="bench_pipeline_")
+    original_stream = build_site.FirebaseProductStream
+    try:
+        # 캐시/상태/index.html은 임시 폴더에 쓰고, 추가 이미지 설정만 복사해 둠
+        if os.path.exists(os.path.join(REPO_ROOT, "additional_images.json")):
+            shutil.copy(os.path.join(REPO_ROOT, "additional_images.json"), workdir)
+        os.chdir(workdir)
+        build_site.FirebaseProductStream = lambda: SyntheticStream(tree)
+        build_site.NORMALIZE_CACHE = None
+        build_site.NORMALIZE_CACHE_PATH = os.path.join(workdir, ".cache", "normalize_cache.sqlite")
+        build_site.MERGE_STATE_PATH = os.path.join(workdir, ".cache", "merge_state.json")
+
+        run_stage(stages, "normalize", lambda: [build_site.normalize_product(n) for n in raw_names], trace_memory)
+        catalog, sites = run_stage(stages, "process_cold", lambda: build_site.process_data(full_rebuild=True), trace_memory)
+        build_site.get_normalize_cache().flush()
+        catalog, sites = run_stage(stages, "process_warm", lambda: build_site.process_data(), trace_memory)
+        run_stage(stages, "generate_report", lambda: build_site.generate_report(catalog, sites), trace_memory)
+        report_bytes = os.path.getsize("index.html")
+        card_cache_path = os.path.join(workdir, ".cache", "cards")
+        run_stage(stages, "report_cards_cold", lambda: report_with_card_cache(catalog, sites, card_cache_path), trace_memory)
+        run_stage(stages, "report_cards_warm", lambda: report_with_card_cache(catalog, sites, card_cache_path), trace_memory)
+    finally:
+        build_site.FirebaseProductStream = original_stream
+        if build_site.NORMALIZE_CACHE is not None:
+            build_site.NORMALIZE_CACHE.close()
+            build_site.NORMALIZE_CACHE = None
+        os.chdir(REPO_ROOT)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    return {
+        "listings": count_listings(tree),
+        "unique_names": len(raw_names),
+        "products": len(catalog),
+        "report_bytes": report_bytes,
+        "stages": stages,
+    }
+
+def compare(current, baseline_path):
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    print(f"[COMPARE] {baseline.get('commit')} -> {current['commit']}")
+    for tier, result in current["tiers"].items():
+        base = baseline.get("tiers", {}).get(tier)
+        if not base: continue
+        for stage, values in result["stages"].items():
+            old = base["stages"].get(stage)
+            if not old: continue
+            ratio = values["seconds"] / old["seconds"] if old["seconds"] else float('inf')
+            print(f"  {tier:>7} {stage:<18} {old['seconds']:8.3f}s -> {values['seconds']:8.3f}s ({ratio:.2f}x)")
+
+def main():
+    parser = argparse.ArgumentParser(description="합성 카탈로그로 빌드 파이프라인 단계별 시간/메모리 측정")
+    parser.add_argument("--tiers", default=",".join(map(str, DEFAULT_TIERS)), help="상품 레코드 수 (쉼표 구분)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", help="결과 JSON 경로 (기본: .cache/bench/pipeline-<commit>.json)")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON")
+    parser.add_argument("--trace-memory", action="store_true", help="단계별 tracemalloc 최대 할당량도 기록 (느려짐)")
+    args = parser.parse_args()
+
+    commit = git_commit()
+    result = {
+        "version": RESULT_VERSION,
+        "commit": commit,
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "seed": args.seed,
+        "tiers": {},
+    }
+    for listings in (int(t) for t in args.tiers.split(",") if t):
+        result["tiers"][str(listings)] = bench_tier(listings, args.seed, args.trace_memory)
+
+    out = args.out or os.path.join(".cache", "bench", f"pipeline-{commit}.json")
+    os.makedirs(os.path.dirname(out) or ".", exist_ok=True)
+    with open(out, "w", encoding="utf-8") as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+    print(f"[BENCH] 결과 저장: {out}")
+    if args.compare: compare(result, args.compare)
+
+if __name__ == "__main__":
+    main()
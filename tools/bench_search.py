@@ -0,0 +1,140 @@
+"""
+검색 색인 검증 + 벤치마크: 상품명 전체 확인(CatalogData.filter) vs 검색 색인(assets/search.js)
+합성 카탈로그로 리포트를 만든 뒤 다음을 확인합니다. (node 필요)
+- 일반 검색: 색인 결과가 상품명 전체 확인 결과를 모두 포함하고, 늘어난 상품은 별칭으로만 맞는 상품인지
+- 초성 검색: ㄴㅅㅌ -> 네스티 상품 전부
+- 오타 허용: 네스트 -> 네스티 상품 전부
+- 영문 별칭: nasty -> 네스티 상품 전부
+- 검색 한 번의 시간 (색인을 처음 푸는 시간은 따로 표시)
+
+사용법 (저장소 루트에서 실행):
+    python tools/bench_search.py                    # 상품 5k, 20k
+    python tools/bench_search.py --products 55000
+"""
+import argparse
+import contextlib
+import gzip
+import io
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, '.')
+sys.path.insert(0, 'tools')
+import build_site
+from verify_report import make_catalog
+
+REPO_ROOT = os.path.abspath('.')
+
+# node에서 실행: argv = [catalog.js 경로, search.js 경로, catalog.json 경로, search.json 경로]
+NODE_HARNESS = r"""
+const fs = require('fs');
+const { CatalogData } = require(process.argv[1]);
+const { SearchIndex } = require(process.argv[2]);
+const json = JSON.parse(fs.readFileSync(process.argv[3], 'utf8'));
+const searchJson = JSON.parse(fs.readFileSync(process.argv[4], 'utf8'));
+const data = new CatalogData(json);
+
+let start = process.hrtime.bigint();
+const index = new SearchIndex(searchJson, json.name);
+index.getChosungTexts();
+const setupMs = Number(process.hrtime.bigint() - start) / 1e6;
+
+function best(fn, repeat) {
+    let min = Infinity, result;
+    for (let r = 0; r < repeat; r++) {
+        const t = process.hrtime.bigint();
+        result = fn();
+        min = Math.min(min, Number(process.hrtime.bigint() - t) / 1e6);
+    }
+    return [min, result];
+}
+// 이름에 word가 들어간 상품이 모두 결과에 있는지 (초성/오타 검색은 다른 상품도 걸릴 수 있음)
+const covers = (rows, word) => {
+    const found = new Set(rows);
+    const wanted = json.name.map((name, i) => i).filter(i => json.name[i].includes(word));
+    return wanted.length > 0 && wanted.every(i => found.has(i));
+};
+const aliasOnly = (i, query) => !data.searchNames[i].includes(query) && (searchJson.alias[i] || '').includes(query);
+
+// [이름, 검색어, 카테고리, 확인 방식]
+const scenarios = [
+    ['exact', '망고', 'all', 'parity'],
+    ['exact', '네스티', 'all', 'parity'],
+    ['exact', '아이스', '연초', 'parity'],
+    ['exact', '1', 'all', 'parity'],
+    ['exact', '없는상품명', 'all', 'parity'],
+    ['chosung', 'ㄴㅅㅌ', 'all', '네스티'],
+    ['typo', '네스트', 'all', '네스티'],
+    ['alias', 'nasty', 'all', '네스티'],
+];
+const out = [];
+for (const [label, query, category, check] of scenarios) {
+    const [scanMs, scanned] = best(() => data.filter(category, query, null), 5);
+    const [indexMs, indexed] = best(() => data.filter(category, query, null, index), 5);
+    let ok;
+    if (check === 'parity') {
+        // 별칭으로만 맞는 상품을 빼면 상품명 전체 확인과 같아야 함 (둘 다 행 번호 오름차순)
+        const byName = indexed.filter(i => !aliasOnly(i, query));
+        ok = byName.length === scanned.length && byName.every((x, k) => x === scanned[k]);
+    } else {
+        ok = covers(indexed, check);
+    }
+    out.push({ label, query, category, scanned: scanned.length, matched: indexed.length, scanMs, indexMs, ok });
+}
+process.stdout.write(JSON.stringify({ setupMs, results: out }));
+"""
+
+def run_node(catalog_path, search_path, asset_dir=os.path.join(REPO_ROOT, "assets"),
+             catalog_js="catalog.js", search_js="search.js"):
+    if shutil.which("node") is None: return None
+    output = subprocess.check_output(["node", "-e", NODE_HARNESS, os.path.join(asset_dir, catalog_js),
+                                      os.path.join(asset_dir, search_js), catalog_path, search_path], text=True)
+    return json.loads(output)
+
+def bench(products):
+    catalog = build_site.Catalog(list(make_catalog(products * 2).items())[:products])
+    workdir = tempfile.mkdtemp(prefix="bench_search_")
+    try:
+        items = list(catalog.values())
+        start = time.perf_counter()
+        build_site.build_search_index(items)
+        build_seconds = time.perf_counter() - start
+        with contextlib.redirect_stdout(io.StringIO()):
+            build_site.generate_report(catalog, build_site.SITES, filename=os.path.join(workdir, "index.html"))
+        shard_root = os.path.join(workdir, build_site.SHARD_DIR)
+        catalog_path = os.path.join(shard_root, build_site.SHARD_CATALOG_FILE)
+        search_path = os.path.join(shard_root, build_site.SHARD_SEARCH_FILE)
+        with open(search_path, "rb") as f:
+            search_gzip = len(gzip.compress(f.read()))
+
+        print(f"[BENCH] {len(catalog):,} products")
+        print(f"  search.json         {os.path.getsize(search_path) / 1e6:.2f}MB (gzip {search_gzip / 1e6:.2f}MB), "
+              f"build {build_seconds:.3f}s")
+        output = run_node(catalog_path, search_path)
+        if output is None:
+            print("  [SKIP] node 없음: 검색 확인/시간 측정 생략")
+            return True
+        print(f"  index setup         {output['setupMs']:.1f}ms (첫 검색 때 한 번)")
+        ok = True
+        for row in output["results"]:
+            ok = ok and row["ok"]
+            print(f"  [{'PASS' if row['ok'] else 'FAIL'}] {row['label']:<8} {row['query']:<10} {row['category']:<5} "
+                  f"scan {row['scanned']:>6,} / index {row['matched']:>6,} | scan {row['scanMs']:6.2f}ms "
+                  f"| index {row['indexMs']:6.2f}ms")
+        return ok
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--products", default="5000,20000", help="상품 수 (쉼표 구분)")
+    args = parser.parse_args()
+    ok = True
+    for products in (int(n) for n in args.products.split(",") if n):
+        ok = bench(products) and ok
+    sys.exit(0 if ok else 1)
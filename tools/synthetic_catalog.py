@@ -0,0 +1,136 @@
+"""
+합성 카탈로그 생성기
+Firebase 없이 파이프라인을 측정하기 위해 products 트리(vape9_examples.json과 같은 레코드 모양)를 만듭니다.
+- 9개 사이트 전부, 사이트마다 다른 상품명 표기(괄호 브랜드, 'BRAND |', 1+1 이벤트, mg/ml/리뷰 노이즈)
+- 같은 상품이 여러 사이트에 올라오고(병합 대상), 같은 사이트 안에 같은 이름이 중복되기도 함
+- 가격은 정수/문자열("12,900원")/0, 이미지는 빈 값/상대경로/아이콘 등 실제 데이터의 지저분함을 흉내냄
+- 최상위에 match_key 별 views 노드도 일부 포함
+
+사용법 (저장소 루트에서 실행):
+    python tools/synthetic_catalog.py 10000 > /tmp/tree_10k.json
+"""
+import json
+import random
+import re
+import sys
+
+sys.path.insert(0, '.')
+from catalog import SITE_KEYS
+
+BRANDS = [
+    ("노보", "novo"), ("네스티", "nasty"), ("오르카", "orca"), ("플렉스", "flex"), ("타이타닉", "titanic"),
+    ("브이갓", "vgod"), ("아우라", "aura"), ("에딕트", "addict"), ("이그니스", "ignis"), ("슈퍼쿨", "supercool"),
+    ("동경", "tokyo"), ("베라쥬스", "vera"), ("알케마스터", "alchemaster"), ("펠릭스", "felix"), ("테일러", "taylor"),
+    ("잽쥬스", "zap"), ("오지구", "ozigu"), ("벤트", "vent"), ("타노스", "thanos"), ("마스터", "master"),
+]
+FLAVORS = [
+    "망고", "복숭아", "피치", "포도", "그린그레이프", "사과", "애플", "수박", "멜론", "레몬", "라임", "체리", "딸기",
+    "블루베리", "베리", "리치", "바나나", "키위", "자몽", "오렌지", "파인애플", "알로에", "코코넛", "패션후르츠",
+    "민트", "아이스", "쿨", "멘솔", "페퍼민트", "스피아민트", "로즈", "와이키키", "마르키사",
+    "바닐라", "커스터드", "치즈", "케이크", "크림", "쿠키", "초코", "카라멜", "요거트", "우유", "밀크", "팝콘", "푸딩",
+    "시가", "타바코", "토바코", "클래식", "버지니아", "쿠바나", "말보로", "던힐", "아메리카노", "커피",
+]
+NOISE = ["입호흡", "액상", "입호흡액상", "신규", "초특가", "★BEST★", "[사은품 증정]", "리뷰 {n}", "평점 4.{d}", "({n})",
+         "{mg}mg", "{p}%", "s-nic", "rs-nic", "- 상세 이미지"]
+EVENTS = ["[1+1]", "(2+1)", "3+1", "1+1 이벤트"]
+VOLUMES = ["30ml", "30ml", "30ml", "30ML", "60ml", "100ml", "30 ml"]
+PRICES = [5900, 7900, 9900, 11000, 12000, 12900, 14900, 16000, 19800, 22000]
+
+# 사이트별 상품명 표기 습관 (brand_ko, brand_en, flavor 문자열, 용량) -> 상품명
+SITE_FORMATS = {
+    'modu': lambda b, e, f, v: f"[{b}] {f} {v}",
+    'juice24': lambda b, e, f, v: f"{b} {f} 입호흡 액상 {v}",
+    'tjf': lambda b, e, f, v: f"({b}) {f} {v}",
+    'siasiu': lambda b, e, f, v: f"{e.upper()} {b} {f} {v}",
+    'vapemonster': lambda b, e, f, v: f"{b} - {f} {v}",
+    'juice99': lambda b, e, f, v: f"{f} {b} {v}",
+    'juicebox': lambda b, e, f, v: f"{b} {f} {v}",
+    'vape9': lambda b, e, f, v: f"{e.upper()} | {b} {f} 입호흡액상 {v}",
+    'juice23': lambda b, e, f, v: f"이액상 {b} {f} {v}",
+}
+SITE_HOSTS = {
+    'modu': "xn--hu1b83j3sfk9e3xc.kr", 'juice24': "juice24.kr", 'tjf': "www.tjf.kr", 'siasiu': "siasiu.com",
+    'vapemonster': "vapemonster.co.kr", 'juice99': "99juice.co.kr", 'juicebox': "juicebox.co.kr",
+    'vape9': "vape9.co.kr", 'juice23': "juice23.com",
+}
+_KEY_RE = re.compile(r'[.#$\[\]/\s|()+,%★\-]')
+
+def firebase_key(name):
+    """크롤러처럼 상품명에서 Firebase 키에 못 쓰는 문자를 지워 키를 만듦"""
+    return _KEY_RE.sub('', name) or "empty"
+
+def add_noise(name, rnd):
+    for _ in range(rnd.choice([0, 0, 1, 1, 2])):
+        noise = rnd.choice(NOISE).format(n=rnd.randint(1, 999), d=rnd.randint(0, 9),
+                                         mg=rnd.choice(["3", "6", "9.8"]), p=rnd.choice(["3", "5", "9.8"]))
+        name = f"{name} {noise}" if rnd.random() < 0.7 else f"{noise} {name}"
+    return name
+
+def make_products(count, rnd):
+    """사이트와 무관한 '실제 상품' 목록: (brand_ko, brand_en, flavor 문자열, 용량, 기준가)"""
+    products = set()
+    while len(products) < count:
+        brand, brand_en = rnd.choice(BRANDS)
+        flavor = " ".join(rnd.sample(FLAVORS, rnd.choice([1, 1, 2, 2, 3])))
+        if rnd.random() < 0.2: flavor += f" {rnd.randint(1, count // 10 + 1)}"  # 시리즈 번호로 상품 수 확보
+        products.add((brand, brand_en, flavor, rnd.choice(VOLUMES), rnd.choice(PRICES)))
+    return sorted(products)
+
+def make_listing(site, product, idx, rnd):
+    brand, brand_en, flavor, volume, base_price = product
+    name = SITE_FORMATS[site](brand, brand_en, flavor, volume)
+    if rnd.random() < 0.08: name = f"{rnd.choice(EVENTS)} {name}"
+    name = add_noise(name, rnd)
+    price = base_price + rnd.choice([-1000, -500, 0, 0, 0, 500, 1000])
+    roll = rnd.random()
+    if roll < 0.05: price = 0
+    elif roll < 0.15: price = f"{price:,}원"
+    host = SITE_HOSTS[site]
+    roll = rnd.random()
+    if roll < 0.1: image = ""
+    elif roll < 0.15: image = f"//{host}/web/upload/icon_new.gif"
+    elif roll < 0.3: image = f"//{host}/web/product/medium/{idx:06d}.jpg"
+    else: image = f"https://{host}/web/product/medium/{idx:06d}.jpg"
+    return name, {
+        "image": image,
+        "last_update": f"2026-02-{rnd.randint(1, 28):02d} {rnd.randint(0, 23):02d}:{rnd.randint(0, 59):02d}:00",
+        "name": name,
+        "price": price,
+        "site": site,
+        "url": "" if rnd.random() < 0.05 else f"https://{host}/product/detail.html?product_no={idx}",
+    }
+
+def make_tree(listings, seed=0, views_ratio=0.05):
+    """
+    listings개 상품 레코드를 9개 사이트에 나눠 담은 products 트리.
+    상품당 평균 약 2.5개 사이트에 올라가도록 실제 상품 수를 정합니다.
+    """
+    rnd = random.Random(seed)
+    products = make_products(max(1, int(listings / 2.5)), rnd)
+    tree = {site: {} for site in SITE_KEYS}
+    site_weights = [3, 3, 2, 2, 2, 2, 1, 1, 1]
+    idx = 0
+    while idx < listings:
+        product = rnd.choice(products)
+        site = rnd.choices(SITE_KEYS, weights=site_weights)[0]
+        name, record = make_listing(site, product, idx, rnd)
+        key = firebase_key(name)
+        if key in tree[site]:
+            # 같은 사이트 같은 이름(옵션만 다른 상품 등) -> 크롤러처럼 번호를 붙인 별도 키
+            key = f"{key}{idx}"
+        tree[site][key] = record
+        idx += 1
+
+    # 조회수 노드: 실제 match_key 형식을 흉내낸 키 (일부만 병합 결과와 일치)
+    for product in rnd.sample(products, int(len(products) * views_ratio)):
+        brand, _, flavor, volume, _ = product
+        key = firebase_key(f"{brand}{flavor}{volume}".lower())
+        if key not in tree: tree[key] = {"views": rnd.randint(1, 500)}
+    return tree
+
+def count_listings(tree):
+    return sum(len(tree.get(site) or {}) for site in SITE_KEYS)
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    json.dump(make_tree(n), sys.stdout, ensure_ascii=False)
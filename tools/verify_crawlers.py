@@ -0,0 +1,353 @@
+"""
+크롤러 엔진(crawlers/crawler.py) + 프로필(crawlers/profiles.py) 검증 + 시간 측정
+네트워크 없이 tools/fixtures/crawlers/ 의 저장된 HTML을 씁니다.
+- 파서: 쇼핑몰별 저장 HTML -> 상품(이름/가격/이미지/URL)과 마지막 페이지 번호가 expected.json과 같음
+  (Cafe24 숨김 라벨, 소비자가/괄호 할인 금액, 품절/최저가 미만/묶음 상품 제외, alt 이름, data-prod-price, 지연 로딩 이미지,
+   아임웹/고도몰 목록, 샵바이 상세 페이지)
+- 브라우저 추출: EXTRACT_SCRIPT가 돌려주는 상품 요소만 파싱해도(parse_extracted) 전체 HTML 파싱과 같은 상품/마지막 페이지
+- Firebase 키/필드: 기존 크롤러와 같음 (이름 글자/숫자, 이삼액상 50자, 고도몰/샵바이 item_<번호> + img/link 필드)
+- 전체 수집: 쇼핑몰별 가짜 서버(요청마다 지연)와 가짜 브라우저 풀로 crawl_sites를 돌려 페이지 수/상품 수, 호스트별 동시 요청 상한,
+  브라우저는 자바스크립트로 그리는 쇼핑몰(juice99)과 fetch="browser" 프로필(siasiu, 브라우저마다 로그인 한 번)만 쓰는지,
+  풀 크기/재시작(recycle) 상한을 지키는지 확인하고, 순서대로 받을 때 / 기존 Selenium 크롤러의 고정 대기와 시간 비교
+- 대기: 브라우저 페이지마다 대기 시간 기록, 쇼핑몰별 최대 대기, 빈 마지막 페이지는 일찍 멈춤, waits.jsonl 기록/요약
+- 시간 제한/오류 격리: 시간 제한을 넘긴 쇼핑몰은 남은 페이지를 건너뛰고, 응답이 503인 쇼핑몰은 실패로 남고, 나머지는 그대로
+
+사용법 (저장소 루트에서 실행):
+    python tools/verify_crawlers.py                  # 요청 지연 0.2초
+    python tools/verify_crawlers.py --latency 0.5
+    python tools/verify_crawlers.py --update         # 저장 HTML을 바꾼 뒤 expected.json 다시 쓰기
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import urllib.parse
+
+import requests
+from bs4 import BeautifulSoup
+from requests.adapters import BaseAdapter
+
+sys.path.insert(0, '.')
+sys.path.insert(0, 'tools')
+sys.path.insert(0, 'crawlers')
+import crawler
+from profiles import PROFILES
+from verify_thumbnails import check
+
+FIXTURE_DIR = os.path.join("tools", "fixtures", "crawlers")
+EXPECTED_FILE = os.path.join(FIXTURE_DIR, "expected.json")
+# 저장 HTML -> 쇼핑몰 (파서 확인용). _detail_ 은 상세 페이지
+FIXTURES = {"juice24": "juice24", "vape9": "vape9", "juicebox": "juicebox", "juice23": "juice23",
+            "juice99_shell": "juice99", "juice99_rendered": "juice99", "tjf": "tjf", "vapemonster": "vapemonster",
+            "siasiu_list": "siasiu", "siasiu_detail_10231": "siasiu", "siasiu_detail_10232": "siasiu"}
+# 가짜 서버: 쇼핑몰 -> (HTTP로 주는 HTML, 브라우저가 그린 HTML, 상품이 있는 페이지 수)
+# 페이지 목록이 없는 쇼핑몰은 상품이 없는 페이지가 나올 때까지 받으므로 (페이지 수 + 1)번 요청 (max_pages까지)
+SERVED = {
+    "juice24": ("juice24", None, 13),
+    "modu": ("juice24", None, 13),
+    "juice23": ("juice23", None, 2),
+    "vape9": ("vape9", None, 1),
+    "juicebox": ("juicebox", None, 5),
+    "juice99": ("juice99_shell", "juice99_rendered", 3),
+    "tjf": ("tjf", None, 5),
+    "vapemonster": ("vapemonster", None, 2),
+    "siasiu": (None, "siasiu_list", 2),
+}
+BROKEN_HOST = "broken.example"  # 가짜 서버가 항상 503을 돌려주는 호스트
+POOL_SIZE = 2
+RECYCLE_AFTER = 3
+EMPTY_PAGE = "<!DOCTYPE html><html><body><p>상품이 없습니다.</p></body></html>"
+# 기존 crawlers/<site>.py의 페이지당 고정 대기 (초), 샵바이는 상세 페이지마다 4초 더
+
+def fixture(name):
+    with open(os.path.join(FIXTURE_DIR, f"{name}.html"), "r", encoding="utf-8") as f:
+        return f.read()
+
+def site_of(url):
+    host = urllib.parse.urlsplit(url).netloc
+    return next(site for site, profile in PROFILES.items() if urllib.parse.urlsplit(profile["base"]).netloc == host)
+
+def page_of(url):
+    query = urllib.parse.parse_qs(urllib.parse.urlsplit(url).query)
+    return int((query.get("page") or query.get("productListPage") or query.get("pageNumber"))[0])
+
+def served_html(url, rendered):
+    site = site_of(url)
+    product_no = crawler.url_param(url, "productNo")
+    if product_no: return fixture(f"siasiu_detail_{product_no}")
+    http_name, browser_name, pages = SERVED[site]
+    if page_of(url) > pages: return EMPTY_PAGE
+    return fixture(browser_name if rendered else http_name)
+
+class FixtureAdapter(BaseAdapter):
+    """requests 세션에 붙이는 가짜 서버: 요청마다 latency초 뒤 저장 HTML. 호스트별 최대 동시 요청 수 기록"""
+    def __init__(self, latency):
+        super().__init__()
+        self.latency = latency
+        self.lock = threading.Lock()
+        self.active = {}
+        self.peak = {}
+        self.requests = 0
+
+    def send(self, request, **kwargs):
+        host = urllib.parse.urlsplit(request.url).netloc
+        if host == BROKEN_HOST:
+            response = requests.Response()
+            response.status_code = 503
+            response.url = request.url
+            response.request = request
+            return response
+        with self.lock:
+            self.requests += 1
+            self.active[host] = self.active.get(host, 0) + 1
+            self.peak[host] = max(self.peak.get(host, 0), self.active[host])
+        try:
+            time.sleep(self.latency)
+            response = requests.Response()
+            response.status_code = 200
+            response._content = served_html(request.url, rendered=False).encode("utf-8")
+            response.encoding = "utf-8"
+            response.url = request.url
+            response.request = request
+            return response
+        finally:
+            with self.lock:
+                self.active[host] -= 1
+
+    def close(self):
+        pass
+
+def extract_html(html, selectors, paging=None, pick_each=False):
+    """crawler.EXTRACT_SCRIPT를 BeautifulSoup으로 흉내 (가짜 브라우저/벤치마크용, 같은 선택자 규칙). html은 파싱한 soup여도 됨"""
+    soup = html if isinstance(html, BeautifulSoup) else BeautifulSoup(html, crawler.HTML_PARSER)
+    items = []
+    for selector in selectors:
+        if pick_each:
+            element = soup.select_one(selector)
+            if element is not None: items.append(str(element))
+            continue
+        found = soup.select(selector)
+        if found:
+            items = [str(element) for element in found
+                     if not any(other is not element and element in other.parents for other in found)]
+            break
+    hrefs = [link.get("href", "") for link in soup.select(paging)] if paging else []
+    return {"items": items, "paging": hrefs}
+
+class BrowserLog:
+    """가짜 브라우저들이 함께 쓰는 기록: 그린 URL, 로그인, 브라우저별 페이지 수, 최대 동시 렌더 수"""
+    def __init__(self, latency):
+        self.latency = latency
+        self.lock = threading.Lock()
+        self.urls = []
+        self.timeouts = []
+        self.logins = 0
+        self.browsers = []
+        self.active = 0
+        self.peak = 0
+
+class FakeBrowser:
+    """
+    crawler.Browser 대신 (BrowserPool의 factory): 그린 HTML에서 extract_html로 뽑아 돌려주고 BrowserLog에 기록.
+    상품이 latency초 뒤 뜬다고 보고 그만큼 기다렸다고 보고. 빈 페이지는 empty_after(없으면 timeout)까지 기다렸다고만 보고 (실제로 쉬지는 않음)
+    """
+    def __init__(self, log):
+        self.log = log
+        self.pages = 0
+        self.calls = 0
+        self.logged_in = set()
+        self.closed = False
+        with log.lock:
+            log.browsers.append(self)
+
+    def extract(self, url, wait, selectors, paging=None, pick_each=False, login=None, timeout=None, empty_after=None):
+        assert not self.closed
+        with self.log.lock:
+            self.log.active += 1
+            self.log.peak = max(self.log.peak, self.log.active)
+            if login and login["url"] not in self.logged_in:
+                self.logged_in.add(login["url"])
+                self.log.logins += 1
+        try:
+            time.sleep(self.log.latency)
+            self.pages += 1
+            self.calls += 3  # get, 대기 중 요소 찾기, execute_script
+            with self.log.lock:
+                self.log.urls.append(url)
+                self.log.timeouts.append(timeout)
+            extracted = extract_html(served_html(url, rendered=True), selectors, paging, pick_each)
+            ready = bool(extracted["items"])
+            waited = self.log.latency if ready else (empty_after if empty_after is not None else timeout)
+            return {**extracted, "waited": waited, "ready": ready}
+        finally:
+            with self.log.lock:
+                self.log.active -= 1
+
+    def close(self):
+        self.closed = True
+
+def detail_stub(name, profile):
+    product_no = name.rsplit("_", 1)[1]
+    return {"url": f"{profile['base']}/pages/product/product-detail.html?productNo={product_no}", "id": product_no}
+
+def parsed_fixtures():
+    result = {}
+    for name, site in FIXTURES.items():
+        profile = PROFILES[site]
+        if "_detail_" in name:
+            result[name] = {"site": site, "product": crawler.parse_detail(fixture(name), profile, detail_stub(name, profile))}
+            continue
+        products, last_page, count, has_list = crawler.parse_list(fixture(name), profile)
+        result[name] = {"site": site, "last_page": last_page, "items": count, "has_list": has_list, "products": products}
+    return result
+
+def extracted_matches(parsed):
+    """저장 HTML마다 브라우저 추출 결과를 파싱한 값 == 전체 HTML 파싱 값"""
+    mismatched = []
+    for name, site in FIXTURES.items():
+        profile = PROFILES[site]
+        if "_detail_" in name:
+            detail = profile["detail"]
+            selectors = (crawler._selectors(detail["name"]) + crawler._selectors(detail["price"])
+                         + crawler._selectors(detail.get("image")))
+            extracted = extract_html(fixture(name), selectors, pick_each=True)
+            if crawler.parse_detail("".join(extracted["items"]), profile, detail_stub(name, profile)) != parsed[name]["product"]:
+                mismatched.append(name)
+            continue
+        if not parsed[name]["has_list"]: continue
+        extracted = extract_html(fixture(name), crawler._selectors(profile["item"]), profile.get("paging"))
+        products, last_page, count, _ = crawler.parse_extracted(extracted, profile)
+        if (products, last_page, count > 0) != (parsed[name]["products"], parsed[name]["last_page"], parsed[name]["items"] > 0):
+            mismatched.append(name)
+    return mismatched
+
+def served_products(expected, site):
+    """가짜 서버가 주는 한 페이지의 (이름, 가격) 목록 (페이지마다 같은 상품이라 중복 제거 후 결과와 같아야 함)"""
+    http_name, browser_name, _ = SERVED[site]
+    if site == "siasiu":
+        products = [expected[f"siasiu_detail_{stub['id']}"]["product"] for stub in expected[browser_name]["products"]]
+        return [(p["name"], p["price"]) for p in products if p]
+    return [(p["name"], p["price"]) for p in expected[browser_name or http_name]["products"]]
+
+def verify(latency):
+    ok = True
+    with open(EXPECTED_FILE, "r", encoding="utf-8") as f:
+        expected = json.load(f)
+    parsed = parsed_fixtures()
+    for name in FIXTURES:
+        result = parsed[name]
+        detail = (f"{len(result['products'])} products, last page {result['last_page']}" if "products" in result
+                  else json.dumps(result["product"], ensure_ascii=False)[:60])
+        ok &= check(f"parse {name}.html", result == expected[name], detail)
+
+    mismatched = extracted_matches(parsed)
+    ok &= check("browser extraction (item elements only) parses like the full page", not mismatched,
+                ", ".join(mismatched))
+
+    def updates(site, name):
+        return crawler.product_updates(site, parsed[name]["products"], "2024-01-01 00:00:00")
+    juice23_keys = {path.split("/")[0] for path in updates("juice23", "juice23")}
+    vapemonster = updates("vapemonster", "vapemonster")
+    ok &= check("Firebase keys/fields match the old crawlers",
+                "네스티망고30ml/price" in updates("juice24", "juice24") and max(map(len, juice23_keys)) == 50
+                and "item_1000000123/img" in vapemonster and "item_1000000123/link" in vapemonster
+                and not any(path.endswith(("/image", "/url")) for path in vapemonster))
+
+    adapter = FixtureAdapter(latency)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    fetcher = crawler.PageFetcher(session=session)
+    log = BrowserLog(latency)
+    pool = crawler.BrowserPool(size=POOL_SIZE, recycle_after=RECYCLE_AFTER, factory=lambda: FakeBrowser(log))
+    start = time.perf_counter()
+    crawls = crawler.crawl_sites(list(SERVED), fetcher=fetcher, browser=pool)
+    elapsed = time.perf_counter() - start
+    pool.close()
+    crawler.report(crawls, elapsed, pool)
+
+    counts_ok = True
+    for site, (http_name, browser_name, pages) in SERVED.items():
+        crawl = crawls[site]
+        paged = parsed[http_name or browser_name]["last_page"] is not None
+        expected_pages = pages if paged else min(pages + 1, PROFILES[site]["max_pages"])
+        site_ok = ([(p["name"], p["price"]) for p in crawl.products()] == served_products(expected, site)
+                   and not crawl.errors and len(crawl.pages) == expected_pages)
+        if not site_ok: print(f"       {site}: {len(crawl.pages)} pages (expected {expected_pages}), {crawl.errors[:1]}")
+        counts_ok &= site_ok
+    ok &= check("every page fetched once, products deduplicated in page order", counts_ok)
+    ok &= check(f"at most {crawler.HOST_CONCURRENCY} concurrent requests per host",
+                max(adapter.peak.values()) <= crawler.HOST_CONCURRENCY, f"peak {max(adapter.peak.values())}")
+    browser_sites = {site_of(url) for url in log.urls}
+    siasiu_browsers = [b for b in log.browsers if b.logged_in]
+    ok &= check("browser only for the JavaScript-rendered shop and browser profiles, one login per browser",
+                browser_sites == {"juice99", "siasiu"} and log.logins == len(siasiu_browsers) <= pool.started,
+                f"{len(log.urls)} browser pages, {log.logins} logins")
+    ok &= check(f"browser pool: at most {POOL_SIZE} rendering at once, recycled after {RECYCLE_AFTER} pages",
+                log.peak <= POOL_SIZE and max(b.pages for b in log.browsers) <= RECYCLE_AFTER and pool.recycled > 0
+                and all(b.closed for b in log.browsers) and pool.pages == len(log.urls),
+                f"peak {log.peak}, {pool.started} started, {pool.recycled} recycled")
+
+    sequential = (adapter.requests + len(log.urls)) * latency
+    selenium = sum(crawl.fixed_wait() for crawl in crawls.values())
+    print(f"[TIME] {adapter.requests} HTTP + {len(log.urls)} browser pages at {latency:.2f}s each: "
+          f"{elapsed:.2f}s (one at a time: {sequential:.1f}s, old Selenium fixed waits alone: {selenium:g}s)")
+    ok &= check("concurrent crawl is faster than fetching pages one at a time", elapsed < sequential / 2)
+    ok &= check_waits(crawls, log)
+    ok &= check_isolation(latency)
+    return ok
+
+def check_waits(crawls, log):
+    """
+    브라우저 페이지마다 대기 시간 기록, 쇼핑몰별 wait_timeout(juice99 30초), 2페이지부터 빈 페이지는 EMPTY_WAIT에서 멈춤,
+    기록 파일(waits.jsonl)에 쇼핑몰별 한 줄
+    """
+    juice99, siasiu = crawls["juice99"], crawls["siasiu"]
+    waits_ok = (len(juice99.waits) == juice99.browser_pages and len(siasiu.waits) == siasiu.browser_pages
+                and not any(crawl.waits for site, crawl in crawls.items() if site not in ("juice99", "siasiu"))
+                and juice99.wait_timeouts == 1 and max(juice99.waits) == crawler.EMPTY_WAIT
+                and 25 < max(log.timeouts) <= PROFILES["juice99"]["wait_timeout"]
+                and min(t for url, t in zip(log.urls, log.timeouts) if site_of(url) == "siasiu") <= crawler.BROWSER_TIMEOUT)
+    with tempfile.TemporaryDirectory() as workdir:
+        path = os.path.join(workdir, "waits.jsonl")
+        crawler.record_waits(crawls, path)
+        crawler.record_waits(crawls, path)
+        with open(path, "r", encoding="utf-8") as f:
+            records = [json.loads(line) for line in f]
+        crawler.print_wait_stats(path)
+    recorded_ok = (len(records) == 4 and {r["site"] for r in records} == {"juice99", "siasiu"}
+                   and records[0]["waits"] == [round(wait, 2) for wait in crawls[records[0]["site"]].waits])
+    saved = sum(crawl.fixed_wait() for crawl in crawls.values()) - sum(sum(crawl.waits) for crawl in crawls.values())
+    return check("readiness waits recorded per browser page with per-site limits", waits_ok and recorded_ok,
+                 f"{sum(len(c.waits) for c in crawls.values())} waits, saved {saved:.1f}s vs fixed sleeps")
+
+def check_isolation(latency):
+    """시간 제한을 넘긴 쇼핑몰(juicebox, 0.5초)과 503만 주는 쇼핑몰이 다른 쇼핑몰(juice24)에 영향을 주지 않음"""
+    profiles = {"juice24": PROFILES["juice24"], "juicebox": {**PROFILES["juicebox"], "timeout": 0.5},
+                "broken": {**PROFILES["juice24"], "base": f"https://{BROKEN_HOST}"}}
+    session = requests.Session()
+    session.mount("https://", FixtureAdapter(latency))
+    start = time.perf_counter()
+    crawls = crawler.crawl_sites(list(profiles), fetcher=crawler.PageFetcher(session=session), profiles=profiles)
+    elapsed = time.perf_counter() - start
+    crawler.report(crawls, elapsed)
+    juicebox = crawls["juicebox"]
+    return check("site timeout and failures stay with their site",
+                 crawls["juice24"].status() == "ok" and len(crawls["juice24"].pages) == SERVED["juice24"][2]
+                 and juicebox.status() == "timeout" and len(juicebox.pages) < SERVED["juicebox"][2]
+                 and juicebox.seconds < 0.5 + 2 * latency and crawls["broken"].status() == "failed",
+                 f"juicebox stopped after {len(juicebox.pages)} pages in {juicebox.seconds:.2f}s")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--latency", type=float, default=0.2, help="가짜 서버 응답 지연 (초)")
+    parser.add_argument("--update", action="store_true", help="expected.json 다시 쓰기")
+    args = parser.parse_args()
+    if args.update:
+        with open(EXPECTED_FILE, "w", encoding="utf-8") as f:
+            json.dump(parsed_fixtures(), f, ensure_ascii=False, indent=1)
+        print(f"[INFO] Wrote {EXPECTED_FILE}")
+        sys.exit(0)
+    sys.exit(0 if verify(args.latency) else 1)
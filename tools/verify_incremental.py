@@ -0,0 +1,90 @@
+"""
+증분 병합 검증: 이전 상태에서 상품을 추가/변경/삭제한 뒤
+증분 병합 결과가 전체 재빌드 결과와 바이트 단위로 같은지 확인합니다.
+가격 규칙(MAX_PRICE)이 바뀐 뒤에는 원본이 그대로여도 옛 병합 결과를 다시 쓰지 않는지도 확인합니다.
+
+사용법 (저장소 루트에서 실행):
+    python tools/verify_incremental.py
+"""
+import copy
+import json
+import os
+import random
+import sys
+import tempfile
+from unittest import mock
+
+sys.path.insert(0, '.')
+import build_site
+
+def make_tree(names, rnd, per_site=300):
+    tree = {}
+    for site in build_site.SITES:
+        tree[site] = {}
+        for i in range(per_site):
+            tree[site][f"item{i:05d}"] = {
+                "name": rnd.choice(names),
+                "price": rnd.choice([rnd.randint(3000, 20000), "12,900원", 0]),
+                "image": rnd.choice(["", f"//cdn.example.com/{site}/{i}.jpg", "https://cdn.example.com/icon_new.gif"]),
+                "url": rnd.choice(["", f"https://{site}.example.com/product/{i}"]),
+                "last_update": "2026-01-01 00:00:00"
+            }
+    return tree
+
+def mutate(tree, names, rnd):
+    tree = copy.deepcopy(tree)
+    for site in build_site.SITES:
+        keys = list(tree[site])
+        for k in rnd.sample(keys, 20): del tree[site][k]
+        for k in rnd.sample(list(tree[site]), 20): tree[site][k]["price"] = rnd.randint(3000, 9000)
+        for k in rnd.sample(list(tree[site]), 5): tree[site][k]["name"] = rnd.choice(names)
+        # last_update만 바뀐 상품은 재계산 대상이 아니어야 함
+        for k in rnd.sample(list(tree[site]), 30): tree[site][k]["last_update"] = "2026-01-02 00:00:00"
+        for i in range(15):
+            tree[site][f"item{rnd.randint(0, 400):05d}n"] = {"name": rnd.choice(names), "price": rnd.randint(3000, 9000)}
+        tree[site] = dict(sorted(tree[site].items()))
+    return tree
+
+def with_concatenated_prices(tree, rnd):
+    """가격 여러 개가 붙은 문자열 (예전 규칙으로는 120,009,900원 같은 가격이 됨)"""
+    tree = copy.deepcopy(tree)
+    for site in build_site.SITES:
+        for k in rnd.sample(list(tree[site]), 10): tree[site][k]["price"] = "12,000원 9,900원"
+    return tree
+
+def check_price_rule_change(names, rnd, cache):
+    """예전 가격 규칙으로 만든 상태 -> 같은 원본을 지금 규칙으로 증분 병합해도 전체 재빌드와 같아야 함"""
+    tree = with_concatenated_prices(make_tree(names, rnd), rnd)
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "merge_state.json")  # 실제 빌드처럼 저장/로드 (버전 확인은 load_merge_state에서)
+        with mock.patch.object(build_site, "MAX_PRICE", 10 ** 12):
+            _, old_state = build_site.merge_products(build_site.iter_tree_pages(tree), {}, state=None, norm_cache=cache)
+            build_site.save_merge_state(old_state, path)
+        old_state = build_site.load_merge_state(path)
+    incremental, _ = build_site.merge_products(build_site.iter_tree_pages(tree), {}, state=old_state, norm_cache=cache)
+    full, _ = build_site.merge_products(build_site.iter_tree_pages(tree), {}, state=None, norm_cache=cache)
+    prices = [info["price"] for item in incremental.values() for info in item["prices"].values()]
+    return dump(incremental) == dump(full) and max(prices) < build_site.MAX_PRICE
+
+def dump(obj):
+    return json.dumps(obj, ensure_ascii=False)
+
+if __name__ == "__main__":
+    rnd = random.Random(7)
+    with open("tools/normalize_golden.json", "r", encoding="utf-8") as f:
+        names = [case['raw'] for case in json.load(f)]
+    cache = build_site.NormalizeCache(path='')
+
+    before = make_tree(names, rnd)
+    _, state = build_site.merge_products(build_site.iter_tree_pages(before), {}, state=None, norm_cache=cache)
+    state = json.loads(dump(state))  # 디스크 저장/로드와 같은 조건
+
+    after = mutate(before, names, rnd)
+    incremental, inc_state = build_site.merge_products(build_site.iter_tree_pages(after), {}, state=state, norm_cache=cache)
+    full, full_state = build_site.merge_products(build_site.iter_tree_pages(after), {}, state=None, norm_cache=cache)
+
+    ok = dump(incremental) == dump(full) and dump(inc_state) == dump(full_state)
+    print(f"[{'PASS' if ok else 'FAIL'}] 증분 병합 == 전체 재빌드 ({len(full)} keys)")
+    rule_ok = check_price_rule_change(names, rnd, cache)
+    print(f"[{'PASS' if rule_ok else 'FAIL'}] 가격 규칙(MAX_PRICE) 변경 후 증분 병합 == 전체 재빌드 (옛 가격 재사용 없음)")
+    sys.exit(0 if ok and rule_ok else 1)
@@ -0,0 +1,173 @@
+"""
+압축 단계(precompress.py) 검증 + 시간 측정
+합성 카탈로그로 리포트를 만든 뒤 optimize_files를 두 번 돌려(빈 캐시 / 재사용) 다음을 확인합니다.
+- HTML: 태그/속성 순서와 (공백을 묶은) 글 내용이 원본과 같음, 인라인 <script>는 node --check 통과
+- CSS: 주석/공백/} 앞 ; 를 뺀 내용이 원본과 같음
+- JS: node --check 통과, 줄인 catalog.js/search.js로 bench_client/bench_search 검사도 통과
+- 압축본: 캐시의 gzip/brotli를 풀면 줄인 파일과 같고, 두 번째 실행과 같은 데이터로 다시 빌드한 뒤의 실행은 전부 캐시 재사용
+
+사용법 (저장소 루트에서 실행):
+    python tools/verify_minify.py                   # 상품 5k
+    python tools/verify_minify.py --products 20000
+"""
+import argparse
+import contextlib
+import gzip
+import io
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from html.parser import HTMLParser
+
+sys.path.insert(0, '.')
+sys.path.insert(0, 'tools')
+import build_site
+import precompress
+import bench_client
+import bench_search
+from verify_report import make_catalog
+
+REPO_ROOT = os.path.abspath('.')
+
+class StructureParser(HTMLParser):
+    """태그/속성/글 내용 목록 (글은 공백을 한 칸으로 묶어 비교). 인라인 스크립트 본문은 따로 모음"""
+    def __init__(self):
+        super().__init__(convert_charrefs=False)
+        self.items = []
+        self.scripts = []
+        self.raw_tag = None
+
+    def handle_starttag(self, tag, attrs):
+        self.items.append(("start", tag, tuple(attrs)))
+        self.raw_tag = tag if tag in ("script", "style") else None
+        self.script_type = dict(attrs).get("type") or ""
+
+    def handle_endtag(self, tag):
+        self.items.append(("end", tag))
+        self.raw_tag = None
+
+    def handle_data(self, data):
+        if self.raw_tag == "script":
+            self.scripts.append((self.script_type, data))
+        elif self.raw_tag is None:
+            text = " ".join(data.split())
+            if text: self.items.append(("data", text))
+
+def html_structure(content):
+    parser = StructureParser()
+    parser.feed(content)
+    return parser.items, parser.scripts
+
+def css_normalized(content, comments=True):
+    if comments: content = re.sub(r"/\*.*?\*/", "", content, flags=re.S)
+    return re.sub(r"\s+", "", content).replace(";}", "}")
+
+def node_check(source):
+    fd, path = tempfile.mkstemp(suffix=".js")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(source)
+    try:
+        return subprocess.run(["node", "--check", path], capture_output=True).returncode == 0
+    finally:
+        os.remove(path)
+
+def check_file(path, original, minified):
+    """원본과 줄인 내용이 같은 뜻인지 (확인할 수 없는 형식은 True)"""
+    ext = os.path.splitext(path)[1]
+    if ext == ".html":
+        before, original_scripts = html_structure(original)
+        after, scripts = html_structure(minified)
+        if before != after or len(original_scripts) != len(scripts): return False
+        for (script_type, source), (_, script) in zip(original_scripts, scripts):
+            if script_type.endswith("json"):
+                if json.loads(source) != json.loads(script): return False
+            elif shutil.which("node") and not node_check(script):
+                return False
+        return True
+    if ext == ".css":
+        return css_normalized(original) == css_normalized(minified, comments=False)
+    if ext == ".js":
+        return node_check(minified) if shutil.which("node") else True
+    return original == minified
+
+def verify(products):
+    catalog = build_site.Catalog(list(make_catalog(products * 2).items())[:products])
+    workdir = tempfile.mkdtemp(prefix="verify_minify_")
+    try:
+        shutil.copytree(os.path.join(REPO_ROOT, build_site.ASSET_DIR), os.path.join(workdir, build_site.ASSET_DIR))
+        shutil.copy(os.path.join(REPO_ROOT, "sw.js"), workdir)
+        filename = os.path.join(workdir, "index.html")
+        with contextlib.redirect_stdout(io.StringIO()):
+            build_site.generate_report(catalog, build_site.SITES, filename=filename)
+        paths = build_site.report_output_files(filename)
+        originals = {}
+        for rel_path in paths:
+            with open(os.path.join(workdir, rel_path), "rb") as f:
+                originals[rel_path] = f.read()
+        cache_dir = os.path.join(workdir, ".cache", "precompressed")
+
+        print(f"[VERIFY] {len(catalog):,} products, {len(paths)} files")
+        timings, runs = [], []
+        for _ in range(2):
+            start = time.perf_counter()
+            runs.append(precompress.optimize_files(paths, root=workdir, cache_dir=cache_dir))
+            timings.append(time.perf_counter() - start)
+        precompress.report(runs[0])
+        ok = all(result["cached"] for result in runs[1])
+        print(f"[{'PASS' if ok else 'FAIL'}] optimize cold {timings[0]:.2f}s -> again {timings[1]:.2f}s (all cached)")
+        # 같은 데이터로 다시 빌드: 새로 쓴 (줄이기 전) 파일도 줄이기/압축 없이 캐시에서 복원
+        with contextlib.redirect_stdout(io.StringIO()):
+            build_site.generate_report(catalog, build_site.SITES, filename=filename)
+        start = time.perf_counter()
+        rebuilt = precompress.optimize_files(paths, root=workdir, cache_dir=cache_dir)
+        seconds = time.perf_counter() - start
+        same = all(result["cached"] for result in rebuilt) and [r["minified"] for r in rebuilt] == [r["minified"] for r in runs[0]]
+        ok = ok and same
+        print(f"[{'PASS' if same else 'FAIL'}] rebuild with unchanged data {seconds:.2f}s (all restored from cache)")
+
+        bad = []
+        for rel_path in paths:
+            with open(os.path.join(workdir, rel_path), "rb") as f:
+                minified = f.read()
+            if not check_file(rel_path, originals[rel_path].decode("utf-8"), minified.decode("utf-8")):
+                bad.append(rel_path)
+                continue
+            digest = precompress.content_digest(minified)
+            with open(precompress.precompressed_path(digest, "gz", cache_dir), "rb") as f:
+                if gzip.decompress(f.read()) != minified: bad.append(rel_path + " (gz)")
+            if precompress.brotli is not None:
+                with open(precompress.precompressed_path(digest, "br", cache_dir), "rb") as f:
+                    if precompress.brotli.decompress(f.read()) != minified: bad.append(rel_path + " (br)")
+        print(f"[{'PASS' if not bad else 'FAIL'}] same structure/content and round-trip for every file"
+              + (f": {', '.join(bad[:5])}" if bad else ""))
+        ok = ok and not bad
+
+        # 줄인 JS로 검색/정렬 결과가 그대로인지
+        asset_urls = {os.path.basename(p).split(".")[0]: os.path.join(workdir, p) for p in paths if p.endswith(".js")}
+        shard_root = os.path.join(workdir, build_site.SHARD_DIR)
+        catalog_path = os.path.join(shard_root, build_site.SHARD_CATALOG_FILE)
+        search_path = os.path.join(shard_root, build_site.SHARD_SEARCH_FILE)
+        client = bench_client.run_node(catalog_path, catalog_js=asset_urls["catalog"])
+        search = bench_search.run_node(catalog_path, search_path, asset_dir="",
+                                       catalog_js=asset_urls["catalog"], search_js=asset_urls["search"])
+        if client is not None:
+            same = all(row["same"] for row in client) and all(row["ok"] for row in search["results"])
+            ok = ok and same
+            print(f"[{'PASS' if same else 'FAIL'}] minified catalog.js/search.js give the same search/sort results")
+        return ok
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--products", default="5000", help="상품 수 (쉼표 구분)")
+    args = parser.parse_args()
+    ok = True
+    for products in (int(n) for n in args.products.split(",") if n):
+        ok = verify(products) and ok
+    sys.exit(0 if ok else 1)
@@ -0,0 +1,155 @@
+"""
+리포트 출력 검증 + 생성 시간 측정
+합성 카탈로그로 현재 작업 트리의 generate_report 결과(index.html + shards/)와
+기준 커밋의 build_site.py 결과가 바이트 단위로 같은지 확인합니다. (시간 기반 버전키를 쓰던 커밋과 비교할 수 있게 시간은 고정)
+현재 트리는 빌드 시각이 달라도 결과가 같아야 합니다. (결정적 빌드)
+카드 캐시(CardCache)를 쓴 결과도 빈 캐시 / 재사용 / 일부 변경 상황에서 같은지 확인합니다.
+
+사용법 (저장소 루트에서 실행):
+    python tools/verify_report.py                       # 기준: HEAD (리팩터링 후 커밋 전에 실행)
+    python tools/verify_report.py --rev HEAD~1 --sizes 1000,20000 --memory
+"""
+import argparse
+import atexit
+import contextlib
+import filecmp
+import importlib.util
+import io
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from unittest import mock
+
+sys.path.insert(0, '.')
+sys.path.insert(0, 'tools')
+import build_site
+from synthetic_catalog import make_tree
+
+FIXED_TIME = 1700000000
+
+def load_revision(rev):
+    """
+    git show <rev>:build_site.py 를 별도 모듈로 로드.
+    임시 파일은 종료할 때 지움 (버전키가 inspect.getsource로 템플릿 소스를 읽으므로 렌더링이 끝날 때까지 남겨 둠)
+    """
+    source = subprocess.check_output(["git", "show", f"{rev}:build_site.py"])
+    fd, path = tempfile.mkstemp(suffix=".py", prefix="build_site_ref_")
+    with os.fdopen(fd, "wb") as f:
+        f.write(source)
+    spec = importlib.util.spec_from_file_location("build_site_ref", path)
+    module = importlib.util.module_from_spec(spec)
+    with contextlib.redirect_stdout(io.StringIO()):
+        spec.loader.exec_module(module)
+    atexit.register(os.remove, path)
+    return module
+
+def make_catalog(listings):
+    tree = make_tree(listings, seed=listings)
+    with contextlib.redirect_stdout(io.StringIO()):
+        merged, _ = build_site.merge_products(build_site.iter_tree_pages(tree), build_site.views_from_tree(tree),
+                                              norm_cache=build_site.NormalizeCache(path=''))
+    catalog = build_site.Catalog.from_merged(merged)
+    return catalog
+
+def shard_path(path):
+    return os.path.splitext(path)[0] + "_shards"
+
+def same_output(current_path, reference_path):
+    """index.html과 카드 조각 폴더(있으면)가 모두 같은지"""
+    if not filecmp.cmp(current_path, reference_path, shallow=False): return False
+    current_dir, reference_dir = shard_path(current_path), shard_path(reference_path)
+    if not (os.path.isdir(current_dir) or os.path.isdir(reference_dir)): return True
+    if not (os.path.isdir(current_dir) and os.path.isdir(reference_dir)): return False
+    current_files = sorted(os.path.relpath(os.path.join(root, name), current_dir)
+                           for root, _, names in os.walk(current_dir) for name in names)
+    reference_files = sorted(os.path.relpath(os.path.join(root, name), reference_dir)
+                             for root, _, names in os.walk(reference_dir) for name in names)
+    if current_files != reference_files: return False
+    _, mismatch, errors = filecmp.cmpfiles(current_dir, reference_dir, current_files, shallow=False)
+    return not mismatch and not errors
+
+def remove_output(path):
+    os.remove(path)
+    shutil.rmtree(shard_path(path), ignore_errors=True)
+
+def render(module, catalog, path, trace_memory=False, now=FIXED_TIME, **kwargs):
+    """
+    module.generate_report 로 path에 리포트를 쓰고 (소요 시간, tracemalloc 최대 할당 바이트)를 돌려줌
+    카드 조각(shards/)을 만드는 버전이면 <path 이름>_shards/ 로 옮겨 둠
+    """
+    cwd = os.getcwd()
+    workdir = tempfile.mkdtemp(prefix="verify_report_")
+    try:
+        os.chdir(workdir)
+        with mock.patch("time.time", return_value=now), contextlib.redirect_stdout(io.StringIO()):
+            if trace_memory: tracemalloc.start()
+            start = time.perf_counter()
+            module.generate_report(catalog, build_site.SITES, **kwargs)
+            seconds = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1] if trace_memory else None
+            if trace_memory: tracemalloc.stop()
+        os.replace("index.html", path)
+        shutil.rmtree(shard_path(path), ignore_errors=True)
+        if os.path.isdir("shards"): os.replace("shards", shard_path(path))
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(workdir, ignore_errors=True)
+    return seconds, peak
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rev", default="HEAD", help="비교 기준 커밋")
+    parser.add_argument("--sizes", default="1000,10000,30000", help="합성 상품 레코드 수 (쉼표 구분)")
+    parser.add_argument("--memory", action="store_true", help="생성 중 최대 메모리 할당량도 비교 (느려짐)")
+    args = parser.parse_args()
+
+    reference = load_revision(args.rev)
+    ok = True
+    outdir = tempfile.mkdtemp(prefix="verify_report_out_")
+    for listings in (int(n) for n in args.sizes.split(",") if n):
+        catalog = make_catalog(listings)
+        current_path = os.path.join(outdir, f"current_{listings}.html")
+        reference_path = os.path.join(outdir, f"reference_{listings}.html")
+        current_sec, _ = render(build_site, catalog, current_path)
+        reference_sec, _ = render(reference, catalog, reference_path)
+        same = same_output(current_path, reference_path)
+        ok = ok and same
+        print(f"[{'PASS' if same else 'FAIL'}] {len(catalog):>6,} products ({os.path.getsize(current_path) / 1e6:.1f}MB) "
+              f"| {args.rev} {reference_sec:.3f}s -> current {current_sec:.3f}s")
+        # 결정적 빌드: 하루 뒤에 다시 만들어도 같은 결과
+        rebuild_path = os.path.join(outdir, f"rebuild_{listings}.html")
+        render(build_site, catalog, rebuild_path, now=FIXED_TIME + 86400)
+        deterministic = same_output(current_path, rebuild_path)
+        ok = ok and deterministic
+        print(f"[{'PASS' if deterministic else 'FAIL'}]   rebuild at a later time is byte-identical")
+        if deterministic: remove_output(rebuild_path)
+        # 카드 캐시: 빈 캐시 / 전부 재사용 / 일부 상품 변경 후에도 캐시 없이 만든 결과와 같아야 함
+        cache_dir = tempfile.mkdtemp(prefix="verify_report_cards_")
+        cache_path = os.path.join(cache_dir, "cards")
+        for label in ("cold", "warm", "changed"):
+            if label == "changed":
+                for product in list(catalog.values())[::50]: product.views += 1
+                render(build_site, catalog, reference_path)
+            card_cache = build_site.CardCache(cache_path)
+            cached_sec, _ = render(build_site, catalog, current_path, card_cache=card_cache)
+            card_cache.close()
+            cached_same = same_output(current_path, reference_path)
+            ok = ok and cached_same
+            print(f"[{'PASS' if cached_same else 'FAIL'}]   card cache {label:<7} {cached_sec:.3f}s "
+                  f"(reused {card_cache.reused}, re-rendered {card_cache.rendered})")
+        shutil.rmtree(cache_dir, ignore_errors=True)
+        if args.memory:
+            # 시간 측정과 따로, tracemalloc을 켠 상태로 한 번 더 생성
+            _, current_peak = render(build_site, catalog, current_path, trace_memory=True)
+            _, reference_peak = render(reference, catalog, reference_path, trace_memory=True)
+            print(f"       peak alloc {args.rev} {reference_peak / 1e6:.1f}MB -> current {current_peak / 1e6:.1f}MB")
+        if same:
+            remove_output(current_path)
+            remove_output(reference_path)
+    if ok: os.rmdir(outdir)
+    else: print(f"[INFO] 결과 파일: {outdir}")
+    sys.exit(0 if ok else 1)
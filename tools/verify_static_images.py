@@ -0,0 +1,142 @@
+"""
+정적 이미지 단계(static_images.py) 검증 + 시간 측정
+저장소의 assets/*.png, manifest.json을 임시 폴더로 복사해 optimize_static_images를 돌리고 다음을 확인합니다.
+- manifest.json은 같은 URL(/manifest.json, sw.js가 미리 받음)에서 크기별 아이콘을 가리킴
+- 용도별 파일이 정해진 크기이고, PNG는 같은 크기로 줄인 원본과 픽셀이 같음 (무손실), WebP/AVIF는 PNG보다 작음
+- 두 번째 실행은 전부 캐시, 원본 하나를 바꾸면 그 원본만 다시 만들고 이전 파일은 지움
+- index.html: 크기별 아이콘/manifest/OG 이미지 URL을 쓰고 원본 PNG는 참조하지 않음, 참조한 파일은 모두 있음
+- 이미지 없는 카드: 자리 이미지 <picture>(AVIF/WebP), assets/catalog.js cardHtml과 같은 마크업 (node 있을 때)
+
+사용법 (저장소 루트에서 실행):
+    python tools/verify_static_images.py
+"""
+import contextlib
+import io
+import json
+import os
+import re
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, '.')
+sys.path.insert(0, 'tools')
+import build_site
+import static_images
+from verify_report import make_catalog
+from verify_thumbnails import check, node_cards
+
+REPO_ROOT = os.path.abspath('.')
+
+def expected_image(root, source, size):
+    from PIL import Image
+    with Image.open(os.path.join(root, static_images.SOURCE_DIR, source)) as image:
+        image = image.copy()
+    if size is not None: image.thumbnail((size, size), Image.LANCZOS)
+    return image
+
+def same_pixels(path, expected):
+    from PIL import Image
+    with Image.open(path) as image:
+        mode = "RGBA" if "A" in expected.getbands() else "RGB"
+        return image.size == expected.size and image.convert(mode).tobytes() == expected.convert(mode).tobytes()
+
+def run(root, cache_dir):
+    start = time.perf_counter()
+    urls, results = static_images.optimize_static_images(root, cache_dir)
+    return urls, results, time.perf_counter() - start
+
+def verify():
+    workdir = tempfile.mkdtemp(prefix="verify_static_images_")
+    try:
+        root = os.path.join(workdir, "site")
+        cache_dir = os.path.join(workdir, "cache")
+        shutil.copytree(os.path.join(REPO_ROOT, build_site.ASSET_DIR), os.path.join(root, build_site.ASSET_DIR))
+        shutil.copy(os.path.join(REPO_ROOT, static_images.MANIFEST_FILE), root)
+        ok = True
+
+        urls, results, cold = run(root, cache_dir)
+        static_images.report(results)
+        lossless = True
+        for source, variants in static_images.VARIANTS.items():
+            png_sizes = {}
+            for purpose, size, ext in variants:
+                name = static_images.variant_name(source, purpose, ext)
+                if name not in urls: continue
+                path = os.path.join(root, urls[name])
+                if ext == "png":
+                    lossless &= same_pixels(path, expected_image(root, source, size))
+                    png_sizes[purpose] = os.path.getsize(path)
+                else:
+                    lossless &= os.path.getsize(path) < png_sizes[purpose]
+        ok &= check("PNG variants are lossless at their size, WebP/AVIF smaller than PNG", lossless)
+        with open(os.path.join(root, urls[static_images.MANIFEST_FILE]), "r", encoding="utf-8") as f:
+            icons = json.load(f)["icons"]
+        with open(os.path.join(REPO_ROOT, "sw.js"), "r", encoding="utf-8") as f:
+            service_worker = f.read()
+        ok &= check("manifest stays at /manifest.json (sw.js precache) with icons pointing at existing files",
+                    urls[static_images.MANIFEST_FILE] == static_images.MANIFEST_FILE
+                    and f"'/{static_images.MANIFEST_FILE}'" in service_worker
+                    and all(icon["src"].startswith(static_images.STATIC_IMAGE_DIR + "/")
+                            and os.path.exists(os.path.join(root, icon["src"])) for icon in icons)
+                    and not any(name.startswith("manifest") for name in os.listdir(os.path.join(root, static_images.STATIC_IMAGE_DIR))))
+
+        again, results, warm = run(root, cache_dir)
+        ok &= check("second run is fully cached", again == urls and all(r["cached"] for r in results),
+                    f"cold {cold:.2f}s -> warm {warm:.3f}s")
+        # 원본 하나(favicon)만 바뀜
+        from PIL import Image
+        favicon = os.path.join(root, static_images.SOURCE_DIR, "favicon.png")
+        with Image.open(favicon) as image:
+            image = image.copy()
+        image.paste((0, 0, 0), (0, 0, 256, 256))
+        image.save(favicon)
+        changed, results, _ = run(root, cache_dir)
+        rebuilt = {r["source"] for r in results if not r["cached"]}
+        published = set(os.listdir(os.path.join(root, static_images.STATIC_IMAGE_DIR)))
+        ok &= check("changing one source re-renders only it and removes its old files",
+                    rebuilt == {"favicon.png"} and os.path.basename(urls["favicon-icon-32.png"]) not in published
+                    and {os.path.basename(url) for name, url in changed.items() if name != static_images.MANIFEST_FILE} == published)
+
+        # 페이지/카드: 만든 URL 사용
+        catalog = build_site.Catalog(list(make_catalog(400).items())[:200])
+        for n, product in enumerate(catalog.values()):
+            if n % 3 == 0: product.image = ""
+            elif n % 3 == 1: product.image = build_site.CARD_PLACEHOLDER_IMAGE
+        build_site.STATIC_IMAGE_URLS.update(changed)
+        try:
+            filename = os.path.join(root, "index.html")
+            with contextlib.redirect_stdout(io.StringIO()):
+                build_site.generate_report(catalog, build_site.SITES, filename=filename)
+            with open(filename, "r", encoding="utf-8") as f:
+                page = f.read()
+            referenced = set(re.findall(r'assets/img/[\w.-]+', page))
+            ok &= check("index.html uses sized icons, manifest and OG image; no original PNGs",
+                        not re.search(r'assets/(favicon|og_image|logo_placeholder)\.png', page)
+                        and 'sizes="32x32"' in page and 'rel="apple-touch-icon"' in page
+                        and all(os.path.exists(os.path.join(root, path)) for path in referenced),
+                        f"{len(referenced)} files referenced")
+            items = build_site.default_card_order(catalog)[:60]
+            python_cards = [build_site.create_product_card_html(p.key, p, build_site.SITE_NAME_MAP, build_site.SEARCH_URLS)
+                            for p in items]
+            ok &= check("cards without an image use the AVIF/WebP placeholder <picture>",
+                        all(('<source type="image/avif"' in card) == (p.image in ("", build_site.CARD_PLACEHOLDER_IMAGE))
+                            for p, card in zip(items, python_cards)))
+            js_cards = node_cards(os.path.join(root, build_site.SHARD_DIR, build_site.SHARD_CATALOG_FILE),
+                                  list(range(len(items))))
+            if js_cards is not None:
+                same = [" ".join(a.split()) == " ".join(b.split()) for a, b in zip(python_cards, js_cards)]
+                ok &= check("assets/catalog.js cardHtml matches create_product_card_html", all(same),
+                            f"{sum(same)}/{len(same)} cards")
+        finally:
+            build_site.STATIC_IMAGE_URLS.clear()
+        return ok
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+if __name__ == "__main__":
+    if static_images.Image is None:
+        print("[SKIP] Pillow not installed")
+        sys.exit(0)
+    sys.exit(0 if verify() else 1)
@@ -0,0 +1,231 @@
+"""
+썸네일 단계(thumbnails.py) 검증 + 시간 측정 (네트워크 없이 로컬 이미지 폴더 사용)
+Pillow로 만든 이미지 폴더를 DirectoryFetcher로 읽어 합성 카탈로그에 apply_thumbnails를 돌리고 다음을 확인합니다.
+- 이미지가 있는 상품은 썸네일 id가 생기고, 크기/형식별 파일(thumbs/)이 THUMB_SIZES 안에 들어옴
+- 같은 내용의 이미지는 URL이 달라도 한 번만 만듦, 깨진/없는 이미지는 원래 URL 그대로
+- 자리표시(색 격자): 썸네일이 있는 상품마다 27자, 단색 이미지는 그 색, NumPy 없이 계산해도 단색은 같은 값
+- 두 번째 실행: 받기/만들기/자리표시 계산 0건, 실패한 URL도 하루 안에는 다시 받지 않음
+- 이미지가 바뀌거나 상품이 빠지면 그 부분만 다시 만들고 안 쓰는 파일은 지움
+- 카드 HTML: <picture> + srcset, 자리표시 --lqip, assets/catalog.js cardHtml과 같은 마크업 (node 있을 때)
+
+사용법 (저장소 루트에서 실행):
+    python tools/verify_thumbnails.py                   # 이미지 80장, 상품 1000개
+    python tools/verify_thumbnails.py --images 300 --workers 1,8
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, '.')
+sys.path.insert(0, 'tools')
+import build_site
+import thumbnails
+from verify_report import make_catalog
+
+REPO_ROOT = os.path.abspath('.')
+DAY = 24 * 3600
+
+# node에서 실행: argv = [catalog.js 경로, catalog.json 경로, 행 번호 JSON] -> 행별 cardHtml
+NODE_CARDS = r"""
+const fs = require('fs');
+const { CatalogData } = require(process.argv[1]);
+const data = new CatalogData(JSON.parse(fs.readFileSync(process.argv[2], 'utf8')));
+process.stdout.write(JSON.stringify(JSON.parse(process.argv[3]).map(i => data.cardHtml(i))));
+"""
+
+class CountingFetcher(thumbnails.DirectoryFetcher):
+    def __init__(self, directory):
+        super().__init__(directory)
+        self.calls = 0
+
+    def fetch(self, url):
+        self.calls += 1
+        return super().fetch(url)
+
+def make_fixtures(directory, count):
+    """여러 크기/모드의 이미지 + 같은 내용 복사본 + 깨진 파일. 반환: 파일 이름 목록"""
+    from PIL import Image
+    names = []
+    for n in range(count):
+        width, height = (1000 + n * 7 % 600, 800 + n * 13 % 500) if n % 5 else (150, 150)
+        mode = ("RGB", "RGBA", "L", "P")[n % 4]
+        image = Image.effect_noise((width, height), 40 + n % 50).convert("RGB")
+        image = Image.blend(image, Image.new("RGB", image.size, (n * 37 % 256, n * 91 % 256, 200)), 0.6)
+        if mode == "RGBA":
+            image = image.convert("RGBA")
+            image.putalpha(Image.linear_gradient("L").resize(image.size))
+        elif mode != "RGB":
+            image = image.convert(mode)
+        name = f"img{n}.{'png' if mode in ('RGBA', 'P') else 'jpg'}"
+        image.save(os.path.join(directory, name))
+        names.append(name)
+    shutil.copy(os.path.join(directory, names[1]), os.path.join(directory, "copy_of_img1.jpg"))
+    with open(os.path.join(directory, "broken.jpg"), "wb") as f:
+        f.write(b"<html>404 Not Found</html>")
+    return names + ["copy_of_img1.jpg", "broken.jpg", "missing.jpg"]
+
+def image_url(n, name):
+    return f"https://cdn{n % 9}.example.com/web/product/{name}"
+
+def run(catalog, cache_dir, out_dir, fetcher, now, workers=thumbnails.THUMB_WORKERS):
+    store = thumbnails.ThumbnailStore(cache_dir)
+    original_update = store.update
+    store.update = lambda urls, fetcher=None: original_update(urls, fetcher=fetcher, workers=workers, now=now)
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        build_site.apply_thumbnails(catalog, out_dir=out_dir, fetcher=fetcher, store=store)
+    return store, time.perf_counter() - start
+
+def check(label, ok, detail=""):
+    print(f"[{'PASS' if ok else 'FAIL'}] {label}" + (f" ({detail})" if detail else ""))
+    return ok
+
+def node_cards(catalog_path, rows):
+    if shutil.which("node") is None: return None
+    output = subprocess.check_output(["node", "-e", NODE_CARDS, os.path.join(REPO_ROOT, "assets", "catalog.js"),
+                                      catalog_path, json.dumps(rows)], text=True)
+    return json.loads(output)
+
+def check_placeholder_values():
+    """단색/반반 이미지의 자리표시 값, NumPy 유무에 따른 값과 계산 시간"""
+    from PIL import Image
+    def encoded(image, kind="PNG"):
+        buffer = io.BytesIO()
+        image.save(buffer, kind)
+        return buffer.getvalue()
+    solid = encoded(Image.new("RGB", (640, 480), (255, 0, 51)))
+    half = Image.new("RGBA", (600, 600), (0, 0, 0, 0))
+    half.paste((0, 0, 255, 255), (0, 0, 600, 200))
+    photo = encoded(Image.effect_noise((1000, 1000), 60).convert("RGB"), "JPEG")
+    ok = check("solid color image -> that color in every cell", thumbnails.image_placeholder(solid) == "f03" * 9)
+    ok &= check("transparent area is flattened onto white",
+                thumbnails.image_placeholder(encoded(half)) == "00f" * 3 + "fff" * 6)
+    timings = {}
+    numpy = thumbnails.np
+    for label, module in (("numpy", numpy), ("pillow", None)):
+        if label == "numpy" and module is None: continue
+        thumbnails.np = module
+        start = time.perf_counter()
+        for _ in range(20): value = thumbnails.image_placeholder(photo)
+        timings[label] = ((time.perf_counter() - start) / 20 * 1000, value, thumbnails.image_placeholder(solid))
+    thumbnails.np = numpy
+    if "numpy" in timings:
+        ok &= check("numpy and pillow fallback agree on solid images", timings["numpy"][2] == timings["pillow"][2])
+    print("[INFO] placeholder per 1000x1000 JPEG: " + ", ".join(f"{label} {ms:.2f}ms" for label, (ms, _, _) in timings.items()))
+    return ok
+
+def verify(image_count, products, workers_list):
+    from PIL import Image
+    workdir = tempfile.mkdtemp(prefix="verify_thumbnails_")
+    try:
+        fixture_dir = os.path.join(workdir, "fixtures")
+        out_dir = os.path.join(workdir, "site")
+        cache_dir = os.path.join(workdir, "cache")
+        os.makedirs(fixture_dir)
+        os.makedirs(out_dir)
+        names = make_fixtures(fixture_dir, image_count)
+        catalog = build_site.Catalog(list(make_catalog(products * 2).items())[:products])
+        for n, product in enumerate(catalog.values()):
+            product.image = image_url(n, names[n % len(names)])
+        now = 1700000000
+        ok = True
+
+        # 처음: 전부 받고 만듦 (작업 스레드 수별 시간)
+        for workers in workers_list:
+            shutil.rmtree(cache_dir, ignore_errors=True)
+            fetcher = CountingFetcher(fixture_dir)
+            store, seconds = run(catalog, cache_dir, out_dir, fetcher, now, workers)
+            print(f"[INFO] cold run, {workers:>2} workers: {seconds:.2f}s ({store.fetched} fetched, "
+                  f"{store.encoded} encoded, {store.failed} failed)")
+        urls = {p.image for p in catalog.values()}
+        broken = {p.image for p in catalog.values() if p.image.endswith(("broken.jpg", "missing.jpg"))}
+        ok &= check("every readable image got a thumbnail, broken/missing kept their URL",
+                    all(bool(p.thumb) == (p.image not in broken) for p in catalog.values()))
+        thumb_of = {p.image: p.thumb for p in catalog.values()}
+        same = thumb_of[image_url(1, names[1])] == next(t for u, t in thumb_of.items() if u.endswith("copy_of_img1.jpg"))
+        ok &= check("identical content under a different URL shares one thumbnail", same)
+        ok &= check("each URL fetched once", fetcher.calls == len(urls), f"{fetcher.calls} fetches, {len(urls)} urls")
+
+        thumb_ids = {p.thumb for p in catalog.values() if p.thumb}
+        published = set(os.listdir(os.path.join(out_dir, thumbnails.THUMB_DIR)))
+        expected = {name for thumb_id in thumb_ids for name in thumbnails.thumb_files(thumb_id)}
+        bounded = True
+        for name in expected:
+            with Image.open(os.path.join(out_dir, thumbnails.THUMB_DIR, name)) as image:
+                size = int(name.rsplit("-", 1)[1].split(".")[0])
+                bounded &= max(image.size) <= size and image.format in ("WEBP", "JPEG")
+        ok &= check("thumbs/ has exactly the WebP/JPEG files in use, within their sizes", published == expected and bounded,
+                    f"{len(thumb_ids)} images x {len(thumbnails.THUMB_SIZES)} sizes x {len(thumbnails.THUMB_FORMATS)} formats")
+        original_bytes = sum(os.path.getsize(os.path.join(fixture_dir, n)) for n in names if os.path.exists(os.path.join(fixture_dir, n)))
+        small_bytes = sum(os.path.getsize(os.path.join(out_dir, thumbnails.THUMB_DIR, name)) for name in expected
+                          if name.endswith(f"-{thumbnails.THUMB_SIZES[0]}.webp"))
+        placeholder_ok = all(len(p.placeholder) == 3 * thumbnails.PLACEHOLDER_GRID ** 2 if p.thumb else not p.placeholder
+                             for p in catalog.values())
+        ok &= check("every thumbnail has a placeholder", placeholder_ok)
+        ok &= check_placeholder_values()
+        print(f"[INFO] originals {original_bytes / 1e6:.1f}MB -> {thumbnails.THUMB_SIZES[0]}px WebP {small_bytes / 1e6:.2f}MB")
+
+        # 다시 실행: 받기/만들기 없음 (실패한 URL도 하루 안에는 그대로)
+        fetcher = CountingFetcher(fixture_dir)
+        store, seconds = run(catalog, cache_dir, out_dir, fetcher, now + 3600)
+        ok &= check("warm run fetches and encodes nothing",
+                    fetcher.calls == 0 and store.encoded == 0 and store.placeholders_computed == 0,
+                    f"{seconds:.2f}s, {store.reused} reused")
+        fetcher = CountingFetcher(fixture_dir)
+        store, _ = run(catalog, cache_dir, out_dir, fetcher, now + DAY + 1)
+        ok &= check("failed URLs are retried after a day", fetcher.calls == len(broken) and store.encoded == 0)
+
+        # 이미지 하나가 바뀌고 (새 URL) 상품 일부가 빠짐
+        products_list = list(catalog.values())
+        changed = products_list[0]
+        from PIL import ImageOps
+        with Image.open(os.path.join(fixture_dir, names[2])) as image:
+            ImageOps.mirror(image.convert("RGB")).save(os.path.join(fixture_dir, "changed.jpg"))
+        changed.image = image_url(0, "changed.jpg")
+        removed = [p for p in products_list if p.image.endswith(f"/{names[3]}")]
+        for product in removed: del catalog[product.key]
+        fetcher = CountingFetcher(fixture_dir)
+        store, _ = run(catalog, cache_dir, out_dir, fetcher, now + 2 * DAY + 2)
+        stale = set(thumbnails.thumb_files(thumb_of[removed[0].image])) if removed else set()
+        published = set(os.listdir(os.path.join(out_dir, thumbnails.THUMB_DIR)))
+        ok &= check("a changed image re-encodes only itself, removed images are pruned",
+                    store.encoded == 1 and store.placeholders_computed == 1 and not (stale & published)
+                    and changed.thumb not in thumb_ids,
+                    f"{fetcher.calls} fetched, {store.encoded} encoded, {len(removed)} products removed")
+
+        # 카드 마크업: 파이썬 카드와 catalog.js cardHtml이 같음
+        with contextlib.redirect_stdout(io.StringIO()):
+            build_site.generate_report(catalog, build_site.SITES, filename=os.path.join(out_dir, "index.html"))
+        items = build_site.default_card_order(catalog)
+        python_cards = [build_site.create_product_card_html(p.key, p, build_site.SITE_NAME_MAP, build_site.SEARCH_URLS)
+                        for p in items[:50]]
+        ok &= check("cards use <picture> with WebP/JPEG srcset and a placeholder",
+                    all(('<picture><source type="image/webp" srcset=' in card) == bool(p.thumb)
+                        and ('style="--lqip: linear-gradient(' in card) == bool(p.placeholder)
+                        for p, card in zip(items, python_cards)))
+        js_cards = node_cards(os.path.join(out_dir, build_site.SHARD_DIR, build_site.SHARD_CATALOG_FILE), list(range(50)))
+        if js_cards is not None:
+            same = [" ".join(a.split()) == " ".join(b.split()) for a, b in zip(python_cards, js_cards)]
+            ok &= check("assets/catalog.js cardHtml matches create_product_card_html", all(same),
+                        f"{sum(same)}/{len(same)} cards")
+        return ok
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--images", type=int, default=80, help="합성 이미지 수")
+    parser.add_argument("--products", type=int, default=1000, help="상품 수")
+    parser.add_argument("--workers", default=f"1,{thumbnails.THUMB_WORKERS}", help="처음 실행의 작업 스레드 수 (쉼표 구분)")
+    args = parser.parse_args()
+    if thumbnails.Image is None:
+        print("[SKIP] Pillow not installed")
+        sys.exit(0)
+    sys.exit(0 if verify(args.images, args.products, [int(n) for n in args.workers.split(",") if n]) else 1)
@@ -13,8 +13,9 @@ except ImportError:
 
 def test_case(name, expected, description):
     result = build_site.classify_category(name)
+    _, keyword = build_site.CATEGORY_CLASSIFIER.explain(name)
     status = "PASS" if result == expected else "FAIL"
-    print(f"[{status}] {description}: '{name}' -> Got '{result}', Expected '{expected}'")
+    print(f"[{status}] {description}: '{name}' -> Got '{result}' (keyword: {keyword}), Expected '{expected}'")
 
 print("--- Verifying Fix in build_site.py ---")
 